@@ -0,0 +1,101 @@
+"""
+AI 분석 단계 벤치마크 (완전 오프라인 - stub 제공자 사용, API 키/네트워크 불필요)
+
+사용법:
+  python benchmarks/bench_ai.py                               # 기본: 200건, 응답 0.2s, 오류 없음
+  python benchmarks/bench_ai.py --jobs 500 --latency 0.5 --error-rate 0.1 --malformed-rate 0.05
+  python benchmarks/bench_ai.py --in-flight 1,4,8 --no-batch   # 동시 요청 수별 비교, 묶음 요청 끔
+  python benchmarks/bench_ai.py --title-only-ratio 0.3        # 제목만 있는 공고 비율 (휴리스틱 경로)
+
+속도 제한(AI_RPM/AI_TPM)은 --rpm/--tpm으로 지정 (기본: 제한 없음 수준), 재시도 백오프는 --backoff
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.config import Config
+from src.logic.ai_agent import FAILURE_SUMMARY, AIAgent
+from src.logic.ai_providers import StubProvider
+from src.logic.condense import condense
+from src.logic.heuristics import HEURISTIC_SOURCE
+
+TITLES = ["데이터 분석가", "데이터 엔지니어", "머신러닝 엔지니어 (Python)", "회계 담당자", "재무 분석 (경력 3년 이상)",
+          "세무 회계 신입", "인사 총무", "HRD 담당자", "채용 담당자 인턴", "AI 연구원", "Data Scientist", "결산 담당"]
+SECTIONS = ["[주요업무]", "[자격요건]", "[우대사항]", "[복리후생]"]
+
+
+def synthetic_jobs(n, title_only_ratio, seed=7):
+    """(제목, 본문) 목록 - 본문 길이는 공고마다 다르게, 일부는 제목만 (main에서 본문을 받지 못한 경우)"""
+    rng = random.Random(seed)
+    jobs = []
+    for number in range(n):
+        title = f"{rng.choice(TITLES)} #{number}"
+        if rng.random() < title_only_ratio:
+            jobs.append((title, title))
+            continue
+        lines = []
+        for section in SECTIONS:
+            lines.append(section)
+            lines.extend(f"- {title} 관련 업무 설명 {line} " + "내용 " * rng.randint(5, 40) for line in range(rng.randint(2, 8)))
+        # 파이프라인과 같이 압축된 본문을 넘김 (main의 TextCondenser 단계, 에이전트는 다시 압축하지 않음)
+        jobs.append((title, condense("\n".join(lines))))
+    return jobs
+
+
+def run(jobs, in_flight, args):
+    provider = StubProvider(latency=args.latency, error_rate=args.error_rate,
+                            malformed_rate=args.malformed_rate, seed=args.seed)
+    # 에이전트 초기화/진행 로그가 측정 결과를 가리지 않도록 출력 숨김
+    with contextlib.redirect_stdout(io.StringIO()):
+        agent = AIAgent(provider)
+        started = time.perf_counter()
+        results = agent.analyze_many(jobs, max_in_flight=in_flight, timeout=args.timeout)
+        elapsed = time.perf_counter() - started
+
+    failed = sum(1 for analysis in results if analysis.get("summary") == FAILURE_SUMMARY)
+    heuristic = sum(1 for analysis in results if analysis.get("source") == HEURISTIC_SOURCE)
+    print(
+        f"{in_flight:>9} {len(jobs):>6} {provider.calls:>8} {heuristic:>9} {failed:>7} "
+        f"{elapsed:>8.2f} {len(jobs) / elapsed if elapsed else 0:>8.1f} {provider.prompt_chars // 1024:>9}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI analysis stage benchmark (offline stub provider)")
+    parser.add_argument("--jobs", type=int, default=200, help="합성 공고 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="stub 평균 응답 시간(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="stub 할당량 초과(429) 비율")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="stub 잘못된 JSON 응답 비율")
+    parser.add_argument("--title-only-ratio", type=float, default=0.0, help="제목만 있는 공고 비율")
+    parser.add_argument("--in-flight", default=str(Config.AI_MAX_IN_FLIGHT), help="쉼표로 구분한 동시 요청 수 목록")
+    parser.add_argument("--rpm", type=int, default=100000, help="분당 요청 수 한도")
+    parser.add_argument("--tpm", type=int, default=100000000, help="분당 토큰 수 한도")
+    parser.add_argument("--backoff", type=float, default=0.05, help="재시도 백오프 기본 대기(초)")
+    parser.add_argument("--timeout", type=float, default=Config.AI_JOB_TIMEOUT, help="요청 하나의 제한 시간(초)")
+    parser.add_argument("--no-batch", action="store_true", help="묶음 요청 끄기 (공고당 한 요청)")
+    parser.add_argument("--no-heuristic", action="store_true", help="제목만 있는 공고도 모델로 분석")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    Config.AI_RPM = args.rpm
+    Config.AI_TPM = args.tpm
+    Config.AI_BACKOFF_BASE = args.backoff
+    Config.AI_BATCH_ENABLED = not args.no_batch
+    Config.AI_HEURISTIC_TITLE_ONLY = not args.no_heuristic
+
+    jobs = synthetic_jobs(args.jobs, args.title_only_ratio, args.seed)
+    print(f"stub latency {args.latency}s, error rate {args.error_rate}, malformed rate {args.malformed_rate}, "
+          f"batch {'on' if Config.AI_BATCH_ENABLED else 'off'}, heuristic {'on' if Config.AI_HEURISTIC_TITLE_ONLY else 'off'}")
+    print(f"{'in-flight':>9} {'jobs':>6} {'requests':>8} {'heuristic':>9} {'failed':>7} {'seconds':>8} {'jobs/s':>8} {'prompt KiB':>9}")
+    for in_flight in (int(value) for value in args.in_flight.split(",") if value.strip()):
+        run(jobs, max(1, in_flight), args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+교차 중복 판정 벤치마크: 회사 블로킹 + SequenceMatcher (ratio > Config.DEDUP_SIMILARITY_RATIO)
+
+사용법:
+  python benchmarks/bench_dedup.py                 # docs/jobs.json 사용 (없으면 합성 데이터)
+  python benchmarks/bench_dedup.py --synthetic 20000
+  python benchmarks/bench_dedup.py --no-blocking   # 회사 블로킹 없이 전체 비교 (확장성 확인용)
+
+ratio()만 쓰는 전수 비교와 is_similar_title(비율 상한으로 먼저 거르는 판정)의 시간을 비교하고
+두 방식의 중복 쌍이 같은지 확인
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.config import Config
+from src.logic.dedup import canonical_company, is_similar_title, normalize_title
+
+ROLES = ["데이터 분석가", "데이터 엔지니어", "머신러닝 엔지니어", "회계 담당자", "재무 분석", "세무 회계",
+         "인사 총무", "HRD 담당자", "채용 담당자", "AI 연구원", "Data Scientist", "결산 담당"]
+PREFIXES = ["", "[서울] ", "[판교] ", "2025 하반기 ", "(신입) ", "[채용연계형] "]
+SUFFIXES = ["", " 채용", " 신입 채용", " 모집", " (채용시 마감)", " 정규직", " 인턴"]
+
+
+def synthetic_jobs(n, seed=7):
+    """같은 공고가 사이트마다 조금씩 다른 제목으로 올라오는 상황을 흉내낸 합성 데이터"""
+    rng = random.Random(seed)
+    jobs = []
+    companies = [f"테스트기업{i}" for i in range(max(1, n // 8))]
+    while len(jobs) < n:
+        company = rng.choice(companies)
+        role = rng.choice(ROLES)
+        team = rng.choice(["", " 팀", " 본부", " 파트"])
+        base = f"{role}{team}"
+        for _ in range(rng.randint(1, 3)):  # 교차 게시 1~3건
+            jobs.append({
+                "company": rng.choice([company, f"㈜{company}", f"{company}(주)"]),
+                "title": f"{rng.choice(PREFIXES)}{base}{rng.choice(SUFFIXES)}"
+            })
+    return jobs[:n]
+
+
+def load_jobs(args):
+    if args.synthetic:
+        return synthetic_jobs(args.synthetic)
+    if os.path.exists(Config.DATA_FILE):
+        with open(Config.DATA_FILE, "r", encoding="utf-8") as f:
+            jobs = json.load(f)
+        if len(jobs) >= 50:
+            return jobs[:args.limit]
+    return synthetic_jobs(args.limit)
+
+
+def compare_pairs(items, is_similar):
+    """같은 회사(블록) 안에서 앞선 제목들과 비교한 중복 쌍 집합과 소요 시간"""
+    blocks = {}
+    pairs = set()
+    started = time.perf_counter()
+    for i, (company, title) in enumerate(items):
+        for j in blocks.get(company, ()):
+            if is_similar(title, items[j][1]):
+                pairs.add((i, j))
+        blocks.setdefault(company, []).append(i)
+    return pairs, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blocked SequenceMatcher dedup benchmark")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 데이터 개수 (지정 시 jobs.json 대신 사용)")
+    parser.add_argument("--limit", type=int, default=3000, help="jobs.json에서 사용할 최대 공고 수")
+    parser.add_argument("--no-blocking", action="store_true", help="회사 블로킹 없이 전체 비교")
+    args = parser.parse_args()
+
+    jobs = load_jobs(args)
+    items = []
+    for job in jobs:
+        company = "" if args.no_blocking else canonical_company(job.get("company", ""))
+        title = normalize_title(job.get("title", ""))
+        if len(title) >= 5:  # 짧은 제목은 유사도 비교 제외 (is_similar_title과 동일)
+            items.append((company, title))
+    ratio = Config.DEDUP_SIMILARITY_RATIO
+    print(f"{len(items)} titles, ratio > {ratio}, blocking={'off' if args.no_blocking else 'on'}")
+
+    # 1) ratio()만 사용하는 전수 비교 (기준)
+    truth, baseline_sec = compare_pairs(items, lambda a, b: SequenceMatcher(None, a, b).ratio() > ratio)
+    # 2) 파이프라인 판정 (real_quick_ratio / quick_ratio 상한으로 먼저 거름)
+    predicted, filtered_sec = compare_pairs(items, is_similar_title)
+
+    print(f"{'method':<16} {'pairs':>7} {'sec':>8} {'titles/s':>10}")
+    for name, pairs, sec in (("ratio only", truth, baseline_sec), ("is_similar_title", predicted, filtered_sec)):
+        print(f"{name:<16} {len(pairs):>7} {sec:>8.3f} {len(items) / sec if sec else 0:>10.0f}")
+    print(f"same pairs: {truth == predicted}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+스크래퍼 파싱 성능 벤치마크 (완전 오프라인)
+
+사용법:
+  1) 응답 기록 (네트워크 필요, 최초 1회)
+     python benchmarks/bench_scrapers.py --record
+  2) 벤치마크 (기록된 응답만 사용, 네트워크/속도 제한 없음)
+     python benchmarks/bench_scrapers.py --repeat 3 --sites Saramin,Wanted
+
+픽스처 위치는 SCRAPER_FIXTURE_DIR 환경변수로 변경 가능 (기본: benchmarks/fixtures)
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.config import Config
+from src.scraper.fixtures import get_fixture_store
+from src.scraper.saramin import SaraminScraper
+from src.scraper.jobkorea import JobKoreaScraper
+from src.scraper.incruit import IncruitScraper
+from src.scraper.wanted import WantedScraper
+from src.scraper.linkareer import LinkareerScraper
+from src.scraper.jasoseol import JasoseolScraper
+
+SCRAPERS = {
+    "Saramin": SaraminScraper,
+    "JobKorea": JobKoreaScraper,
+    "Incruit": IncruitScraper,
+    "Wanted": WantedScraper,
+    "Linkareer": LinkareerScraper,
+    "Jasoseol": JasoseolScraper
+}
+
+
+def _keywords():
+    targets = []
+    for keywords in Config.KEYWORDS.values():
+        targets.extend(keywords)
+    return sorted(set(targets))
+
+
+def _run_quiet(scraper, keywords):
+    # 스크래퍼 진행 로그가 측정 결과를 가리지 않도록 출력 숨김
+    with contextlib.redirect_stdout(io.StringIO()):
+        return scraper.search(keywords)
+
+
+def record(sites, keywords):
+    Config.HTTP_MODE = "record"
+    store = get_fixture_store()
+    for site in sites:
+        before = store.recorded
+        jobs = _run_quiet(SCRAPERS[site](), keywords)
+        print(f"  {site}: {store.recorded - before}개 응답 기록, {len(jobs)}개 공고")
+    print(f"✅ Fixtures saved to {store.fixture_dir}")
+
+
+def bench(sites, keywords, repeat):
+    Config.HTTP_MODE = "replay"
+    store = get_fixture_store()
+
+    print(f"{'site':<10} {'pages':>6} {'items':>6} {'items/s':>10} {'ms/page':>9} {'peak MiB':>9}")
+    for site in sites:
+        scraper = SCRAPERS[site]()
+
+        # 1) 시간 측정 (tracemalloc 오버헤드 없이)
+        elapsed = 0.0
+        pages = items = 0
+        for _ in range(repeat):
+            served = store.served
+            started = time.perf_counter()
+            jobs = _run_quiet(scraper, keywords)
+            elapsed += time.perf_counter() - started
+            pages += store.served - served
+            items += len(jobs)
+
+        if pages == 0:
+            print(f"{site:<10} {'-':>6}  (기록된 픽스처 없음 - --record 먼저 실행)")
+            continue
+
+        # 2) 최대 메모리 측정 (별도 1회 실행)
+        tracemalloc.start()
+        _run_quiet(scraper, keywords)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(
+            f"{site:<10} {pages // repeat:>6} {items // repeat:>6} "
+            f"{items / elapsed if elapsed else 0:>10.1f} {elapsed * 1000 / pages:>9.2f} "
+            f"{peak / (1024 * 1024):>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper parse-throughput benchmark")
+    parser.add_argument("--record", action="store_true", help="실제 사이트 응답을 픽스처로 기록")
+    parser.add_argument("--repeat", type=int, default=3, help="사이트별 반복 측정 횟수")
+    parser.add_argument("--sites", default=",".join(SCRAPERS), help="쉼표로 구분한 사이트 목록")
+    args = parser.parse_args()
+
+    sites = [s.strip() for s in args.sites.split(",") if s.strip() in SCRAPERS]
+    keywords = _keywords()
+
+    if args.record:
+        record(sites, keywords)
+    else:
+        bench(sites, keywords, max(1, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
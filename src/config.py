@@ -21,5 +21,137 @@ class Config:
         "All": os.getenv("GMAIL_TO")                  # 전체 공고 받을 사람 (기존 호환)
     }
     
+    # Scraping 동시성 설정
+    # SCRAPE_CONCURRENT=0 이면 기존처럼 사이트를 하나씩 순차 실행
+    SCRAPE_CONCURRENT = os.getenv("SCRAPE_CONCURRENT", "1") != "0"
+    # 사이트별 동시 키워드 요청 수 상한 (사이트 간에는 모두 병렬)
+    SITE_CONCURRENCY = {
+        "Saramin": 2,
+        "JobKorea": 2,
+        "Linkareer": 1,
+        "Incruit": 2,
+        "Wanted": 3,
+        "Jasoseol": 2
+    }
+    
+    # 키워드당 목록 페이지 예산 (최신순으로 순회하다 이미 저장된 공고만 나오는 페이지에서 중단)
+    # 신규 공고가 많은 날에만 예산까지 요청하고, 평소에는 1~2페이지에서 멈춤
+    PAGE_BUDGET = {
+        "Saramin": 5,
+        "JobKorea": 3,
+        "Incruit": 3,
+        "Wanted": 5,
+        "Linkareer": 5,
+        "default": 1
+    }
+    
+    # 질의 계획: 과거 결과가 같은 카테고리의 다른 키워드 결과에 거의 포함되는 키워드는 요청 생략
+    QUERY_PLANNER_ENABLED = os.getenv("QUERY_PLANNER", "1") != "0"
+    PLANNER_MIN_CONTAINMENT = 0.9   # A 결과 중 B 결과에도 있는 비율이 이 이상이면 A ⊆ B
+    PLANNER_MIN_RUNS = 2            # A, B를 함께 요청한 실행이 이 횟수 이상일 때만 판단
+    PLANNER_MIN_RESULTS = 5         # 판단에 필요한 A의 최소 결과 수 (결과가 적은 키워드는 항상 요청)
+    PLANNER_VERIFY_DAYS = 7         # 이 주기마다 전체 키워드를 요청해 포함 관계 재학습
+    PLANNER_WINDOW_DAYS = 28        # 학습에 사용하는 최근 기록 기간
+    
+    # 호스트별 요청 속도 제한 (초당 요청 수 / 버스트 / 대기 시 추가 지터(초))
+    # 예산을 초과했을 때만 대기하므로 느린 요청 뒤에 불필요한 sleep이 붙지 않음
+    RATE_LIMITS = {
+        "www.saramin.co.kr": {"rps": 0.7, "burst": 2, "jitter": 0.5},
+        "www.jobkorea.co.kr": {"rps": 0.5, "burst": 2, "jitter": 0.5},
+        "job.incruit.com": {"rps": 0.8, "burst": 2, "jitter": 0.3},
+        "www.wanted.co.kr": {"rps": 1.0, "burst": 3, "jitter": 0.3},
+        "api.linkareer.com": {"rps": 1.0, "burst": 2, "jitter": 0.3},
+        "linkareer.com": {"rps": 1.0, "burst": 2, "jitter": 0.3},
+        "jasoseol.com": {"rps": 1.0, "burst": 2, "jitter": 0.3},
+        "default": {"rps": 1.0, "burst": 1, "jitter": 0.5}
+    }
+    
+    # HTTP 전송 계층 (src/scraper/transport.py)
+    HTTP_CONNECT_TIMEOUT = 5    # 연결 타임아웃(초)
+    HTTP_READ_TIMEOUT = 15      # 읽기 타임아웃(초)
+    HTTP_MAX_RETRIES = 3        # 429/5xx/연결 오류 시 재시도 횟수
+    HTTP_BACKOFF_BASE = 1.0     # 지수 백오프 기본 대기(초): 1, 2, 4...
+    HTTP_MAX_BACKOFF = 30       # 재시도 1회당 최대 대기(초, Retry-After 포함)
+    HTTP_POOL_SIZE = 4          # 호스트별 keep-alive 연결 수
+    
+    # 목록 페이지 디스크 응답 캐시 (재시도/당일 재실행 시 네트워크 전송 절약)
+    HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE", "1") != "0"
+    HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", ".cache/http")
+    HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+    # 호스트별 TTL(초) - TTL 안에서는 요청 없이 재사용, 지나면 ETag/Last-Modified로 재검증
+    HTTP_CACHE_TTL = {
+        "www.saramin.co.kr": 6 * 3600,
+        "www.jobkorea.co.kr": 6 * 3600,
+        "job.incruit.com": 6 * 3600,
+        "www.wanted.co.kr": 3 * 3600,
+        "api.linkareer.com": 6 * 3600,
+        "linkareer.com": 6 * 3600,
+        "jasoseol.com": 6 * 3600,
+        "default": 3600
+    }
+    
+    # 폴백 스크래퍼의 마지막 성공 셀렉터/전략 (다음 실행에서 먼저 시도)
+    STRATEGY_CACHE_FILE = os.getenv("STRATEGY_CACHE_FILE", ".cache/strategies.json")
+    
+    # 공고 상세 본문 캐시 (압축, 내용 주소 방식 - 공고당 한 번만 요청)
+    BODY_CACHE_DIR = os.getenv("BODY_CACHE_DIR", ".cache/bodies")
+    BODY_CACHE_TTL_DAYS = 60                    # 마지막 사용 후 이 기간이 지난 본문 삭제 (대부분 마감된 공고)
+    BODY_CACHE_MAX_BYTES = 100 * 1024 * 1024    # 전체 크기가 넘으면 가장 오래 사용하지 않은 공고부터 삭제
+    
+    # HTML 파서 백엔드 (auto: lxml 설치 시 lxml, 아니면 html.parser)
+    HTML_PARSER = os.getenv("HTML_PARSER", "auto")
+    # 사이트별 선언 charset (None이면 문서의 <meta charset> 사용)
+    SITE_CHARSETS = {
+        "Saramin": "utf-8",
+        "JobKorea": "utf-8",
+        "Incruit": None,
+        "Linkareer": "utf-8",
+        "Jasoseol": "utf-8"
+    }
+    
+    # 응답 기록/재생 모드 (live | record | replay)
+    # record: 실제 응답을 FIXTURE_DIR에 저장, replay: 저장된 응답만 사용 (완전 오프라인)
+    HTTP_MODE = os.getenv("SCRAPER_MODE", "live")
+    FIXTURE_DIR = os.getenv("SCRAPER_FIXTURE_DIR", "benchmarks/fixtures")
+    
+    # 교차 중복 판정 - 같은 회사 공고 제목의 SequenceMatcher 비율이 이 값보다 크면 중복
+    DEDUP_SIMILARITY_RATIO = 0.7
+    FILTER_BATCH_SIZE = 500 # 수집 스트림을 이 개수씩 모아 store 조회/중복 판정
+    STREAM_QUEUE_SIZE = 200 # 사이트 동시 수집 시 소비 대기 중인 공고 수 상한 (넘으면 수집 스레드 대기)
+    SEEN_IDS_TTL_DAYS = 90  # 교차 중복으로 걸러진 공고 id 보관 기간 (페이지 순회 중단 판단용)
+    DEADLINE_BUCKET_DAYS = 7 # 마감 임박 분류 범위 (D-day ~ D-N)
+    
+    # AI 분석 제공자: gemini(기본) | stub(오프라인 대체, 분석 단계 부하 테스트용) | none(비활성)
+    AI_PROVIDER = os.getenv("AI_PROVIDER", "gemini").lower()
+    AI_MODEL = os.getenv("AI_MODEL", "gemini-2.0-flash")
+    AI_STUB_LATENCY = float(os.getenv("AI_STUB_LATENCY", "1.0"))           # stub 평균 응답 시간(초)
+    AI_STUB_ERROR_RATE = float(os.getenv("AI_STUB_ERROR_RATE", "0"))       # stub 할당량 초과(429) 비율
+    AI_STUB_MALFORMED_RATE = float(os.getenv("AI_STUB_MALFORMED_RATE", "0"))  # stub 잘못된 JSON 응답 비율
+    # 본문 없이 제목만 있는 공고는 모델 호출 없이 키워드/역량 사전으로 분석
+    AI_HEURISTIC_TITLE_ONLY = os.getenv("AI_HEURISTIC", "1") != "0"
+
+    # AI 분석 (Gemini) - 동시 요청 수 / 분당 요청·토큰 한도 / 재시도 / 공고당 제한 시간
+    AI_MAX_IN_FLIGHT = int(os.getenv("AI_MAX_IN_FLIGHT", "4"))
+    AI_RPM = int(os.getenv("AI_RPM", "15"))             # 분당 요청 수 (무료 등급 기준)
+    AI_TPM = int(os.getenv("AI_TPM", "1000000"))        # 분당 토큰 수
+    AI_OUTPUT_TOKENS = 512      # 응답 토큰 추정치 (토큰 예산 계산용)
+    AI_MAX_RETRIES = 3          # 할당량 초과(429)/일시 오류 시 재시도 횟수
+    AI_BACKOFF_BASE = 2.0       # 지수 백오프 기본 대기(초): 2, 4, 8...
+    AI_JOB_TIMEOUT = 60         # 요청 하나(묶음 요청 포함)의 분석 제한 시간(초, 재시도 포함)
+    # 여러 공고를 한 요청에 묶어 분석 (공통 지시문을 한 번만 전송) - 묶음 크기는 토큰 예산으로 결정
+    AI_BATCH_ENABLED = os.getenv("AI_BATCH", "1") != "0"
+    AI_BATCH_TOKEN_BUDGET = 8000        # 요청 하나의 공고 입력 토큰 합 상한
+    AI_BATCH_MAX_OUTPUT_TOKENS = 8000   # 요청 하나의 응답 토큰 추정치 상한 (공고 수 상한 = 이 값 / AI_OUTPUT_TOKENS)
+    # AI 입력 본문 압축 - 상용구/중복 줄 제거 후 자격요건·주요업무·우대사항 우선으로 토큰 예산까지
+    AI_TEXT_TOKEN_BUDGET = int(os.getenv("AI_TEXT_TOKEN_BUDGET", "1200"))
+    AI_BOILERPLATE_MIN_DOCS = 20    # 사이트별로 이만큼 본문을 학습한 뒤부터 상용구 제거
+    AI_BOILERPLATE_RATIO = 0.3      # 학습한 본문의 이 비율 이상에 나오는 줄은 상용구
+    AI_BOILERPLATE_MAX_DOCS = 2000  # 학습 공고 수가 이 값을 넘으면 누적값을 절반으로 (최근 본문 위주)
+    AI_CACHE_TTL_DAYS = 60      # 분석 캐시 보관 기간 (같은 내용의 공고는 이 기간 동안 재분석 없음)
+    AI_CACHE_MAX_ENTRIES = 20000  # 분석 캐시 최대 항목 수 (초과 시 오래 사용하지 않은 것부터 삭제)
+    
     # Paths
     DATA_FILE = "docs/jobs.json"
+    SHARD_DIR = "docs/shards"               # 카테고리/플랫폼별 shard (내용 해시 파일명)
+    MANIFEST_FILE = "docs/manifest.json"    # shard 목록 (페이지가 가장 먼저 요청)
+    DB_FILE = os.getenv("JOB_STORE_DB", "data/jobs.db")  # SQLite job store (Actions 캐시로 보존)
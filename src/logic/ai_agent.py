@@ -1,35 +1,239 @@
-import google.generativeai as genai
-import os
 import json
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from src.config import Config
+from src.logic.ai_providers import create_provider
+from src.logic.condense import estimate_tokens
+from src.logic.heuristics import HEURISTIC_SOURCE, analyze_title
+from src.scraper.rate_limiter import TokenBucket
+
+# 프롬프트/응답 형식을 바꾸면 올림 (분석 캐시 키에 포함 → 이전 버전 분석은 재사용하지 않음)
+PROMPT_VERSION = 1
+
+FAILURE_SUMMARY = "분석 실패"
+UNAVAILABLE_SUMMARY = "AI API Key missing or no text."
+
+# 할당량 초과 / 일시적 서버 오류 (google.api_core.exceptions 클래스 이름 기준)
+RETRYABLE_ERRORS = ("ResourceExhausted", "TooManyRequests", "ServiceUnavailable", "InternalServerError", "DeadlineExceeded")
+
+
+def plan_batches(indices, tokens, token_budget=None, max_output_tokens=None):
+    """
+    공고를 순서대로 요청 단위로 묶음 (tokens: 공고별 입력 토큰 추정치)
+    - 묶음의 입력 토큰 합이 token_budget(AI_BATCH_TOKEN_BUDGET) 이하
+    - 응답 토큰 추정치(공고당 AI_OUTPUT_TOKENS)가 max_output_tokens(AI_BATCH_MAX_OUTPUT_TOKENS) 이하
+    본문이 짧은 날은 한 요청에 많이, 긴 공고는 적게 (예산보다 큰 공고는 단독 요청)
+    """
+    token_budget = token_budget or Config.AI_BATCH_TOKEN_BUDGET
+    max_jobs = max(1, (max_output_tokens or Config.AI_BATCH_MAX_OUTPUT_TOKENS) // Config.AI_OUTPUT_TOKENS)
+    batches = []
+    batch, used = [], 0
+    for index, cost in zip(indices, tokens):
+        if batch and (used + cost > token_budget or len(batch) >= max_jobs):
+            batches.append(batch)
+            batch, used = [], 0
+        batch.append(index)
+        used += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def is_cacheable(analysis):
+    """실제 모델 응답만 캐시 (실패/비활성 결과, 호출 없이 만든 휴리스틱 결과는 다음 실행에서 다시 분석)"""
+    return (isinstance(analysis, dict)
+            and analysis.get("summary") not in (FAILURE_SUMMARY, UNAVAILABLE_SUMMARY)
+            and analysis.get("source") != HEURISTIC_SOURCE)
+
+
+def is_title_only(job_title, job_text):
+    """본문 없이 제목만 분석하는 공고 (상세 본문을 받지 못하면 main에서 제목을 본문 대신 넘김)"""
+    return not (job_text or "").strip() or (job_text or "").strip() == (job_title or "").strip()
+
+
+def _is_retryable(error):
+    message = str(error).lower()
+    return type(error).__name__ in RETRYABLE_ERRORS or "429" in message or "quota" in message
+
 
 class AIAgent:
-    def __init__(self):
-        api_key = Config.GEMINI_API_KEY
-        
+    """
+    공고 분석 에이전트 - 모델 호출은 provider.generate(prompt, timeout) → 응답 텍스트 (ai_providers 참고)
+    provider를 주지 않으면 Config.AI_PROVIDER로 생성 (None이면 AI 분석 비활성)
+    """
+
+    def __init__(self, provider=None):
         print("\n" + "="*50)
-        print("🤖 [AI DEBUG] Gemini API 상태 체크")
+        print("🤖 [AI DEBUG] AI 제공자 상태 체크")
         print("="*50)
-        print(f"  GEMINI_API_KEY: {'✅ 설정됨 (' + api_key[:8] + '...)' if api_key else '❌ 없음'}")
-        
-        if api_key:
-            try:
-                genai.configure(api_key=api_key)
-                # gemini-2.0-flash 사용 (최신 안정 버전)
-                self.model = genai.GenerativeModel('gemini-2.0-flash')
-                print("  모델: ✅ gemini-2.0-flash 로드 완료")
-            except Exception as e:
-                print(f"  모델 로드 실패: ❌ {e}")
-                self.model = None
-        else:
-            self.model = None
-            print("  ⚠️ API 키가 없어서 AI 기능이 비활성화됩니다.")
+        self.provider = provider if provider is not None else create_provider()
+        if Config.AI_HEURISTIC_TITLE_ONLY:
+            print("  제목만 있는 공고: ⚡ 키워드/역량 사전으로 분석 (모델 호출 없음)")
         print("="*50 + "\n")
 
-    def analyze_job(self, job_title, job_text):
-        if not self.model or not job_text:
+        # 분당 요청 수 / 토큰 수 한도 (동시 요청 간 공유)
+        self.request_bucket = TokenBucket(Config.AI_RPM / 60, burst=Config.AI_MAX_IN_FLIGHT)
+        self.token_bucket = TokenBucket(Config.AI_TPM / 60, burst=Config.AI_TPM)
+
+    def analyze_many(self, jobs, max_in_flight=None, timeout=None):
+        """
+        여러 공고 동시 분석 - jobs: (제목, 본문) 목록 → 분석 결과 목록 (입력 순서 유지)
+        - 본문은 이미 압축된 텍스트 (main에서 TextCondenser로 한 번 압축, 여기서는 다시 압축하지 않음)
+        - 토큰 예산에 맞춰 여러 공고를 한 요청에 묶음 (AI_BATCH_ENABLED, plan_batches 참고)
+        - 동시 요청은 max_in_flight(기본 Config.AI_MAX_IN_FLIGHT)개까지
+        - 분당 요청/토큰 한도를 넘지 않도록 대기, 할당량 초과 시 백오프 후 재시도
+        - 요청 하나가 timeout(초)을 넘기면 기다리지 않고 해당 공고들을 실패 결과로 대체
+          남은 시간은 provider 호출 제한 시간으로도 전달 → 응답 없는 호출도 제한 시간에 끝나 종료 시 스레드를 기다리지 않음
+        """
+        results = [None] * len(jobs)
+        if not jobs:
+            return results
+        max_in_flight = max_in_flight or Config.AI_MAX_IN_FLIGHT
+        timeout = timeout or Config.AI_JOB_TIMEOUT
+
+        # 제목만 있는 공고는 휴리스틱, 본문이 없거나 제공자가 없으면 호출 없이 바로 결과 생성
+        # 나머지만 요청 단위로 묶음
+        indices = []
+        heuristic_count = 0
+        for index, (job_title, job_text) in enumerate(jobs):
+            if Config.AI_HEURISTIC_TITLE_ONLY and is_title_only(job_title, job_text):
+                results[index] = analyze_title(job_title)
+                heuristic_count += 1
+            elif self.provider and job_text:
+                indices.append(index)
+            else:
+                results[index] = self.analyze_job(job_title, job_text)
+        if heuristic_count:
+            print(f"  ⚡ {heuristic_count} title-only job(s) analyzed heuristically (no model call)")
+        if Config.AI_BATCH_ENABLED:
+            batches = plan_batches(indices, [self._job_tokens(*jobs[index]) for index in indices])
+        else:
+            batches = [[index] for index in indices]
+        if not batches:
+            return results
+        print(f"  🤖 Analyzing {len(indices)} jobs in {len(batches)} request(s)...")
+
+        started = {}
+        lock = threading.Lock()
+
+        def run(number):
+            with lock:
+                started[number] = time.monotonic()
+            return self._analyze_batch([jobs[index] for index in batches[number]], deadline=started[number] + timeout)
+
+        executor = ThreadPoolExecutor(max_workers=min(max_in_flight, len(batches)))
+        futures = {executor.submit(run, number): number for number in range(len(batches))}
+        pending = set(futures)
+        done_count = 0
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = batches[futures[future]]
+                    for index, analysis in zip(batch, future.result()):
+                        results[index] = analysis
+                    done_count += len(batch)
+                    print(f"  🤖 Analyzed {done_count}/{len(indices)}: {jobs[batch[0]][0]}" + (f" 외 {len(batch) - 1}건" if len(batch) > 1 else ""))
+
+                now = time.monotonic()
+                for future in list(pending):
+                    number = futures[future]
+                    with lock:
+                        elapsed = now - started[number] if number in started else 0
+                    if elapsed > timeout:
+                        # 응답이 없는 호출은 버리고 다음 요청으로 (호출 자체도 제한 시간에 끝남 - _generate)
+                        pending.discard(future)
+                        batch = batches[number]
+                        done_count += len(batch)
+                        print(f"  ⏱️ AI analysis timed out after {timeout}s: {len(batch)} job(s) from {jobs[batch[0]][0]}")
+                        for index in batch:
+                            results[index] = self._failure("시간 초과")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    @staticmethod
+    def _job_tokens(job_title, job_text):
+        return estimate_tokens(job_title + job_text)
+
+    def _analyze_batch(self, items, deadline=None):
+        """
+        items: (제목, 본문) 목록을 한 요청으로 분석
+        응답 배열이 깨졌거나 일부 id가 빠지면 빠진 공고만 반으로 나눠 다시 요청 (1건이면 단건 프롬프트)
+        호출 자체가 실패하면 (잘못된 키, 차단, 재시도 소진 등) 나누지 않고 묶음 전체를 실패 처리
+        """
+        if len(items) == 1:
+            return [self.analyze_job(*items[0], deadline=deadline)]
+
+        try:
+            response = self._generate(self._batch_prompt(items), deadline, output_tokens=len(items) * Config.AI_OUTPUT_TOKENS)
+        except Exception as e:
+            print(f"AI batch analysis failed ({len(items)} jobs): {e}")
+            return [self._failure("AI 호출 중 오류가 발생했습니다.") for _ in items]
+
+        parsed = {}
+        try:
+            parsed = self._parse_batch(response)
+        except Exception as e:
+            print(f"AI batch response could not be parsed ({len(items)} jobs): {e}")
+
+        results = [parsed.get(str(number)) for number in range(len(items))]
+        missing = [number for number, analysis in enumerate(results) if analysis is None]
+        if not missing:
+            return results
+        if deadline is not None and time.monotonic() >= deadline:
+            return [analysis or self._failure("시간 초과") for analysis in results]
+
+        print(f"  AI batch response missing {len(missing)}/{len(items)} job(s), retrying in smaller batches...")
+        half = (len(missing) + 1) // 2
+        for part in (missing[:half], missing[half:]):
+            if part:
+                for number, analysis in zip(part, self._analyze_batch([items[number] for number in part], deadline)):
+                    results[number] = analysis
+        return results
+
+    @staticmethod
+    def _batch_prompt(items):
+        postings = "\n".join(
+            f"""
+        [공고 id={number}]
+        [공고 제목] {job_title}
+        [공고 내용]
+        {job_text}
+        """
+            for number, (job_title, job_text) in enumerate(items)
+        )
+        return f"""
+        당신은 해당 분야 취업 전문가입니다. 다음 채용공고 {len(items)}건을 각각 분석해주세요.
+        {postings}
+        다음 형식의 JSON 배열로만 응답해주세요 (MarkDown 코드블럭 없이 순수 JSON만, 공고마다 하나씩, id는 위 공고 id 그대로):
+        [
+            {{
+                "id": "공고 id",
+                "summary": "공고의 핵심 내용 3줄 요약",
+                "required_skills": ["필수 역량1", "역량2"],
+                "cover_letter_strategy": "이 공고에 합격하기 위해 자소서에(Entry Level 기준) 강조해야 할 전략 3가지"
+            }}
+        ]
+        """
+
+    @staticmethod
+    def _parse_batch(text):
+        """응답 배열 → {id: 분석} (형식이 맞지 않는 항목은 제외)"""
+        data = json.loads(text.replace("```json", "").replace("```", "").strip())
+        parsed = {}
+        for item in data if isinstance(data, list) else []:
+            if isinstance(item, dict) and "id" in item and item.get("summary"):
+                analysis = dict(item)
+                parsed[str(analysis.pop("id"))] = analysis
+        return parsed
+
+    def analyze_job(self, job_title, job_text, deadline=None):
+        if not self.provider or not job_text:
             return {
-                "summary": "AI API Key missing or no text.",
+                "summary": UNAVAILABLE_SUMMARY,
                 "strategy": "Please configure API Key."
             }
             
@@ -38,7 +242,7 @@ class AIAgent:
         
         [공고 제목] {job_title}
         [공고 내용]
-        {job_text[:3000]} (Start of text)
+        {job_text} (Start of text)
         ...
         
         다음 형식의 JSON으로만 응답해주세요 (MarkDown 코드블럭 없이 순수 JSON만):
@@ -50,12 +254,39 @@ class AIAgent:
         """
         
         try:
-            response = self.model.generate_content(prompt)
-            text = response.text.replace("```json", "").replace("```", "").strip()
+            response = self._generate(prompt, deadline)
+            text = response.replace("```json", "").replace("```", "").strip()
             return json.loads(text)
         except Exception as e:
             print(f"AI Analysis failed: {e}")
-            return {
-                "summary": "분석 실패",
-                "strategy": "AI 호출 중 오류가 발생했습니다."
-            }
+            return self._failure("AI 호출 중 오류가 발생했습니다.")
+
+    def _generate(self, prompt, deadline=None, output_tokens=None):
+        """
+        분당 요청/토큰 한도 안에서 호출 (응답 텍스트 반환), 할당량 초과·일시 오류는 제한 시간 안에서 지수 백오프 후 재시도
+        deadline까지 남은 시간을 호출 제한 시간으로 전달 (응답이 없어도 호출이 deadline에 끝남)
+        """
+        for attempt in range(Config.AI_MAX_RETRIES + 1):
+            self.request_bucket.acquire()
+            self.token_bucket.acquire(estimate_tokens(prompt) + (output_tokens or Config.AI_OUTPUT_TOKENS))
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("시간 초과")
+            try:
+                return self.provider.generate(prompt, timeout=remaining)
+            except Exception as e:
+                wait_seconds = Config.AI_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, 1)
+                out_of_time = deadline is not None and time.monotonic() + wait_seconds > deadline
+                if attempt >= Config.AI_MAX_RETRIES or not _is_retryable(e) or out_of_time:
+                    raise
+                print(f"  AI quota/transient error, retrying in {wait_seconds:.1f}s ({attempt + 1}/{Config.AI_MAX_RETRIES}): {e}")
+                time.sleep(wait_seconds)
+
+    @staticmethod
+    def _failure(reason):
+        return {
+            "summary": FAILURE_SUMMARY,
+            "strategy": reason
+        }
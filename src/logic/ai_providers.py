@@ -0,0 +1,113 @@
+import json
+import random
+import re
+import threading
+import time
+from src.config import Config
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None  # 설치되지 않았으면 gemini 제공자는 비활성 (stub 제공자는 그대로 사용 가능)
+
+_POSTING_ID_PATTERN = re.compile(r'\[공고 id=(\d+)\]')
+
+
+class GeminiProvider:
+    """Gemini API 제공자 - generate(prompt, timeout)는 응답 텍스트 반환 (timeout초가 지나면 요청 자체를 중단)"""
+    name = "gemini"
+
+    def __init__(self, api_key, model_name=None):
+        self.model_name = model_name or Config.AI_MODEL
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(self.model_name)
+
+    def generate(self, prompt, timeout=None):
+        request_options = {"timeout": timeout} if timeout else None
+        return self.model.generate_content(prompt, request_options=request_options).text
+
+
+class ResourceExhausted(Exception):
+    """stub 제공자의 할당량 초과 오류 (google.api_core의 429 예외와 같은 이름 → 같은 재시도 경로)"""
+
+
+class DeadlineExceeded(Exception):
+    """stub 제공자의 요청 제한 시간 초과 (google.api_core의 504 예외와 같은 이름)"""
+
+
+class StubProvider:
+    """
+    오프라인 대체 제공자 (분석 단계 부하 테스트/벤치마크용, 네트워크 없음)
+    - latency: 평균 응답 시간(초, ±50% 균등 분포)
+    - error_rate: 할당량 초과(ResourceExhausted) 비율, malformed_rate: 잘못된 JSON 응답 비율
+    - 묶음 프롬프트([공고 id=N])에는 id별 JSON 배열, 단건 프롬프트에는 JSON 객체로 응답
+    - timeout보다 응답이 늦으면 timeout초 뒤 DeadlineExceeded (실제 API의 요청 제한 시간과 같은 동작)
+    """
+    name = "stub"
+
+    def __init__(self, latency=None, error_rate=None, malformed_rate=None, seed=None):
+        self.latency = Config.AI_STUB_LATENCY if latency is None else latency
+        self.error_rate = Config.AI_STUB_ERROR_RATE if error_rate is None else error_rate
+        self.malformed_rate = Config.AI_STUB_MALFORMED_RATE if malformed_rate is None else malformed_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.prompt_chars = 0
+
+    def generate(self, prompt, timeout=None):
+        with self._lock:
+            self.calls += 1
+            self.prompt_chars += len(prompt)
+            delay = self.latency * self._random.uniform(0.5, 1.5)
+            roll = self._random.random()
+        if timeout is not None and delay > timeout:
+            time.sleep(max(0, timeout))
+            raise DeadlineExceeded(f"504 stub response took longer than {timeout:.1f}s")
+        time.sleep(delay)
+        if roll < self.error_rate:
+            raise ResourceExhausted("429 stub quota exceeded")
+        if roll < self.error_rate + self.malformed_rate:
+            return '[{"id": "0", "summary": "truncated'
+
+        ids = _POSTING_ID_PATTERN.findall(prompt)
+        if ids:
+            return json.dumps([dict(self._answer(), id=posting_id) for posting_id in ids], ensure_ascii=False)
+        return json.dumps(self._answer(), ensure_ascii=False)
+
+    @staticmethod
+    def _answer():
+        return {
+            "summary": "stub 분석 결과",
+            "required_skills": ["stub"],
+            "cover_letter_strategy": "stub"
+        }
+
+
+def create_provider():
+    """
+    Config.AI_PROVIDER에 맞는 제공자 생성 (gemini | stub | none)
+    gemini는 API 키/패키지가 없거나 초기화에 실패하면 None (AI 분석 비활성)
+    """
+    provider = Config.AI_PROVIDER
+    if provider == "stub":
+        print(f"  제공자: 🧪 stub (latency {Config.AI_STUB_LATENCY}s, error rate {Config.AI_STUB_ERROR_RATE})")
+        return StubProvider()
+    if provider != "gemini":
+        print("  ⚠️ AI_PROVIDER=none - AI 기능이 비활성화됩니다.")
+        return None
+
+    api_key = Config.GEMINI_API_KEY
+    print(f"  GEMINI_API_KEY: {'✅ 설정됨 (' + api_key[:8] + '...)' if api_key else '❌ 없음'}")
+    if not api_key:
+        print("  ⚠️ API 키가 없어서 AI 기능이 비활성화됩니다.")
+        return None
+    if genai is None:
+        print("  ⚠️ google-generativeai가 설치되지 않아 AI 기능이 비활성화됩니다.")
+        return None
+    try:
+        provider = GeminiProvider(api_key)
+        print(f"  모델: ✅ {provider.model_name} 로드 완료")
+        return provider
+    except Exception as e:
+        print(f"  모델 로드 실패: ❌ {e}")
+        return None
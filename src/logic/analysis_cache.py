@@ -0,0 +1,74 @@
+import hashlib
+import json
+import re
+import unicodedata
+from datetime import datetime, timedelta
+from src.config import Config
+from src.logic.ai_agent import PROMPT_VERSION, is_cacheable
+from src.logic.dedup import canonical_company, normalize_title
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _normalize_text(text):
+    return _WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFKC", text or "")).strip().lower()
+
+
+class AnalysisCache:
+    """
+    AI 분석 결과 캐시 (job store의 ai_analyses 테이블)
+    - 키: 정규화한 회사명 + 제목 + 원본 본문 + 프롬프트 버전의 해시
+      → 여러 사이트에 올라온 같은 공고, 마감 후 다시 수집된 공고는 모델 호출 없이 재사용
+      (압축 본문은 학습된 상용구에 따라 실행마다 달라질 수 있으므로 키에는 압축 전 본문 사용)
+    - AI_CACHE_TTL_DAYS가 지난 항목과 AI_CACHE_MAX_ENTRIES를 넘는 오래 사용하지 않은 항목은 정리
+    """
+
+    def __init__(self, store, ttl_days=None, max_entries=None):
+        self.store = store
+        self.ttl_days = ttl_days or Config.AI_CACHE_TTL_DAYS
+        self.max_entries = max_entries or Config.AI_CACHE_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(job, text):
+        title = job.get('title', '')
+        raw = json.dumps([
+            PROMPT_VERSION,
+            canonical_company(job.get('company', '')),
+            normalize_title(title),
+            _normalize_text(text) if text != title else ""  # 제목만 분석하는 경우 본문은 비움
+        ], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def analyze(self, agent, jobs, texts, sources=None):
+        """
+        캐시에 없는 공고만 agent.analyze_many로 분석 (같은 키는 한 번만 요청)
+        texts: 모델에 보낼 본문, sources: 캐시 키용 원본 본문 (없으면 texts)
+        반환: jobs와 같은 순서의 분석 결과 목록
+        """
+        now = datetime.now()
+        keys = [self.key(job, source) for job, source in zip(jobs, sources or texts)]
+        analyses = self.store.get_analyses(keys, now)
+
+        pending = {}
+        for index, key in enumerate(keys):
+            if key in analyses:
+                self.hits += 1
+            else:
+                self.misses += 1
+                pending.setdefault(key, index)
+
+        results = agent.analyze_many([(jobs[index]['title'], texts[index]) for index in pending.values()])
+        fresh = dict(zip(pending, results))
+        analyses.update(fresh)
+        self.store.put_analyses({key: analysis for key, analysis in fresh.items() if is_cacheable(analysis)}, now)
+        removed = self.store.prune_analyses(now - timedelta(days=self.ttl_days), self.max_entries)
+
+        print(f"🧠 AI analysis cache: {self.stats()} ({len(pending)} model request(s), {removed} evicted)")
+        return [analyses[key] for key in keys]
+
+    def stats(self):
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0
+        return f"hit {self.hits}, miss {self.misses} ({rate:.0f}% hit)"
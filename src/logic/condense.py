@@ -0,0 +1,137 @@
+import hashlib
+import re
+import unicodedata
+from src.config import Config
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_LINE_KEY_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+
+# 소제목 → 구역 우선순위 (작을수록 먼저 예산에 포함)
+# 자격요건 > 주요업무 > 우대사항 > 소제목 없는 본문 > 회사 소개/복리후생/전형 절차/유의사항
+SECTION_PATTERNS = [
+    (0, re.compile(r'자격\s*요건|지원\s*자격|필수\s*(요건|사항|역량)|requirements?|qualifications?', re.I)),
+    (1, re.compile(r'주요\s*업무|담당\s*업무|업무\s*내용|하는\s*일|직무\s*내용|responsibilities|what you', re.I)),
+    (2, re.compile(r'우대\s*사항|우대\s*조건|우대|preferred|nice to have', re.I)),
+    (4, re.compile(r'복리\s*후생|혜택|복지|회사\s*소개|기업\s*소개|전형\s*절차|채용\s*절차|유의\s*사항|기타\s*사항|근무\s*조건|benefits?|about us', re.I)),
+]
+DEFAULT_PRIORITY = 3
+HEADING_MAX_LENGTH = 30
+# 소제목 형태: [자격요건] / ■ 자격요건 / 자격요건: (글머리표 "-", "•"로 시작하는 항목은 제외)
+_BULLET_PATTERN = re.compile(r'^[-•·*∙◦–]')
+_HEADING_FORM_PATTERN = re.compile(r'^(?:[\[【<〈(].*[\]】>〉)]|[■□◆◇●○▶▷▣◎★☆#].*|.*[:：])$')
+_HEADING_MARKS_PATTERN = re.compile(r'^[\[【<〈(■□◆◇●○▶▷▣◎★☆#\s]+|[\]】>〉):：\s]+$')
+
+
+def estimate_tokens(text):
+    """입력 토큰 수 추정 (한글 위주 텍스트 기준 약 2글자당 1토큰)"""
+    return max(1, len(text) // 2)
+
+
+def _line_key(line):
+    """중복/상용구 판정용 줄 키 (공백·기호·대소문자 무시)"""
+    return _LINE_KEY_PATTERN.sub("", unicodedata.normalize("NFKC", line).lower())
+
+
+def line_hash(line):
+    return hashlib.sha1(_line_key(line).encode("utf-8")).hexdigest()[:16]
+
+
+def _section_priority(line):
+    """
+    소제목이면 구역 우선순위, 아니면 None
+    소제목 형태(괄호/■/끝의 콜론)이거나 줄 전체가 소제목 이름인 경우만 인정
+    ("- 장애인 우대"처럼 항목 안에 나온 단어로 구역이 바뀌지 않도록)
+    """
+    if len(line) > HEADING_MAX_LENGTH or _BULLET_PATTERN.match(line):
+        return None
+    heading_form = bool(_HEADING_FORM_PATTERN.match(line))
+    name = _HEADING_MARKS_PATTERN.sub("", line)
+    for priority, pattern in SECTION_PATTERNS:
+        if (heading_form and pattern.search(name)) or pattern.fullmatch(name):
+            return priority
+    return None
+
+
+def condense(text, token_budget=None, is_boilerplate=None):
+    """
+    AI 입력용 본문 압축
+    - 빈 줄/중복 줄 제거, is_boilerplate(line)가 참인 줄(사이트 공통 상용구) 제거
+    - 소제목으로 구역을 나눠 자격요건 → 주요업무 → 우대사항 → 기타 순으로 token_budget까지 포함
+    - 포함된 줄은 원래 순서대로 반환
+    """
+    token_budget = token_budget or Config.AI_TEXT_TOKEN_BUDGET
+    lines = []
+    seen = set()
+    priority = DEFAULT_PRIORITY
+    for raw in (text or "").splitlines():
+        line = _WHITESPACE_PATTERN.sub(" ", raw).strip()
+        key = _line_key(line)
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        heading = _section_priority(line)
+        if heading is not None:
+            priority = heading
+        elif is_boilerplate and is_boilerplate(line):
+            continue
+        lines.append((priority, len(lines), line, heading is not None))
+
+    if estimate_tokens("\n".join(line[2] for line in lines)) > token_budget:
+        selected = []
+        used = 0
+        for line in sorted(lines):
+            cost = estimate_tokens(line[2]) + 1
+            if used + cost <= token_budget:
+                selected.append(line)
+                used += cost
+        lines = sorted(selected, key=lambda line: line[1])
+    return _join_sections(lines)
+
+
+def _join_sections(lines):
+    """내용이 하나도 남지 않은 소제목은 빼고 원래 순서대로 연결"""
+    kept = []
+    for index, (_, _, line, is_heading) in enumerate(lines):
+        if is_heading and (index + 1 == len(lines) or lines[index + 1][3]):
+            continue
+        kept.append(line)
+    return "\n".join(kept)
+
+
+class TextCondenser:
+    """
+    사이트별 상용구 학습 + 본문 압축
+    - 본문 줄의 사이트별 등장 공고 수를 job store(line_stats)에 누적
+    - 학습된 공고가 AI_BOILERPLATE_MIN_DOCS건 이상인 사이트에서 AI_BOILERPLATE_RATIO 이상의 공고에
+      나오는 줄은 상용구로 보고 제거 (회사 공통 안내, 법적 고지, 지원 방법 등)
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def learn(self, jobs, bodies):
+        by_site = {}
+        for job, body in zip(jobs, bodies):
+            if body:
+                hashes = {line_hash(line) for line in body.splitlines() if _line_key(line)}
+                by_site.setdefault(job.get('site', ''), []).append(hashes)
+        for site, documents in by_site.items():
+            self.store.add_line_stats(site, documents, Config.AI_BOILERPLATE_MAX_DOCS)
+
+    def condense_all(self, jobs, bodies):
+        """jobs와 같은 순서의 압축 본문 목록"""
+        texts = []
+        boilerplate = {}
+        for job, body in zip(jobs, bodies):
+            site = job.get('site', '')
+            if site not in boilerplate:
+                boilerplate[site] = self._boilerplate(site)
+            hashes = boilerplate[site]
+            texts.append(condense(body, is_boilerplate=lambda line: line_hash(line) in hashes) if body else "")
+        return texts
+
+    def _boilerplate(self, site):
+        docs = self.store.line_stats_docs(site)
+        if docs < Config.AI_BOILERPLATE_MIN_DOCS:
+            return set()
+        return self.store.frequent_lines(site, docs * Config.AI_BOILERPLATE_RATIO)
@@ -1,112 +1,164 @@
 import json
 import os
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from itertools import islice
+from src.logic.deadline_normalizer import DeadlineNormalizer
+from src.config import Config
+from src.logic.dedup import KEY_VERSION, DedupIndex, apply_keys, migrate_keys
+from src.logic.job_store import JobStore
+from src.logic.static_export import StaticExporter
+
+def _batches(items, size):
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
 
 class DataManager:
-    def __init__(self, file_path):
+    """
+    공고 데이터 관리 - SQLite job store(Config.DB_FILE)가 원본
+    docs/jobs.json은 GitHub Pages 표시용 결과물로 export_jobs()에서만 생성
+    store가 없으면 (첫 실행 / Actions 캐시 만료) docs/jobs.json에서 한 번 가져옴
+    """
+
+    def __init__(self, file_path, db_path=None):
         self.file_path = file_path
-        
+        self.store = JobStore(db_path or Config.DB_FILE)
+
     def load_existing_jobs(self):
+        """store를 준비하고 저장된 공고 수 반환 (전체 공고를 메모리에 읽지 않음)"""
+        if self.store.count() == 0:
+            jobs = self._read_json_file()
+            if jobs:
+                self.store.upsert(jobs)
+                print(f"Imported {len(jobs)} jobs from {self.file_path} into job store.")
+        self._migrate_store_keys()
+        return self.store.count()
+
+    def _migrate_store_keys(self):
+        """
+        정규화 규칙 버전(KEY_VERSION)이 store에 기록된 것과 다르면 저장된 공고의 company_key / title_key를 다시 계산
+        """
+        if self.store.get_meta("key_version") == str(KEY_VERSION):
+            return
+        jobs = list(self.store.iter_jobs())
+        migrated = migrate_keys(jobs)
+        if migrated:
+            self.store.upsert(jobs)
+            print(f"Re-keyed company/title keys of {migrated} stored jobs (key version {KEY_VERSION}).")
+        self.store.set_meta("key_version", str(KEY_VERSION))
+
+    def known_ids(self):
+        """
+        스크래퍼 페이지 순회 중단 판단용 id - 저장된 공고 + 교차 중복으로 걸러진 공고
+        (걸러진 공고만 나오는 페이지도 이전 실행에서 본 페이지)
+        """
+        self.store.prune_seen_ids(datetime.now() - timedelta(days=Config.SEEN_IDS_TTL_DAYS))
+        return self.store.all_ids() | self.store.seen_ids()
+
+    def _read_json_file(self):
         if not os.path.exists(self.file_path):
             return []
         try:
             with open(self.file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                jobs = json.load(f)
         except:
             return []
-            
-    def save_jobs(self, jobs):
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(jobs, f, ensure_ascii=False, indent=2)
-            
-    def filter_new_jobs(self, scraped_jobs, existing_jobs):
-        seen_ids = set(job['id'] for job in existing_jobs)
+
+        # 마감일 정규화 필드가 없는 구 데이터 변환
+        migrated = DeadlineNormalizer.migrate(jobs)
+        if migrated:
+            print(f"Migrated deadlines of {migrated} existing jobs.")
+        # 회사/제목 정규화 키가 없는 구 데이터만 계산 (이후에는 store에 저장된 키 재사용)
+        migrated = migrate_keys(jobs)
+        if migrated:
+            print(f"Normalized company/title keys of {migrated} existing jobs.")
+        return jobs
+
+    def filter_new_jobs(self, scraped_jobs):
+        """
+        scraped_jobs: 수집 공고 iterable (ScraperManager.iter_all 스트림을 그대로 받음)
+        FILTER_BATCH_SIZE개씩 모아 store 조회/비교 → 수집이 끝나기 전에 판정을 시작하고 신규 공고만 유지
+        """
+        # 회사별 블로킹 인덱스: 새 공고는 같은 회사의 기존 공고 제목들과만 비교
+        dedup_index = DedupIndex()
+        loaded_companies = set()
+        new_ids = set()
         new_jobs = []
-        
-        # 중복 검사를 위한 기존 공고들의 정규화된 데이터 미리 생성 (속도 최적화)
-        existing_signatures = []
-        for job in existing_jobs:
-            existing_signatures.append({
-                'company': self._normalize_text(job['company']),
-                'title': self._normalize_text(job['title']),
-                'original': job
-            })
-            
-        print(f"Comparing {len(scraped_jobs)} scraped jobs against {len(existing_jobs)} existing jobs...")
-        
-        for job in scraped_jobs:
-            if job['id'] in seen_ids:
-                continue
-                
-            # ID는 다르지만 내용이 같은 "교차 중복" 확인 (다른 사이트 동일 공고)
-            is_duplicate = False
-            current_company = self._normalize_text(job['company'])
-            current_title = self._normalize_text(job['title'])
-            
-            for existing in existing_signatures:
-                # 1. 회사명이 다르면 바로 패스 (가장 강력한 필터)
-                if current_company != existing['company']:
+        duplicate_ids = set()
+        scraped = stored = 0
+
+        for batch in _batches(scraped_jobs, Config.FILTER_BATCH_SIZE):
+            scraped += len(batch)
+            for job in batch:
+                apply_keys(job)
+            # 이번 batch의 id / 아직 읽지 않은 회사만 store에서 조회 (전체 이력을 읽지 않음)
+            seen_ids = self.store.known_ids(job['id'] for job in batch)
+            companies = {job['company_key'] for job in batch if job['id'] not in seen_ids} - loaded_companies
+            loaded_companies |= companies
+            stored += self._load_company_titles(companies, dedup_index)
+
+            for job in batch:
+                if job['id'] in seen_ids or job['id'] in new_ids:
                     continue
-                
-                # 2. 회사명이 같으면 제목 유사도 검사
-                # 제목이 서로 포함관계이거나, 70% 이상 유사하면 중복으로 간주
-                if current_title in existing['title'] or existing['title'] in current_title:
-                   is_duplicate = True
-                   # print(f"Duplicate found (Substring): {job['title']} == {existing['original']['title']}")
-                   break
-                   
-                # difflib는 느릴 수 있으므로 텍스트가 짧을 때만 정밀 비교
-                if self._check_similarity(current_title, existing['title']):
-                    is_duplicate = True
-                    # print(f"Duplicate found (Similarity): {job['title']} == {existing['original']['title']}")
-                    break
-            
-            if not is_duplicate:
-                job['scraped_at'] = datetime.now().isoformat()
-                job['is_new'] = True
-                
-                # 방금 추가된 것도 중복 비교군에 추가 (이번 실행 내에서의 중복 방지)
-                existing_signatures.append({
-                    'company': current_company,
-                    'title': current_title,
-                    'original': job
-                })
-                seen_ids.add(job['id']) # ID도 등록
-                new_jobs.append(job)
-                
+
+                # ID는 다르지만 내용이 같은 "교차 중복" 확인 (다른 사이트 동일 공고)
+                # 회사명이 다르면 비교 대상이 아님 (가장 강력한 필터) → 같은 회사 블록 안에서만
+                # 제목이 서로 포함관계이거나 SequenceMatcher 비율이 기준 이상이면 중복으로 간주
+                current_company = job['company_key']
+                current_title = job['title_key']
+
+                if not dedup_index.is_duplicate(current_company, current_title):
+                    job['scraped_at'] = datetime.now().isoformat()
+                    job['is_new'] = True
+
+                    # 방금 추가된 것도 중복 비교군에 추가 (이번 실행 내에서의 중복 방지)
+                    dedup_index.add(current_company, current_title)
+                    new_ids.add(job['id']) # ID도 등록
+                    new_jobs.append(job)
+                else:
+                    duplicate_ids.add(job['id'])
+
+        # 걸러진 교차 중복 id도 기록 → 다음 실행에서 이 공고들만 나오는 페이지에서 순회 중단
+        self.store.add_seen_ids(duplicate_ids, datetime.now())
+
+        print(f"Compared {scraped} scraped jobs against {stored} stored jobs of {len(loaded_companies)} companies.")
         return new_jobs
 
-    def _normalize_text(self, text):
-        """특수문자, 공백, (주) 등을 제거하여 비교하기 쉽게 만듦"""
-        import re
-        if not text: return ""
-        # 소문자 변환
-        text = text.lower()
-        # (주), 주식회사 등 흔한 법인명 제거
-        text = re.sub(r'\(주\)|주식회사|\(유\)|inc\.|co\.|ltd\.', '', text)
-        # 괄호 안의 내용 제거 (예: [판교], (채용시마감) 등 지역/상태 정보 제거)
-        text = re.sub(r'\[.*?\]|\(.*?\)', '', text)
-        # 특수문자 및 공백 제거 (숫자와 한글/영어만 남김)
-        text = re.sub(r'[^a-zA-Z0-9가-힣]', '', text)
-        return text
-
-    def _check_similarity(self, s1, s2):
-        from difflib import SequenceMatcher
-        # 너무 짧은 제목은 비교하지 않음
-        if len(s1) < 5 or len(s2) < 5:
-            return False
-        return SequenceMatcher(None, s1, s2).ratio() > 0.7  # 70% 이상 유사하면 중복
-
-    def merge_jobs(self, existing_jobs, new_jobs):
-        # Create a map for easy updates
-        job_map = {job['id']: job for job in existing_jobs}
-        
-        # Mark old jobs as not new
-        for job in job_map.values():
-            job['is_new'] = False
-            
-        # Add or update new jobs
-        for job in new_jobs:
-            job_map[job['id']] = job
-            
-        return list(job_map.values())
+    def _load_company_titles(self, companies, dedup_index):
+        """회사들의 기존 공고 제목을 비교 인덱스에 추가하고 읽은 공고 수 반환"""
+        rows = self.store.titles_by_company(companies)
+        for company_key, title_key in rows:
+            dedup_index.add(company_key, title_key)
+        return len(rows)
+
+    def merge_jobs(self, new_jobs):
+        """지난 실행의 신규 표시를 해제하고 새 공고만 store에 기록"""
+        self.store.clear_new_flags()
+        return self.store.upsert(new_jobs)
+
+    def remove_expired_jobs(self, today=None):
+        """마감일이 지난 공고 삭제 (deadline_date 인덱스 조회) 후 삭제된 공고 반환"""
+        return self.store.delete_expired(today or date.today())
+
+    def classify_deadlines(self, today=None, days=None):
+        """
+        마감 임박 공고를 남은 일수별로 분류 - {0: 오늘 마감, 1: 내일 마감(D-1), N: D-N} (N <= days)
+        store의 deadline_date로 한 번에 조회 (공고별 마감일 파싱 없음)
+        """
+        return self.store.jobs_due_within(today or date.today(), Config.DEADLINE_BUCKET_DAYS if days is None else days)
+
+    def export_jobs(self, today=None):
+        """
+        store → docs/jobs.json + 카테고리/플랫폼별 shard와 manifest (GitHub Pages용, 파이프라인 마지막 단계)
+        정렬된 전체 공고 반환
+        """
+        jobs = self.store.all_jobs(today or date.today())
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            json.dump(jobs, f, ensure_ascii=False, indent=2)
+        shards = StaticExporter().export(jobs)["shards"]
+        print(f"Exported {len(jobs)} jobs ({len(shards.get('category', {}))} category / {len(shards.get('platform', {}))} platform shards).")
+        return jobs
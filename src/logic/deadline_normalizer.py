@@ -0,0 +1,125 @@
+from datetime import date, datetime, timedelta
+import re
+
+# 마감일 종류
+KIND_DATED = "dated"        # 날짜가 있는 공고
+KIND_ROLLING = "rolling"    # 상시채용 / 채용시 마감
+KIND_UNKNOWN = "unknown"    # 파싱 불가 (OPEN 등 상태값)
+
+_ROLLING_PATTERN = re.compile(r'상시|수시|채용\s*시|채용시까지|always|rolling', re.IGNORECASE)
+_D_DAY_PATTERN = re.compile(r'D\s*-\s*(\d+)|D-?day', re.IGNORECASE)
+_YMD_PATTERN = re.compile(r'(\d{4})\s*[./-]\s*(\d{1,2})\s*[./-]\s*(\d{1,2})')
+_SHORT3_PATTERN = re.compile(r'(?<!\d)(\d{2})\s*[./]\s*(\d{1,2})\s*[./]\s*(\d{1,2})(?!\d)')
+_MD_PATTERN = re.compile(r'(?<!\d)(\d{1,2})\s*[./]\s*(\d{1,2})(?!\d)')
+_COMPACT_PATTERN = re.compile(r'(?<!\d)(\d{8})(?!\d)')
+
+
+class DeadlineNormalizer:
+    """
+    스크래핑 시점에 마감일 문자열을 한 번만 파싱하여 정규화
+    - deadline_date: ISO 날짜 문자열 (YYYY-MM-DD) 또는 None
+    - deadline_kind: dated / rolling / unknown
+    원본 deadline 문자열은 화면 표시용으로 그대로 유지
+    """
+
+    @staticmethod
+    def normalize(text, reference=None):
+        """
+        마감일 문자열 → (deadline_date, deadline_kind)
+        reference: 상대 표현(오늘/내일/D-N)과 연도 없는 날짜의 기준일 (기본: 오늘)
+        지원 형식:
+        - 02/14 마감, ~02.18(수), ~ 02/28(토), 02.28
+        - 2026-02-28, 2026.02.28, 2026-02-28T23:59:59, 20260228
+        - 26.02.28 / 02/28/26 (연도 2자리)
+        - 오늘마감, 내일마감, D-3, D-day
+        - 상시채용, 채용시 마감 (날짜가 함께 있으면 날짜 우선: "~02.28 (채용시 마감)" → 02-28)
+        - 기간 표기(02/03 ~ 02/17)는 마지막 날짜를 마감일로 사용
+        """
+        if not text:
+            return None, KIND_UNKNOWN
+        text = str(text).strip()
+        today = reference or date.today()
+
+        if '오늘' in text or 'today' in text.lower():
+            return today.isoformat(), KIND_DATED
+        if '내일' in text or 'tomorrow' in text.lower():
+            return (today + timedelta(days=1)).isoformat(), KIND_DATED
+
+        d_match = _D_DAY_PATTERN.search(text)
+        if d_match:
+            days = int(d_match.group(1)) if d_match.group(1) else 0
+            return (today + timedelta(days=days)).isoformat(), KIND_DATED
+
+        parsed = DeadlineNormalizer._parse_date(text, today)
+        if parsed:
+            return parsed.isoformat(), KIND_DATED
+        if _ROLLING_PATTERN.search(text):
+            return None, KIND_ROLLING
+        return None, KIND_UNKNOWN
+
+    @staticmethod
+    def _parse_date(text, today):
+        matches = list(_YMD_PATTERN.finditer(text))
+        if matches:
+            y, m, d = matches[-1].groups()
+            return DeadlineNormalizer._safe_date(int(y), int(m), int(d))
+
+        matches = list(_COMPACT_PATTERN.finditer(text))
+        if matches:
+            raw = matches[-1].group(1)
+            return DeadlineNormalizer._safe_date(int(raw[:4]), int(raw[4:6]), int(raw[6:]))
+
+        matches = list(_SHORT3_PATTERN.finditer(text))
+        if matches:
+            a, b, c = (int(x) for x in matches[-1].groups())
+            # YY.MM.DD 와 MM.DD.YY 중 기준일에 더 가까운 해석 사용
+            candidates = [
+                DeadlineNormalizer._safe_date(2000 + a, b, c),
+                DeadlineNormalizer._safe_date(2000 + c, a, b)
+            ]
+            candidates = [x for x in candidates if x]
+            if candidates:
+                return min(candidates, key=lambda x: abs((x - today).days))
+            return None
+
+        matches = list(_MD_PATTERN.finditer(text))
+        if matches:
+            m, d = (int(x) for x in matches[-1].groups())
+            # 연도가 없으면 기준일에 가장 가까운 연도로 추정 (12월에 본 "01/15"는 다음 해)
+            candidates = [DeadlineNormalizer._safe_date(today.year + offset, m, d) for offset in (-1, 0, 1)]
+            candidates = [x for x in candidates if x]
+            if candidates:
+                return min(candidates, key=lambda x: abs((x - today).days))
+        return None
+
+    @staticmethod
+    def _safe_date(year, month, day):
+        try:
+            return date(year, month, day)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def apply(job, reference=None):
+        """공고 dict에 deadline_date / deadline_kind 필드를 기록하고 그대로 반환"""
+        job['deadline_date'], job['deadline_kind'] = DeadlineNormalizer.normalize(job.get('deadline', ''), reference)
+        return job
+
+    @staticmethod
+    def migrate(jobs):
+        """
+        정규화 필드가 없는 기존 공고(docs/jobs.json 구 데이터)를 변환
+        상대 표현은 수집 시각(scraped_at)을 기준일로 해석
+        """
+        migrated = 0
+        for job in jobs:
+            if 'deadline_kind' in job:
+                continue
+            reference = None
+            try:
+                reference = datetime.fromisoformat(job['scraped_at']).date()
+            except (KeyError, TypeError, ValueError):
+                pass
+            DeadlineNormalizer.apply(job, reference)
+            migrated += 1
+        return migrated
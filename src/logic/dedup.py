@@ -0,0 +1,140 @@
+import re
+import unicodedata
+from difflib import SequenceMatcher
+
+from src.config import Config
+
+# 법인 형태 표기 (회사명 비교 시 제거) - NFKC 정규화 후 소문자 기준
+# ㈜ → (주), ㈲ → (有) 로 NFKC 변환되므로 변환 후 형태로 등록
+CORPORATE_SUFFIXES = [
+    "(주)", "주식회사", "(유)", "(有)", "유한회사", "유한책임회사", "(사)", "사단법인", "재단법인", "(재)",
+    "inc.", "inc", "co.,ltd.", "co., ltd.", "co.ltd", "co.", "ltd.", "ltd", "corp.", "corporation", "corp", "llc"
+]
+
+
+def _suffix_regex(suffix):
+    # 영문 표기는 단어 경계에서만 제거 (예: "incruit"의 "inc"는 유지)
+    if suffix[0].isascii() and suffix[0].isalpha():
+        return r'(?<![a-z])' + re.escape(suffix) + r'(?![a-z])'
+    return re.escape(suffix)
+
+
+# 같은 회사를 다르게 표기하는 경우 (정규화된 회사명 앞부분 → 대표 표기)
+COMPANY_ALIASES = {
+    "엘지": "lg",
+    "에스케이": "sk",
+    "케이티": "kt",
+    "씨제이": "cj",
+    "지에스": "gs",
+    "naver": "네이버",
+    "kakao": "카카오",
+    "coupang": "쿠팡",
+    "samsung": "삼성",
+    "hyundai": "현대"
+}
+
+# NFKC가 변환하지 않는 전각/특수 괄호 → ASCII 괄호 (예: "【서울】", "「신입」"도 괄호 내용 제거)
+_BRACKET_TABLE = str.maketrans("【〔「『〈《〖】〕」』〉》〗", "[[[[[[[]]]]]]]")
+
+# 특수문자·공백 / 괄호 내용 / 법인 표기를 한 번의 치환으로 제거
+# 법인 표기는 첫 글자가 맞을 때만 시도 (모든 위치에서 전체 후보를 대조하지 않도록)
+_SUFFIX_FIRST_CHARS = re.escape("".join(sorted({s[0] for s in CORPORATE_SUFFIXES})))
+_STRIP_PATTERN = re.compile(
+    r'[^a-z0-9가-힣\[(]+|\[[^\]]*\]'
+    + f"|(?=[{_SUFFIX_FIRST_CHARS}])(?:"
+    + "|".join(_suffix_regex(s) for s in sorted(CORPORATE_SUFFIXES, key=len, reverse=True))
+    + r')|\([^)]*\)|[\[(]'
+)
+# 별칭은 회사명 앞부분에서만 치환 (예: "엘지전자" → "lg전자")
+_ALIAS_PATTERN = re.compile("^(?:" + "|".join(re.escape(k) for k in sorted(COMPANY_ALIASES, key=len, reverse=True)) + ")")
+
+# 정규화 규칙이 바뀌면 올려서 저장된 키를 다시 계산
+KEY_VERSION = 1
+
+
+def _strip(text):
+    # NFKC: 전각 영숫자/기호 → 반각, ㈜ → (주)
+    text = unicodedata.normalize("NFKC", text).lower().translate(_BRACKET_TABLE)
+    return _STRIP_PATTERN.sub("", text)
+
+
+def canonical_company(name):
+    """
+    회사명 → 비교용 대표 키
+    ㈜/(주)/주식회사/Inc./Co.,Ltd. 등 법인 표기와 괄호/특수문자를 제거하고 별칭을 대표 표기로 통일
+    예) "㈜카카오", "카카오(주)", "Kakao Corp." → "카카오"
+    """
+    if not name:
+        return ""
+    return _ALIAS_PATTERN.sub(lambda m: COMPANY_ALIASES[m.group(0)], _strip(name))
+
+
+def normalize_title(title):
+    """
+    공고 제목 → 비교용 키
+    법인 표기, 괄호 안 내용(예: [판교], (채용시마감) 등 지역/상태 정보), 특수문자와 공백 제거
+    """
+    if not title:
+        return ""
+    return _strip(title)
+
+
+def apply_keys(job):
+    """공고 dict에 정규화된 company_key / title_key를 기록하고 그대로 반환 (수집 시 1회)"""
+    job['company_key'] = canonical_company(job.get('company', ''))
+    job['title_key'] = normalize_title(job.get('title', ''))
+    job['key_version'] = KEY_VERSION
+    return job
+
+
+def migrate_keys(jobs):
+    """정규화 키가 없거나 규칙 버전이 다른 기존 공고만 다시 계산"""
+    migrated = 0
+    for job in jobs:
+        if job.get('key_version') != KEY_VERSION:
+            apply_keys(job)
+            migrated += 1
+    return migrated
+
+
+def is_similar_title(title1, title2):
+    """
+    정규화된 두 제목의 SequenceMatcher 비율이 Config.DEDUP_SIMILARITY_RATIO보다 크면 True
+    비율 상한(real_quick_ratio / quick_ratio)으로 먼저 걸러 확실히 다른 제목은 전체 비교를 생략 (판정 결과는 같음)
+    """
+    # 너무 짧은 제목은 비교하지 않음
+    if len(title1) < 5 or len(title2) < 5:
+        return False
+    threshold = Config.DEDUP_SIMILARITY_RATIO
+    matcher = SequenceMatcher(None, title1, title2)
+    return (matcher.real_quick_ratio() > threshold
+            and matcher.quick_ratio() > threshold
+            and matcher.ratio() > threshold)
+
+
+class DedupIndex:
+    """
+    교차 중복 검사용 회사별 블로킹 인덱스
+    회사 대표 키 → 정규화된 제목 목록
+    새 공고는 같은 회사 블록 안의 제목들과만 비교하므로 전체 이력 크기와 무관하게 빠름
+    """
+
+    def __init__(self, is_similar=is_similar_title):
+        # is_similar(title1, title2) -> bool : 블록 안에서 사용할 제목 유사도 판정 함수
+        self.is_similar = is_similar
+        self.blocks = {}
+
+    def add(self, company_key, title):
+        self.blocks.setdefault(company_key, []).append(title)
+
+    def is_duplicate(self, company_key, title):
+        for existing in self.blocks.get(company_key, ()):
+            # 제목이 서로 포함관계이거나 유사하면 중복으로 간주
+            if title in existing or existing in title:
+                return True
+            if self.is_similar(title, existing):
+                return True
+        return False
+
+    def __len__(self):
+        return sum(len(titles) for titles in self.blocks.values())
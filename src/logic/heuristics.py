@@ -0,0 +1,105 @@
+import re
+import unicodedata
+
+HEURISTIC_SOURCE = "heuristic"
+
+# 직무 분류 → 제목 키워드 (앞에 있는 분류가 우선, re.A: "AI엔지니어"처럼 한글과 붙은 영문 약어도 \b로 구분)
+# 한글 사이에는 \b가 없으므로 다른 단어의 일부가 되는 경우는 뒤따르는 글자로 제외 (인사이트, 감사합니다)
+ROLE_PATTERNS = [
+    ("데이터 엔지니어", re.compile(r'데이터\s*엔지니어|data\s*engineer|\bdba\b|\betl\b|데이터\s*플랫폼', re.I | re.A)),
+    ("머신러닝/AI", re.compile(r'머신\s*러닝|딥\s*러닝|machine\s*learning|\bml\b|\bai\b|인공지능|llm|mlops|nlp|컴퓨터\s*비전', re.I | re.A)),
+    ("데이터 분석", re.compile(r'데이터\s*(분석|사이언|과학)|data\s*(analy|scien)|\bbi\b|그로스|통계', re.I | re.A)),
+    ("세무", re.compile(r'세무|세금|tax', re.I | re.A)),
+    ("재무", re.compile(r'재무|자금|\bir\b|fp&?a|finance|treasury', re.I | re.A)),
+    ("회계", re.compile(r'회계|결산|경리|전표|\baccounting\b|\baccountant\b|감사(?![합드해])', re.I | re.A)),
+    ("HRD", re.compile(r'hrd|교육\s*(기획|운영)|인재\s*개발|조직\s*문화', re.I | re.A)),
+    ("인사", re.compile(r'인사(?!이트)|hrm|\bhr\b|노무|급여|payroll|people', re.I | re.A)),
+    # 제목 끝의 "채용"은 거의 모든 공고에 붙으므로 채용 담당 직무 표현만
+    ("채용", re.compile(r'채용\s*담당|리크루터|recruit|talent\s*acquisition|\bta\b', re.I | re.A)),
+    ("총무", re.compile(r'총무|경영\s*지원|사무\s*(보조|지원)|자산\s*관리', re.I | re.A)),
+]
+
+# 직무 분류별 기본 역량 (제목에서 찾은 도구/자격 역량 뒤에 붙임)
+ROLE_SKILLS = {
+    "데이터 엔지니어": ["SQL", "Python", "데이터 파이프라인(ETL) 설계", "클라우드 데이터 인프라"],
+    "머신러닝/AI": ["Python", "머신러닝 모델링", "데이터 전처리", "모델 평가/배포"],
+    "데이터 분석": ["SQL", "Python", "통계 분석", "데이터 시각화"],
+    "세무": ["세법 이해", "세무 신고", "엑셀", "꼼꼼함"],
+    "재무": ["재무제표 분석", "자금 관리", "엑셀", "재무 모델링"],
+    "회계": ["회계원리", "결산", "전표 처리", "ERP"],
+    "HRD": ["교육 과정 기획", "교육 운영", "커뮤니케이션", "성과 분석"],
+    "채용": ["채용 프로세스 운영", "후보자 소싱", "커뮤니케이션", "채용 브랜딩"],
+    "인사": ["인사 제도 이해", "노동법 기초", "급여/4대보험", "엑셀"],
+    "총무": ["자산/시설 관리", "문서 관리", "커뮤니케이션", "엑셀"],
+}
+
+# 제목에 직접 나오는 도구/자격 (표기 그대로 역량 목록에 포함)
+SKILL_PATTERNS = [
+    ("Python", re.compile(r'python|파이썬', re.I | re.A)),
+    ("SQL", re.compile(r'\bsql\b', re.I | re.A)),
+    ("Tableau", re.compile(r'tableau|태블로', re.I | re.A)),
+    ("Power BI", re.compile(r'power\s*bi', re.I | re.A)),
+    ("Spark", re.compile(r'spark|스파크', re.I | re.A)),
+    ("AWS", re.compile(r'\baws\b', re.I | re.A)),
+    ("GCP", re.compile(r'\bgcp\b', re.I | re.A)),
+    ("LLM", re.compile(r'llm|생성형', re.I | re.A)),
+    ("SAP", re.compile(r'\bsap\b', re.I | re.A)),
+    ("ERP", re.compile(r'\berp\b|더존', re.I | re.A)),
+    ("엑셀", re.compile(r'엑셀|excel', re.I | re.A)),
+    ("CPA", re.compile(r'\bcpa\b|회계사', re.I | re.A)),
+    ("세무사", re.compile(r'세무사', re.I | re.A)),
+    ("AICPA", re.compile(r'aicpa|uscpa', re.I | re.A)),
+    ("노무사", re.compile(r'노무사', re.I | re.A)),
+    ("영어", re.compile(r'영어|english|영문|글로벌', re.I | re.A)),
+]
+
+# 경력 구분 (제목 기준)
+LEVEL_PATTERNS = [
+    ("인턴", re.compile(r'인턴|intern', re.I | re.A)),
+    ("신입", re.compile(r'신입|entry|junior|주니어|졸업', re.I | re.A)),
+    ("경력", re.compile(r'경력|senior|시니어|\d+\s*년\s*(이상|↑)|팀장|리드|lead', re.I | re.A)),
+]
+
+STRATEGIES = {
+    "인턴": "실무 경험보다 학습 속도와 성실함을 보여줄 수 있는 프로젝트/활동 경험을 강조하세요.",
+    "신입": "직무 관련 교육·프로젝트에서 맡은 역할과 결과를 수치로 제시하세요.",
+    "경력": "유사 업무에서의 성과를 규모와 수치 중심으로 정리하세요.",
+}
+
+
+def _normalize(title):
+    return unicodedata.normalize("NFKC", title or "")
+
+
+def analyze_title(title):
+    """
+    제목만 있는 공고의 빠른 분석 (모델 호출 없음)
+    - 직무 분류: ROLE_PATTERNS 중 처음 일치한 항목 / 역량: 제목의 도구·자격 + 직무 분류 기본 역량
+    - 반환 형식은 AI 분석 결과와 같고 "source": "heuristic"으로 구분
+    """
+    text = _normalize(title)
+    role = next((name for name, pattern in ROLE_PATTERNS if pattern.search(text)), None)
+    level = next((name for name, pattern in LEVEL_PATTERNS if pattern.search(text)), None)
+
+    skills = [name for name, pattern in SKILL_PATTERNS if pattern.search(text)]
+    for skill in ROLE_SKILLS.get(role, []):
+        if skill not in skills:
+            skills.append(skill)
+
+    summary = [f"직무: {role or '분류 불가'}" + (f" ({level})" if level else "")]
+    if skills:
+        summary.append("예상 역량: " + ", ".join(skills[:4]))
+    summary.append("상세 본문이 없어 제목 기준으로 분석했습니다.")
+
+    strategies = []
+    if role:
+        strategies.append(f"{role} 직무 역량({', '.join(ROLE_SKILLS[role][:2])})을 경험 사례와 함께 제시하세요.")
+    strategies.append(STRATEGIES.get(level, STRATEGIES["신입"]))
+    strategies.append("지원 전 원문 공고의 자격요건/우대사항을 확인해 자소서 키워드를 맞추세요.")
+
+    return {
+        "summary": "\n".join(summary),
+        "required_skills": skills,
+        "cover_letter_strategy": " ".join(f"{number}. {strategy}" for number, strategy in enumerate(strategies, 1)),
+        "source": HEURISTIC_SOURCE
+    }
@@ -0,0 +1,339 @@
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import date, timedelta
+
+# SQLite 변수 개수 제한(구버전 999) 안에서 IN (...) 조회를 나눠 실행
+_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    company_key TEXT NOT NULL DEFAULT '',
+    title_key TEXT NOT NULL DEFAULT '',
+    deadline_date TEXT,
+    scraped_at TEXT,
+    is_new INTEGER NOT NULL DEFAULT 0,
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company_key ON jobs(company_key);
+CREATE INDEX IF NOT EXISTS idx_jobs_deadline_date ON jobs(deadline_date);
+CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_is_new ON jobs(is_new) WHERE is_new = 1;
+CREATE TABLE IF NOT EXISTS query_runs (
+    site TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    run_date TEXT NOT NULL,
+    PRIMARY KEY (site, keyword, run_date)
+);
+CREATE TABLE IF NOT EXISTS query_results (
+    site TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    run_date TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    PRIMARY KEY (site, keyword, run_date, job_id)
+);
+CREATE INDEX IF NOT EXISTS idx_query_runs_date ON query_runs(run_date);
+CREATE TABLE IF NOT EXISTS ai_analyses (
+    key TEXT PRIMARY KEY,
+    analysis TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    used_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ai_analyses_created_at ON ai_analyses(created_at);
+CREATE INDEX IF NOT EXISTS idx_ai_analyses_used_at ON ai_analyses(used_at);
+CREATE TABLE IF NOT EXISTS line_stats (
+    site TEXT NOT NULL,
+    line_hash TEXT NOT NULL,
+    docs INTEGER NOT NULL,
+    PRIMARY KEY (site, line_hash)
+);
+CREATE TABLE IF NOT EXISTS seen_ids (
+    id TEXT PRIMARY KEY,
+    seen_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seen_ids_seen_at ON seen_ids(seen_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_UPSERT = """
+INSERT INTO jobs (id, company_key, title_key, deadline_date, scraped_at, is_new, content_hash, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    company_key = excluded.company_key,
+    title_key = excluded.title_key,
+    deadline_date = excluded.deadline_date,
+    scraped_at = excluded.scraped_at,
+    is_new = excluded.is_new,
+    content_hash = excluded.content_hash,
+    data = excluded.data
+WHERE jobs.content_hash != excluded.content_hash OR jobs.is_new != excluded.is_new
+"""
+
+
+def _chunks(values):
+    values = list(values)
+    for i in range(0, len(values), _CHUNK_SIZE):
+        yield values[i:i + _CHUNK_SIZE]
+
+
+class JobStore:
+    """
+    공고 저장소 (SQLite)
+    - id(PK), 회사 키, 마감일, 수집 시각에 인덱스 → 중복/마감/알림 단계는 필요한 행만 조회
+    - 변경된 공고만 기록 (content_hash 비교 upsert) → 실행당 쓰기량은 신규 공고 수에 비례
+    - 공고 dict 전체는 data(JSON)에 그대로 보관, is_new 플래그만 별도 컬럼으로 관리
+    docs/jobs.json(GitHub Pages용)은 DataManager.export_jobs()로 마지막에 한 번만 생성
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def get_meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+
+    @staticmethod
+    def _content_hash(data):
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _to_job(data, is_new):
+        job = json.loads(data)
+        job['is_new'] = bool(is_new)
+        return job
+
+    def upsert(self, jobs):
+        """
+        공고 추가/갱신 - 내용(content_hash)이나 is_new가 바뀐 행만 기록
+        반환값: 실제로 기록된 행 수
+        """
+        rows = []
+        for job in jobs:
+            content = {k: v for k, v in job.items() if k != 'is_new'}
+            data = json.dumps(content, ensure_ascii=False, sort_keys=True)
+            rows.append((
+                job['id'],
+                job.get('company_key', ''),
+                job.get('title_key', ''),
+                job.get('deadline_date'),
+                job.get('scraped_at'),
+                1 if job.get('is_new') else 0,
+                self._content_hash(data),
+                data
+            ))
+        before = self.conn.total_changes
+        with self.conn:
+            self.conn.executemany(_UPSERT, rows)
+        return self.conn.total_changes - before
+
+    def iter_jobs(self):
+        """저장된 전체 공고 (정규화 키 재계산 등 전체 변환용)"""
+        for data, is_new in self.conn.execute("SELECT data, is_new FROM jobs").fetchall():
+            yield self._to_job(data, is_new)
+
+    def all_ids(self):
+        return {row[0] for row in self.conn.execute("SELECT id FROM jobs")}
+
+    def add_seen_ids(self, ids, now):
+        """저장하지 않은 수집 공고 id 기록 (교차 중복으로 걸러진 공고 - 페이지 순회 중단 판단용)"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO seen_ids (id, seen_at) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET seen_at = excluded.seen_at",
+                [(job_id, now.isoformat()) for job_id in ids]
+            )
+
+    def seen_ids(self):
+        return {row[0] for row in self.conn.execute("SELECT id FROM seen_ids")}
+
+    def prune_seen_ids(self, before):
+        with self.conn:
+            return self.conn.execute("DELETE FROM seen_ids WHERE seen_at < ?", (before.isoformat(),)).rowcount
+
+    def known_ids(self, ids):
+        """주어진 id 중 이미 저장된 것 (PK 인덱스 조회)"""
+        known = set()
+        for chunk in _chunks(set(ids)):
+            placeholders = ",".join("?" * len(chunk))
+            known.update(row[0] for row in self.conn.execute(
+                f"SELECT id FROM jobs WHERE id IN ({placeholders})", chunk
+            ))
+        return known
+
+    def titles_by_company(self, company_keys):
+        """회사 키별 저장 공고의 (company_key, title_key) - 교차 중복 검사용"""
+        rows = []
+        for chunk in _chunks(set(company_keys)):
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(self.conn.execute(
+                f"SELECT company_key, title_key FROM jobs WHERE company_key IN ({placeholders})",
+                chunk
+            ))
+        return rows
+
+    def record_query_results(self, site, run_date, results):
+        """사이트별 키워드 검색 결과 id 기록 (results: {keyword: ids}, 결과 0건도 요청 기록은 남김)"""
+        run_date = run_date.isoformat()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO query_runs (site, keyword, run_date) VALUES (?, ?, ?)",
+                [(site, keyword, run_date) for keyword in results]
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO query_results (site, keyword, run_date, job_id) VALUES (?, ?, ?, ?)",
+                [(site, keyword, run_date, job_id) for keyword, ids in results.items() for job_id in ids]
+            )
+
+    def query_history(self, site, since):
+        """since 이후 실행별 키워드 결과 {run_date: {keyword: set(ids)}}"""
+        history = {}
+        params = (site, since.isoformat())
+        for keyword, run_date in self.conn.execute(
+            "SELECT keyword, run_date FROM query_runs WHERE site = ? AND run_date >= ?", params
+        ):
+            history.setdefault(run_date, {})[keyword] = set()
+        for keyword, run_date, job_id in self.conn.execute(
+            "SELECT keyword, run_date, job_id FROM query_results WHERE site = ? AND run_date >= ?", params
+        ):
+            history.setdefault(run_date, {}).setdefault(keyword, set()).add(job_id)
+        return history
+
+    def prune_query_history(self, before):
+        with self.conn:
+            self.conn.execute("DELETE FROM query_runs WHERE run_date < ?", (before.isoformat(),))
+            self.conn.execute("DELETE FROM query_results WHERE run_date < ?", (before.isoformat(),))
+
+    def get_analyses(self, keys, now):
+        """캐시된 AI 분석 {key: analysis} (조회된 항목은 사용 시각 갱신 → LRU 정리 기준)"""
+        found = {}
+        for chunk in _chunks(set(keys)):
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                (key, json.loads(analysis)) for key, analysis in self.conn.execute(
+                    f"SELECT key, analysis FROM ai_analyses WHERE key IN ({placeholders})", chunk
+                )
+            )
+        if found:
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE ai_analyses SET used_at = ? WHERE key = ?",
+                    [(now.isoformat(), key) for key in found]
+                )
+        return found
+
+    def put_analyses(self, analyses, now):
+        stamp = now.isoformat()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO ai_analyses (key, analysis, created_at, used_at) VALUES (?, ?, ?, ?)",
+                [(key, json.dumps(analysis, ensure_ascii=False), stamp, stamp) for key, analysis in analyses.items()]
+            )
+
+    def prune_analyses(self, created_before, max_entries):
+        """TTL이 지난 분석 삭제 후, max_entries를 넘는 만큼 가장 오래 사용하지 않은 것부터 삭제"""
+        with self.conn:
+            removed = self.conn.execute(
+                "DELETE FROM ai_analyses WHERE created_at < ?", (created_before.isoformat(),)
+            ).rowcount
+            removed += self.conn.execute(
+                "DELETE FROM ai_analyses WHERE key IN ("
+                "SELECT key FROM ai_analyses ORDER BY used_at DESC LIMIT -1 OFFSET ?)", (max_entries,)
+            ).rowcount
+        return removed
+
+    def add_line_stats(self, site, documents, max_docs):
+        """
+        본문 줄의 사이트별 등장 공고 수 누적 (documents: 공고별 줄 해시 집합)
+        누적 공고 수가 max_docs를 넘으면 모든 값을 절반으로 줄여 최근 본문 위주로 유지 (드문 줄은 삭제)
+        """
+        docs = self.line_stats_docs(site) + len(documents)
+        counts = {}
+        for hashes in documents:
+            for digest in hashes:
+                counts[digest] = counts.get(digest, 0) + 1
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO line_stats (site, line_hash, docs) VALUES (?, ?, ?) "
+                "ON CONFLICT(site, line_hash) DO UPDATE SET docs = docs + excluded.docs",
+                [(site, digest, count) for digest, count in counts.items()]
+            )
+            if docs > max_docs:
+                docs //= 2
+                self.conn.execute("UPDATE line_stats SET docs = docs / 2 WHERE site = ?", (site,))
+                self.conn.execute("DELETE FROM line_stats WHERE site = ? AND docs = 0", (site,))
+        self.set_meta(f"line_stats_docs:{site}", str(docs))
+
+    def line_stats_docs(self, site):
+        return int(self.get_meta(f"line_stats_docs:{site}") or 0)
+
+    def frequent_lines(self, site, min_docs):
+        return {row[0] for row in self.conn.execute(
+            "SELECT line_hash FROM line_stats WHERE site = ? AND docs >= ?", (site, min_docs)
+        )}
+
+    def clear_new_flags(self):
+        """지난 실행의 신규 표시 해제 (is_new 부분 인덱스로 해당 행만 갱신)"""
+        with self.conn:
+            return self.conn.execute("UPDATE jobs SET is_new = 0 WHERE is_new = 1").rowcount
+
+    def delete_expired(self, today):
+        """마감일이 지난 공고 삭제 후 반환 (마감일 없는 상시채용 등은 유지)"""
+        cutoff = today.isoformat()
+        expired = [
+            self._to_job(data, is_new) for data, is_new in self.conn.execute(
+                "SELECT data, is_new FROM jobs WHERE deadline_date < ?", (cutoff,)
+            )
+        ]
+        if expired:
+            with self.conn:
+                self.conn.execute("DELETE FROM jobs WHERE deadline_date < ?", (cutoff,))
+        return expired
+
+    def jobs_due_within(self, today, days):
+        """
+        마감일이 today ~ today+days인 공고를 남은 일수별로 묶어 반환 ({N: 공고 목록}, 각 목록은 최신순)
+        deadline_date 인덱스 범위 조회 한 번으로 D-day ~ D-N을 함께 분류
+        """
+        buckets = {}
+        rows = self.conn.execute(
+            "SELECT deadline_date, data, is_new FROM jobs WHERE deadline_date BETWEEN ? AND ? "
+            "ORDER BY deadline_date, scraped_at DESC",
+            (today.isoformat(), (today + timedelta(days=days)).isoformat())
+        )
+        for deadline_date, data, is_new in rows:
+            days_left = (date.fromisoformat(deadline_date) - today).days
+            buckets.setdefault(days_left, []).append(self._to_job(data, is_new))
+        return buckets
+
+    def all_jobs(self, today):
+        """전체 공고 - 내일 마감 → 오늘 마감 → 최신순"""
+        tomorrow = today + timedelta(days=1)
+        return [
+            self._to_job(data, is_new) for data, is_new in self.conn.execute(
+                "SELECT data, is_new FROM jobs "
+                "ORDER BY deadline_date IS ? DESC, deadline_date IS ? DESC, COALESCE(scraped_at, '') DESC",
+                (tomorrow.isoformat(), today.isoformat())
+            )
+        ]
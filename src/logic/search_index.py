@@ -0,0 +1,48 @@
+import re
+import unicodedata
+
+# 한글 연속 구간 / 영문·숫자 단어
+_TOKEN_PATTERN = re.compile(r'[가-힣]+|[a-z0-9]+')
+# 한글 사이 공백 (띄어쓰기가 달라도 같은 2-gram이 나오도록 제거)
+_HANGUL_SPACE_PATTERN = re.compile(r'(?<=[가-힣])\s+(?=[가-힣])')
+
+
+def tokenize(text):
+    """
+    색인용 토큰 (docs/index.html의 tokenizeQuery와 같은 규칙 + 한글 사이 공백 무시)
+    - 한글: 공백을 무시한 글자 2-gram (예: "데이터 분석" → 데이, 이터, 터분, 분석)
+      → 검색어를 "데이터분석" / "데이터 분석" 어느 쪽으로 입력해도 일치
+      한 글자 구간은 그대로 사용
+    - 영문/숫자: 소문자 단어
+    """
+    if not text:
+        return set()
+    text = _HANGUL_SPACE_PATTERN.sub("", unicodedata.normalize("NFKC", text).lower())
+    tokens = set()
+    for run in _TOKEN_PATTERN.findall(text):
+        if run[0] >= '가' and len(run) > 1:
+            tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.add(run)
+    return tokens
+
+
+def build_search_index(jobs):
+    """
+    제목/회사명 역색인 생성 (질의 계획으로 생략된 키워드에 연결된 공고는 그 키워드도 색인 - query_keywords)
+    - ids: 문서 번호 → 공고 id
+    - tokens: 토큰 → 문서 번호 목록 (오름차순, 차분 인코딩으로 크기 축소)
+    """
+    postings = {}
+    for doc, job in enumerate(jobs):
+        tokens = tokenize(job.get('title', '')) | tokenize(job.get('company', ''))
+        for keyword in job.get('query_keywords', ()):
+            tokens |= tokenize(keyword)
+        for token in tokens:
+            postings.setdefault(token, []).append(doc)
+
+    tokens = {}
+    for token in sorted(postings):
+        docs = postings[token]
+        tokens[token] = [docs[0]] + [b - a for a, b in zip(docs, docs[1:])]
+    return {"ids": [job['id'] for job in jobs], "tokens": tokens}
@@ -0,0 +1,94 @@
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from src.config import Config
+from src.logic.search_index import build_search_index
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # brotli가 없으면 .br 파일은 생략 (.gz만 생성)
+
+
+def job_category(job):
+    """공고 카테고리 (docs/index.html의 getJobCategory와 동일 규칙) - data / accounting / hr / other"""
+    keyword = job.get('hidden_keyword', '').lower()
+    for category, keywords in Config.KEYWORDS.items():
+        if any(kw.lower() in keyword for kw in keywords):
+            return category.lower()
+    return 'other'
+
+
+class StaticExporter:
+    """
+    GitHub Pages용 정적 결과물 생성
+    - 전체 / 카테고리별 / 플랫폼별 shard JSON (파일명에 내용 해시 → 내용이 같으면 파일 재작성 없음, 브라우저 캐시 재사용)
+    - 각 shard의 사전 압축본 (.gz, brotli 설치 시 .br)
+    - 제목/회사명 검색 역색인 (페이지 검색은 전체 공고 스캔 대신 색인 조회)
+    - manifest.json: shard 종류별 파일명/공고 수 (페이지는 manifest를 받은 뒤 필요한 shard 하나만 요청)
+    """
+
+    def __init__(self, shard_dir=None, manifest_file=None):
+        self.shard_dir = shard_dir or Config.SHARD_DIR
+        self.manifest_file = manifest_file or Config.MANIFEST_FILE
+
+    def export(self, jobs):
+        groups = {("all", "all"): jobs}
+        for job in jobs:
+            groups.setdefault(("category", job_category(job)), []).append(job)
+            groups.setdefault(("platform", job.get('site', 'other')), []).append(job)
+
+        os.makedirs(self.shard_dir, exist_ok=True)
+        manifest = {"generated_at": datetime.now().isoformat(), "total": len(jobs), "shards": {}}
+        written = set()
+        for (kind, name), shard_jobs in groups.items():
+            filename = self._write_json(f"{kind}-{self._slug(name)}", shard_jobs)
+            written.add(filename)
+            entry = {"file": f"{os.path.basename(self.shard_dir)}/{filename}", "count": len(shard_jobs)}
+            if kind == "all":
+                manifest["shards"]["all"] = entry
+            else:
+                manifest["shards"].setdefault(kind, {})[name] = entry
+
+        filename = self._write_json("search", build_search_index(jobs))
+        written.add(filename)
+        manifest["search"] = {"file": f"{os.path.basename(self.shard_dir)}/{filename}"}
+
+        self._remove_stale(written)
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return manifest
+
+    def _write_json(self, prefix, payload):
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        filename = f"{prefix}.{digest}.json"
+        path = os.path.join(self.shard_dir, filename)
+        if os.path.exists(path):
+            return filename  # 내용 해시가 같으면 이미 최신
+
+        with open(path, 'wb') as f:
+            f.write(data)
+        # mtime=0 → 같은 내용이면 같은 바이트 (불필요한 git 변경 방지)
+        with open(path + ".gz", 'wb') as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            with open(path + ".br", 'wb') as f:
+                f.write(brotli.compress(data, quality=11))
+        return filename
+
+    def _remove_stale(self, current):
+        """이번 manifest에 없는 이전 shard 삭제"""
+        for filename in os.listdir(self.shard_dir):
+            base = filename
+            for ext in (".gz", ".br"):
+                if base.endswith(ext):
+                    base = base[:-len(ext)]
+            if base.endswith(".json") and base not in current:
+                os.remove(os.path.join(self.shard_dir, filename))
+
+    @staticmethod
+    def _slug(name):
+        return "".join(c if c.isalnum() else "_" for c in name.lower()) or "other"
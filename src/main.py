@@ -1,5 +1,6 @@
 import sys
 import os
+from datetime import date
 
 # Ensure we can import src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -12,10 +13,13 @@ try:
 except ImportError:
     pass  # dotenv가 없으면 무시 (GitHub Actions에서는 환경변수가 이미 설정됨)
 
+from src.scraper.details import DetailFetcher
 from src.scraper.manager import ScraperManager
+from src.scraper.query_planner import QueryPlanner
 from src.logic.data_manager import DataManager
-from src.logic.deadline import DeadlineChecker
 from src.logic.ai_agent import AIAgent
+from src.logic.analysis_cache import AnalysisCache
+from src.logic.condense import TextCondenser
 from src.notifier import Notifier
 from src.config import Config
 
@@ -24,54 +28,61 @@ def main():
     
     # 1. Setup
     data_manager = DataManager(Config.DATA_FILE)
-    scraper_manager = ScraperManager()
+    scraper_manager = ScraperManager(QueryPlanner(data_manager.store))
     ai_agent = AIAgent()
     notifier = Notifier()
     
-    # 2. Load Old Data
-    existing_jobs = data_manager.load_existing_jobs()
-    print(f"Loaded {len(existing_jobs)} existing jobs.")
+    # 2. Load Old Data (SQLite job store - 필요한 행만 조회)
+    existing_count = data_manager.load_existing_jobs()
+    print(f"Job store has {existing_count} existing jobs.")
     
-    # 3. Scrape
-    scraped_jobs = scraper_manager.run_all()
-    print(f"Scraped {len(scraped_jobs)} jobs.")
-    
-    # 4. Filter New
-    new_jobs = data_manager.filter_new_jobs(scraped_jobs, existing_jobs)
+    # 3. Scrape (저장된 공고만 나오는 페이지에서 페이지 순회 중단)
+    # 4. Filter New - 수집 스트림을 그대로 소비 (수집 중에 신규 판정 진행, 전체 수집 목록을 만들지 않음)
+    scraped_jobs = scraper_manager.iter_all(data_manager.known_ids())
+    new_jobs = data_manager.filter_new_jobs(scraped_jobs)
+    print(f"Scraped {scraper_manager.collected} jobs.")
     print(f"Found {len(new_jobs)} new jobs.")
     
-    # 5. AI Analysis (Only for new jobs to save cost/time)
-    for i, job in enumerate(new_jobs):
-        print(f"Analyzing {i+1}/{len(new_jobs)}: {job['title']}")
-        # Get Full Text (Scrapers need to implement get_details properly)
-        # For MVP, we might skip full text if scraper.get_details is empty
-        # or just pass title + company for a "Initial Strategy"
-        
-        # NOTE: Ideally we call scraper.get_details(job['link']) here
-        # But for speed in this demo, we might just analyze based on Title
-        job['ai_analysis'] = ai_agent.analyze_job(job['title'], job['title']) 
+    # 5. Posting details (신규 공고만, 본문 캐시에 없는 공고만 사이트별 속도 제한 안에서 병렬 요청)
+    detail_fetcher = DetailFetcher(scraper_manager.scrapers)
+    bodies = detail_fetcher.fetch(new_jobs)
+    # 사이트별 상용구 학습 후 본문 압축 (중복/상용구 줄 제거, 자격요건·주요업무·우대사항 우선으로 토큰 예산까지)
+    condenser = TextCondenser(data_manager.store)
+    condenser.learn(new_jobs, bodies)
+    condensed = condenser.condense_all(new_jobs, bodies)
+    texts = [text or job['title'] for job, text in zip(new_jobs, condensed)]
+    sources = [body or job['title'] for job, body in zip(new_jobs, bodies)]
+    
+    # AI Analysis (Only for new jobs to save cost/time)
+    # 캐시에 없는 공고만 동시 요청 수 / 분당 요청·토큰 한도 안에서 병렬 분석 (결과는 입력 순서 유지)
+    # 같은 내용으로 이미 분석한 공고(교차 등록 / 재수집)는 캐시 결과 재사용 (캐시 키는 압축 전 원본 본문)
+    analysis_cache = AnalysisCache(data_manager.store)
+    analyses = analysis_cache.analyze(ai_agent, new_jobs, texts, sources)
+    for job, analysis in zip(new_jobs, analyses):
+        job['ai_analysis'] = analysis
         
-    # 6. Merge & Filter
-    all_jobs = data_manager.merge_jobs(existing_jobs, new_jobs)
+    # 6. Merge & Filter (변경된 공고만 store에 기록)
+    written = data_manager.merge_jobs(new_jobs)
+    print(f"Stored {written} changed job(s).")
     
-    # 기한이 지난 공고 자동 삭제
+    # 기한이 지난 공고 자동 삭제 (마감일 인덱스로 해당 공고만 조회)
     print("\n🔍 Checking for expired jobs...")
-    all_jobs = DeadlineChecker.filter_active_jobs(all_jobs)
-    
-    all_jobs = DeadlineChecker.filter_active_jobs(all_jobs)
-    
-    # Check deadlines
-    today_deadline_jobs = DeadlineChecker.get_deadline_day_jobs(all_jobs)
-    upcoming_jobs = DeadlineChecker.get_upcoming_deadline_jobs(all_jobs) # 내일 마감 (D-1)
+    today = date.today()
+    expired_jobs = data_manager.remove_expired_jobs(today)
+    for job in expired_jobs:
+        print(f"  🗑️  Removing expired job: {job['title']} (Deadline: {job.get('deadline', '')})")
+    if expired_jobs:
+        print(f"✅ Removed {len(expired_jobs)} expired job(s)")
     
-    # Sort: Deadline Tomorrow (Priority) -> Deadline Today -> Newest
-    all_jobs.sort(key=lambda x: (
-        DeadlineChecker.is_deadline_tomorrow(x.get('deadline', '')),  # 1순위: 내일 마감
-        DeadlineChecker.is_deadline_today(x.get('deadline', '')),     # 2순위: 오늘 마감
-        x.get('scraped_at')                                         # 3순위: 최신순
-    ), reverse=True)
+    deadline_buckets = data_manager.classify_deadlines(today)
+    today_deadline_jobs = deadline_buckets.get(0, [])
+    upcoming_jobs = deadline_buckets.get(1, []) # 내일 마감 (D-1)
+    if deadline_buckets:
+        print("⏰ Deadlines: " + ", ".join(f"D-{days}: {len(jobs)}" for days, jobs in sorted(deadline_buckets.items())))
     
-    data_manager.save_jobs(all_jobs)
+    # GitHub Pages용 docs/jobs.json 내보내기 (마지막 단계)
+    # Sorted: Deadline Tomorrow (Priority) -> Deadline Today -> Newest
+    all_jobs = data_manager.export_jobs(today)
     print("Data saved.")
     
     # 7. Notify
@@ -0,0 +1,154 @@
+import gzip
+import hashlib
+import os
+import threading
+import time
+
+from src.config import Config
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # zstandard가 없으면 gzip으로 압축
+
+
+class BodyCache:
+    """
+    공고 상세 본문 캐시 (내용 주소 방식, 공고당 한 번만 요청)
+    - objects/<해시 앞 2자리>/<본문 sha256>.zst|.gz: 압축한 본문 (같은 본문은 한 번만 저장)
+    - refs/<공고 id 해시>: 공고 → 본문 해시 (본문이 비어 있어도 기록 → 다시 요청하지 않음)
+    - 디렉터리 하나로 구성되어 GitHub Actions cache로 실행/재시도 간 그대로 보존
+    - prune(): 마지막 사용(ref 파일 mtime) 후 ttl_days가 지난 공고와, 전체 크기가 max_bytes를 넘는 만큼
+      가장 오래 사용하지 않은 공고부터 ref 삭제 → 어떤 ref도 가리키지 않는 본문 파일 삭제
+    """
+
+    def __init__(self, cache_dir=None, ttl_days=None, max_bytes=None):
+        self.cache_dir = cache_dir or Config.BODY_CACHE_DIR
+        self.ttl_days = ttl_days or Config.BODY_CACHE_TTL_DAYS
+        self.max_bytes = max_bytes or Config.BODY_CACHE_MAX_BYTES
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stored = 0
+
+    def _ref_path(self, job_id):
+        digest = hashlib.sha256(job_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, "refs", digest[:2], digest)
+
+    def _object_path(self, digest, ext):
+        return os.path.join(self.cache_dir, "objects", digest[:2], digest + ext)
+
+    def get(self, job_id):
+        """저장된 본문 (한 번도 받은 적 없으면 None)"""
+        ref_path = self._ref_path(job_id)
+        try:
+            with open(ref_path, 'r', encoding='utf-8') as f:
+                digest = f.read().strip()
+        except OSError:
+            return None
+        text = self._read_object(digest)
+        if text is not None:
+            # LRU: 사용 시각 갱신
+            now = time.time()
+            try:
+                os.utime(ref_path, (now, now))
+            except OSError:
+                pass
+            with self._lock:
+                self.hits += 1
+        return text
+
+    def _read_object(self, digest):
+        for ext in (".zst", ".gz"):
+            try:
+                with open(self._object_path(digest, ext), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                continue
+            if ext == ".zst":
+                if zstandard is None:
+                    continue
+                data = zstandard.ZstdDecompressor().decompress(data)
+            else:
+                data = gzip.decompress(data)
+            return data.decode("utf-8")
+        return None
+
+    def put(self, job_id, text):
+        data = (text or "").encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if self._read_object(digest) is None:
+            if zstandard is not None:
+                ext, compressed = ".zst", zstandard.ZstdCompressor(level=10).compress(data)
+            else:
+                ext, compressed = ".gz", gzip.compress(data, compresslevel=9, mtime=0)
+            self._write(self._object_path(digest, ext), compressed)
+        self._write(self._ref_path(job_id), digest.encode("ascii"))
+        with self._lock:
+            self.stored += 1
+
+    @staticmethod
+    def _write(path, data):
+        # 임시 파일 → rename (동시 실행/중단 시 깨진 파일이 남지 않도록)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _files(self, kind):
+        root = os.path.join(self.cache_dir, kind)
+        for folder, _, names in os.walk(root):
+            for name in names:
+                if not name.endswith(".tmp"):
+                    yield os.path.join(folder, name)
+
+    def prune(self):
+        """오래된/용량 초과 항목 삭제 후 삭제한 공고(ref) 수 반환"""
+        refs = []
+        for path in self._files("refs"):
+            try:
+                stat = os.stat(path)
+                with open(path, 'r', encoding='utf-8') as f:
+                    refs.append((stat.st_mtime, path, f.read().strip()))
+            except OSError:
+                continue
+        objects = {}
+        for path in self._files("objects"):
+            try:
+                objects.setdefault(os.path.basename(path).split(".")[0], []).append((path, os.path.getsize(path)))
+            except OSError:
+                continue
+
+        refs.sort()
+        expire_before = time.time() - self.ttl_days * 86400
+        total = sum(size for files in objects.values() for _, size in files)
+        referenced = {}
+        for _, _, digest in refs:
+            referenced[digest] = referenced.get(digest, 0) + 1
+
+        removed = 0
+        for mtime, path, digest in refs:
+            if mtime >= expire_before and total <= self.max_bytes:
+                break
+            self._remove(path)
+            removed += 1
+            referenced[digest] -= 1
+            if not referenced[digest]:
+                total -= sum(size for _, size in objects.get(digest, ()))
+
+        # 남은 ref가 가리키지 않는 본문 파일 삭제 (중단된 실행이 남긴 파일 포함)
+        for digest, files in objects.items():
+            if not referenced.get(digest):
+                for path, _ in files:
+                    self._remove(path)
+        return removed
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def stats(self):
+        return f"hit {self.hits}, fetched {self.stored}"
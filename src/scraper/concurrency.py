@@ -0,0 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+def iter_keywords(search_fn, keywords, max_workers=1, observer=None):
+    """
+    키워드별 검색 함수를 실행하고 결과를 키워드 순서대로 하나씩 내보냄 (generator)
+    max_workers > 1 이면 사이트 내 동시 요청 수를 그 값으로 제한하여 병렬 실행
+    (search_fn 내부에서 예외를 처리하므로 한 키워드의 실패가 다른 키워드에 영향 없음)
+    observer(keyword, jobs): 사이트의 중복 제거 전 키워드별 결과 (질의 계획 학습용)
+    """
+    if max_workers <= 1 or len(keywords) <= 1:
+        for keyword in keywords:
+            jobs = search_fn(keyword)
+            if observer:
+                observer(keyword, jobs)
+            yield from jobs
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(keywords))) as executor:
+        # executor.map은 입력 순서를 유지하므로 순차 실행과 결과 순서가 같음
+        for keyword, jobs in zip(keywords, executor.map(search_fn, keywords)):
+            if observer:
+                observer(keyword, jobs)
+            yield from jobs
+
+
+def map_keywords(search_fn, keywords, max_workers=1, observer=None):
+    """iter_keywords의 결과를 목록으로 반환"""
+    return list(iter_keywords(search_fn, keywords, max_workers, observer))
@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config import Config
+from src.scraper.body_cache import BodyCache
+from src.scraper.html_parser import FallbackText
+
+
+class DetailFetcher:
+    """
+    신규 공고의 상세 본문 수집 단계 (AI 분석 입력)
+    - 본문 캐시에 없는 공고만 각 사이트 스크래퍼의 get_details로 요청
+    - 사이트 간에는 병렬, 사이트 안에서는 SITE_CONCURRENCY개까지 (호스트별 속도 제한은 HttpClient가 적용)
+    - 받은 본문은 압축 저장 → 같은 공고는 이후 실행/재시도에서 다시 요청하지 않음
+    """
+
+    def __init__(self, scrapers, cache=None):
+        self.scrapers = {scraper.__class__.__name__.replace("Scraper", ""): scraper for scraper in scrapers}
+        self.cache = cache or BodyCache()
+
+    def fetch(self, jobs):
+        """jobs와 같은 순서의 본문 목록 (받지 못했으면 "")"""
+        bodies = [""] * len(jobs)
+        missing = {}
+        for index, job in enumerate(jobs):
+            body = self.cache.get(job['id'])
+            if body is not None:
+                bodies[index] = body
+            elif job.get('site') in self.scrapers and job.get('link'):
+                missing.setdefault(job['site'], []).append(index)
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                futures = {
+                    site: executor.submit(self._fetch_site, site, [jobs[index] for index in indices])
+                    for site, indices in missing.items()
+                }
+                for site, future in futures.items():
+                    for index, body in zip(missing[site], future.result()):
+                        bodies[index] = body
+        removed = self.cache.prune()
+        if removed:
+            print(f"📄 Body cache: evicted {removed} old posting(s)")
+        print(f"📄 Posting details: {sum(1 for body in bodies if body)}/{len(jobs)} with body ({self.cache.stats()})")
+        return bodies
+
+    def _fetch_site(self, site, jobs):
+        scraper = self.scrapers[site]
+        max_workers = Config.SITE_CONCURRENCY.get(site, 1) if Config.SCRAPE_CONCURRENT else 1
+
+        def fetch_one(job):
+            # get_details: 본문 텍스트 (본문이 없는 페이지는 ""), 요청 실패 시 None → 캐시하지 않고 다음에 재시도
+            # selector가 맞지 않아 문서 전체를 쓴 본문(FallbackText)도 이번 실행에만 사용 (selector 수정 후 다시 요청)
+            body = scraper.get_details(job['link'])
+            if body is not None and not isinstance(body, FallbackText):
+                self.cache.put(job['id'], body)
+            return body or ""
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+            return list(executor.map(fetch_one, jobs))
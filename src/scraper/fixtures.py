@@ -0,0 +1,126 @@
+import json
+import os
+import re
+import threading
+from urllib.parse import parse_qsl, urlparse
+
+import requests
+
+from src.config import Config
+from src.scraper.http_cache import CachedEntry, cache_key
+
+# 파라미터 중 검색어로 쓰이는 키 (사이트별 이름이 다름) → 픽스처를 키워드별 폴더로 정리
+KEYWORD_PARAMS = ("searchword", "stext", "kw", "keyword", "query", "filterBy_keyword")
+
+
+class FixtureNotFound(requests.ConnectionError):
+    """재생 모드에서 기록된 응답이 없을 때 (스크래퍼의 기존 네트워크 오류 처리 경로를 그대로 탐)"""
+
+
+def _find_keyword(value):
+    """JSON 본문에서 검색어 키를 재귀로 탐색 (예: Linkareer GraphQL의 variables.filterBy.keyword)"""
+    if isinstance(value, dict):
+        for name in KEYWORD_PARAMS:
+            if isinstance(value.get(name), str) and value[name]:
+                return value[name]
+        value = list(value.values())
+    if isinstance(value, list):
+        for item in value:
+            found = _find_keyword(item)
+            if found:
+                return found
+    return None
+
+
+def _keyword_of(url, params, body=None):
+    params = dict(params or {})
+    query = urlparse(url).query
+    for pair in query.split("&"):
+        if "=" in pair:
+            k, v = pair.split("=", 1)
+            params.setdefault(k, requests.utils.unquote(v))
+    # POST 본문: form 문자열(a=b&c=d)은 파라미터처럼, dict/JSON은 재귀 탐색
+    if isinstance(body, str):
+        for k, v in parse_qsl(body):
+            params.setdefault(k, v)
+        body = None
+    for name in KEYWORD_PARAMS:
+        if params.get(name):
+            return str(params[name])
+    return _find_keyword(body) or "_"
+
+
+def _slug(text):
+    return re.sub(r"[^0-9A-Za-z가-힣]+", "_", text).strip("_") or "_"
+
+
+class FixtureStore:
+    """
+    스크래퍼 원본 응답 기록/재생
+    - 기록: <FIXTURE_DIR>/<host>/<keyword>/<key>.json(메타) + <key>.body(원본 바이트)
+    - 재생: 같은 요청에 대해 기록된 응답을 requests.Response로 돌려줌 (네트워크/속도 제한 없음)
+    """
+
+    def __init__(self, fixture_dir=None):
+        self.fixture_dir = fixture_dir or Config.FIXTURE_DIR
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.served = 0
+
+    def _base_path(self, method, url, params, json_body, data=None):
+        body = json_body if json_body is not None else data
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", "replace")
+        key = cache_key(method, url, params, body)
+        folder = os.path.join(self.fixture_dir, urlparse(url).netloc, _slug(_keyword_of(url, params, body)))
+        return folder, os.path.join(folder, key)
+
+    def save(self, method, url, params, json_body, response, data=None):
+        folder, base = self._base_path(method, url, params, json_body, data)
+        meta = {
+            "method": method,
+            "url": response.url or url,
+            "params": params,
+            "json": json_body,
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() in ("content-type", "etag", "last-modified")},
+            "encoding": response.encoding,
+            "stored_at": 0
+        }
+        with self._lock:
+            os.makedirs(folder, exist_ok=True)
+            with open(base + ".body", "wb") as f:
+                f.write(response.content)
+            with open(base + ".json", "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+            self.recorded += 1
+
+    def load(self, method, url, params, json_body, data=None):
+        _, base = self._base_path(method, url, params, json_body, data)
+        try:
+            with open(base + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(base + ".body", "rb") as f:
+                body = f.read()
+        except OSError:
+            raise FixtureNotFound(f"No fixture recorded for {method} {url} {params or ''}")
+        with self._lock:
+            self.served += 1
+        response = CachedEntry(meta, body).to_response()
+        response.from_cache = False
+        return response
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_fixture_store():
+    """기록/재생 모드일 때만 픽스처 저장소 반환 (live 모드에서는 None)"""
+    global _store
+    if Config.HTTP_MODE not in ("record", "replay"):
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = FixtureStore()
+        return _store
@@ -0,0 +1,59 @@
+from bs4 import BeautifulSoup, SoupStrainer
+from src.config import Config
+from src.scraper.strategy_cache import get_strategy_cache
+
+
+def _detect_backend():
+    """
+    HTML 파서 백엔드 선택 (HTML_PARSER 환경변수: auto | lxml | html.parser)
+    auto: lxml이 설치되어 있으면 사용 (html.parser 대비 수 배 빠름), 없으면 html.parser
+    """
+    backend = Config.HTML_PARSER
+    if backend == "auto":
+        try:
+            import lxml  # noqa: F401
+            return "lxml"
+        except ImportError:
+            return "html.parser"
+    return backend
+
+
+PARSER_BACKEND = _detect_backend()
+
+
+def make_soup(response, site=None, only=None):
+    """
+    응답을 BeautifulSoup으로 파싱
+    - response.text 대신 원본 바이트 + 사이트별 선언 charset으로 디코딩 (requests의 인코딩 추측 생략)
+      charset이 없으면 문서의 <meta charset>을 사용
+    - only(SoupStrainer)가 주어지면 해당 요소의 하위 트리만 생성 (부분 파싱)
+    사용 후 soup.decompose()로 트리를 바로 해제할 것
+    """
+    charset = Config.SITE_CHARSETS.get(site) if site else None
+    return BeautifulSoup(response.content, PARSER_BACKEND, from_encoding=charset, parse_only=only)
+
+
+def strainer(*args, **kwargs):
+    return SoupStrainer(*args, **kwargs)
+
+
+def _text_of(element, min_length):
+    if element is None:
+        return None
+    text = element.get_text("\n", strip=True)
+    return text if len(text) >= min_length else None
+
+
+class FallbackText(str):
+    """selector가 하나도 맞지 않아 문서 전체에서 뽑은 본문 (메뉴/푸터 포함 → 본문 캐시에 저장하지 않음)"""
+
+
+def extract_main_text(soup, key, selectors, min_length=50):
+    """
+    상세 페이지 본문 텍스트 (줄 단위)
+    selectors 중 지난번 성공한 것부터 시도하고, 모두 실패하면 문서 전체 텍스트(FallbackText) 사용
+    """
+    _, text = get_strategy_cache().first_success(
+        key, selectors, lambda selector: _text_of(soup.select_one(selector), min_length)
+    )
+    return text if text is not None else FallbackText(soup.get_text("\n", strip=True))
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.config import Config
+
+
+def cache_key(method, url, params=None, json_body=None):
+    """URL + 파라미터(+ POST 본문)로 캐시 키 생성 (파라미터 순서와 무관)"""
+    raw = json.dumps([
+        method.upper(),
+        url,
+        sorted((str(k), str(v)) for k, v in (params or {}).items()),
+        json_body
+    ], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CachedEntry:
+    def __init__(self, meta, body):
+        self.meta = meta
+        self.body = body
+
+    def is_fresh(self, ttl):
+        return time.time() - self.meta["stored_at"] < ttl
+
+    def validators(self):
+        """조건부 요청 헤더 (ETag / Last-Modified)"""
+        headers = {}
+        if self.meta.get("etag"):
+            headers["If-None-Match"] = self.meta["etag"]
+        if self.meta.get("last_modified"):
+            headers["If-Modified-Since"] = self.meta["last_modified"]
+        return headers
+
+    def to_response(self):
+        """저장된 본문으로 requests.Response를 재구성 (스크래퍼 코드는 그대로 사용 가능)"""
+        response = requests.Response()
+        response.status_code = self.meta["status"]
+        response._content = self.body
+        response.headers = CaseInsensitiveDict(self.meta.get("headers", {}))
+        response.encoding = self.meta.get("encoding")
+        response.url = self.meta["url"]
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """
+    목록 페이지용 디스크 응답 캐시
+    - 키별로 <key>.body(원본 바이트) + <key>.json(메타: ETag, Last-Modified, 저장 시각) 저장
+    - 호스트별 TTL 안에서는 네트워크 없이 재사용, 이후에는 조건부 요청으로 재검증
+    - 전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU, 파일 mtime 기준)
+    - 디렉터리 하나로 구성되어 GitHub Actions cache로 그대로 보존 가능
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = cache_dir or Config.HTTP_CACHE_DIR
+        self.max_bytes = max_bytes or Config.HTTP_CACHE_MAX_BYTES
+        self._lock = threading.Lock()
+        self._total_bytes = None
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def ttl_for(self, host):
+        return Config.HTTP_CACHE_TTL.get(host, Config.HTTP_CACHE_TTL["default"])
+
+    def _paths(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json"), os.path.join(self.cache_dir, f"{key}.body")
+
+    def get(self, key):
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        # 본문 크기가 메타와 다르면 (중단된 쓰기 등) 손상된 항목 → 캐시 미스로 처리
+        if meta.get("size", len(body)) != len(body):
+            return None
+        # LRU: 사용 시각 갱신
+        now = time.time()
+        try:
+            os.utime(meta_path, (now, now))
+        except OSError:
+            pass
+        return CachedEntry(meta, body)
+
+    def put(self, key, response):
+        meta = {
+            "url": response.url,
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() in ("content-type", "etag", "last-modified")},
+            "encoding": response.encoding,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "stored_at": time.time()
+        }
+        body = response.content
+        meta["size"] = len(body)
+        meta_path, body_path = self._paths(key)
+        with self._lock:
+            old_size = self._entry_size(key)
+            # 본문 → 메타 순서로 임시 파일에 쓰고 교체 (중단/동시 읽기 시 잘린 본문이 유효한 메타와 짝지어지지 않도록)
+            self._write(body_path, body)
+            self._write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+            if self._total_bytes is not None:
+                self._total_bytes += self._entry_size(key) - old_size
+            self._evict_if_needed()
+
+    def touch(self, key, entry):
+        """304 Not Modified 응답 시 저장 시각만 갱신"""
+        entry.meta["stored_at"] = time.time()
+        meta_path, _ = self._paths(key)
+        with self._lock:
+            self._write(meta_path, json.dumps(entry.meta, ensure_ascii=False).encode("utf-8"))
+
+    @staticmethod
+    def _write(path, data):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _entry_size(self, key):
+        size = 0
+        for path in self._paths(key):
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        return size
+
+    def _evict_if_needed(self):
+        if self._total_bytes is None:
+            self._total_bytes = sum(
+                os.path.getsize(os.path.join(self.cache_dir, name)) for name in os.listdir(self.cache_dir)
+            )
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        # 메타 파일 mtime(마지막 사용 시각)이 오래된 순으로 삭제
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".json"):
+                key = name[:-5]
+                entries.append((os.path.getmtime(os.path.join(self.cache_dir, name)), key))
+        entries.sort()
+
+        for _, key in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            size = self._entry_size(key)
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes -= size
+
+    def stats(self):
+        return f"hit {self.hits}, revalidated {self.revalidated}, miss {self.misses}"
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """프로세스 전역 응답 캐시 (비활성화 시 None)"""
+    global _cache
+    if not Config.HTTP_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
@@ -1,9 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
-import time
-import random
 import urllib.parse
 import re
+from src.logic.deadline_normalizer import DeadlineNormalizer
+from src.scraper.concurrency import iter_keywords
+from src.scraper.html_parser import extract_main_text, make_soup, strainer
+from src.scraper.pagination import crawl_pages, page_budget
+from src.scraper.strategy_cache import get_strategy_cache
+from src.scraper.stream import unique_jobs
+from src.scraper.transport import HttpClient
 
 class IncruitScraper:
     """
@@ -12,6 +15,9 @@ class IncruitScraper:
     """
     BASE_URL = "https://job.incruit.com"
     SEARCH_URL = "https://job.incruit.com/jobdb_list/searchjob.asp"
+    BODY_STRAINER = strainer("body")
+    DETAIL_SELECTORS = ["#content_job", ".job_info_detail", ".jobpost_cont", "#incruit_contents"]
+    PAGE_SIZE = 30  # 검색 목록 한 페이지 공고 수 (startno 증가 단위)
 
     def __init__(self):
         self.headers = {
@@ -22,124 +28,128 @@ class IncruitScraper:
             "Connection": "keep-alive",
             "Referer": "https://job.incruit.com/"
         }
-        self.session = requests.Session()
-
-    def search(self, keywords):
+        self.http = HttpClient(self.headers)
+
+    def search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        return list(unique_jobs(self.iter_search(keywords, max_workers, known_ids, observer)))
+
+    def iter_search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        """파싱되는 대로 공고를 하나씩 내보냄 (id 중복 제거는 소비하는 쪽의 스트리밍 단계에서)"""
+        for job in iter_keywords(lambda keyword: self._crawl_keyword(keyword, known_ids), keywords, max_workers, observer):
+            # 마감일을 수집 시점에 한 번만 정규화 (deadline_date / deadline_kind)
+            DeadlineNormalizer.apply(job)
+            yield job
+
+    def _crawl_keyword(self, keyword, known_ids):
+        """최신순 페이지를 이미 저장된 공고가 나올 때까지 순회 (페이지 예산 내)"""
+        jobs, pages = crawl_pages(
+            lambda page: self._search_keyword(keyword, page), known_ids, page_budget("Incruit"), None
+        )
+        print(f"  Incruit '{keyword}': {len(jobs)} jobs from {pages} page(s)")
+        return jobs
+
+    def _search_keyword(self, keyword, page=1):
         results = []
+        print(f"Searching Incruit for: {keyword} (page {page})")
+        try:
+            # 인크루트 검색 파라미터
+            params = {
+                "col": "job_all",
+                "kw": keyword,
+                "oession1": "4",  # 신입
+                "sortfield": "reg",  # 최신순
+                "startno": (page - 1) * self.PAGE_SIZE
+            }
+
+            response = self.http.get(self.SEARCH_URL, params=params)
+
+            if response.status_code == 200:
+                # 링크의 부모 요소(회사명/마감일)가 필요하므로 <body> 하위만 파싱
+                soup = make_soup(response, "Incruit", only=self.BODY_STRAINER)
+
+                # 채용공고 목록 찾기
+                # 인크루트 구조: jobpost.asp?job= 패턴의 링크
+                job_links = soup.find_all('a', href=re.compile(r'jobpost\.asp\?job='))
+
+                seen_ids = set()
+                for link in job_links:
+                    try:
+                        href = link.get('href', '')
+
+                        # job ID 추출
+                        match = re.search(r'job=(\d+)', href)
+                        if not match:
+                            continue
 
-        for keyword in keywords:
-            print(f"Searching Incruit for: {keyword}")
-            try:
-                # 인크루트 검색 파라미터
-                params = {
-                    "col": "job_all",
-                    "kw": keyword,
-                    "oession1": "4",  # 신입
-                    "sortfield": "reg"  # 최신순
-                }
-
-                response = self.session.get(
-                    self.SEARCH_URL,
-                    params=params,
-                    headers=self.headers,
-                    timeout=15
-                )
-
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
-
-                    # 채용공고 목록 찾기
-                    # 인크루트 구조: jobpost.asp?job= 패턴의 링크
-                    job_links = soup.find_all('a', href=re.compile(r'jobpost\.asp\?job='))
-
-                    seen_ids = set()
-                    for link in job_links:
-                        try:
-                            href = link.get('href', '')
-
-                            # job ID 추출
-                            match = re.search(r'job=(\d+)', href)
-                            if not match:
-                                continue
-
-                            job_id = match.group(1)
-                            if job_id in seen_ids:
-                                continue
-                            seen_ids.add(job_id)
-
-                            # 제목 추출
-                            title = link.get_text(strip=True)
-                            if len(title) < 5:
-                                # 부모 요소에서 제목 찾기
-                                parent = link.find_parent(['li', 'div', 'tr'])
-                                if parent:
-                                    title_tag = parent.find(['strong', 'h3', 'h4', 'span'])
-                                    if title_tag:
-                                        title = title_tag.get_text(strip=True)
-
-                            if len(title) < 5:
-                                continue
-
-                            # 회사명 찾기
-                            company = ""
+                        job_id = match.group(1)
+                        if job_id in seen_ids:
+                            continue
+                        seen_ids.add(job_id)
+
+                        # 제목 추출
+                        title = link.get_text(strip=True)
+                        if len(title) < 5:
+                            # 부모 요소에서 제목 찾기
                             parent = link.find_parent(['li', 'div', 'tr'])
                             if parent:
-                                company_link = parent.find('a', href=re.compile(r'/company/\d+'))
-                                if company_link:
-                                    company = company_link.get_text(strip=True)
+                                title_tag = parent.find(['strong', 'h3', 'h4', 'span'])
+                                if title_tag:
+                                    title = title_tag.get_text(strip=True)
 
-                            # 마감일 찾기
-                            deadline = ""
-                            if parent:
-                                date_patterns = [
-                                    r'~\s*(\d{2}\.\d{2}\.\d{2})',
-                                    r'(\d{4}-\d{2}-\d{2})',
-                                    r'(\d{2}/\d{2}/\d{2})'
-                                ]
-                                parent_text = parent.get_text()
-                                for pattern in date_patterns:
-                                    match = re.search(pattern, parent_text)
-                                    if match:
-                                        deadline = match.group(1)
-                                        break
-
-                            # 전체 URL 생성
-                            full_link = href if href.startswith('http') else f"{self.BASE_URL}/jobdb_info/{href}"
-
-                            results.append({
-                                "id": f"incruit_{job_id}",
-                                "site": "Incruit",
-                                "title": title[:100],
-                                "company": company or "확인필요",
-                                "link": full_link,
-                                "deadline": deadline,
-                                "hidden_keyword": keyword
-                            })
-
-                        except Exception as e:
+                        if len(title) < 5:
                             continue
 
-                    if not job_links:
-                        # 대체 셀렉터 시도
-                        self._fallback_parse(soup, keyword, results)
-
-                else:
-                    print(f"  Incruit: HTTP {response.status_code}")
+                        # 회사명 찾기
+                        company = ""
+                        parent = link.find_parent(['li', 'div', 'tr'])
+                        if parent:
+                            company_link = parent.find('a', href=re.compile(r'/company/\d+'))
+                            if company_link:
+                                company = company_link.get_text(strip=True)
+
+                        # 마감일 찾기
+                        deadline = ""
+                        if parent:
+                            date_patterns = [
+                                r'~\s*(\d{2}\.\d{2}\.\d{2})',
+                                r'(\d{4}-\d{2}-\d{2})',
+                                r'(\d{2}/\d{2}/\d{2})'
+                            ]
+                            parent_text = parent.get_text()
+                            for pattern in date_patterns:
+                                match = re.search(pattern, parent_text)
+                                if match:
+                                    deadline = match.group(1)
+                                    break
+
+                        # 전체 URL 생성
+                        full_link = href if href.startswith('http') else f"{self.BASE_URL}/jobdb_info/{href}"
+
+                        results.append({
+                            "id": f"incruit_{job_id}",
+                            "site": "Incruit",
+                            "title": title[:100],
+                            "company": company or "확인필요",
+                            "link": full_link,
+                            "deadline": deadline,
+                            "hidden_keyword": keyword
+                        })
+
+                    except Exception as e:
+                        continue
 
-                time.sleep(random.uniform(1, 2))
+                if not job_links and page == 1:
+                    # 대체 셀렉터 시도 (해시 id라 다음 페이지 순회에는 사용하지 않음)
+                    self._fallback_parse(soup, keyword, results)
+                soup.decompose()
 
-            except Exception as e:
-                print(f"Error scraping Incruit for {keyword}: {e}")
+            else:
+                print(f"  Incruit: HTTP {response.status_code}")
 
-        # 중복 제거
-        seen = set()
-        unique_results = []
-        for job in results:
-            if job['id'] not in seen:
-                seen.add(job['id'])
-                unique_results.append(job)
+        except Exception as e:
+            print(f"Error scraping Incruit for {keyword}: {e}")
 
-        return unique_results
+        return results
 
     def _fallback_parse(self, soup, keyword, results):
         """대체 파싱 방법"""
@@ -153,13 +163,10 @@ class IncruitScraper:
                 ".card"
             ]
 
-            items = []
-            for selector in selectors:
-                items = soup.select(selector)
-                if items:
-                    break
+            # 지난번 성공한 셀렉터부터 시도
+            _, items = get_strategy_cache().first_success("Incruit:fallback", selectors, soup.select)
 
-            for item in items[:20]:
+            for item in (items or [])[:20]:
                 try:
                     link_tag = item.find('a', href=True)
                     if not link_tag:
@@ -189,4 +196,15 @@ class IncruitScraper:
             print(f"  Incruit fallback failed: {e}")
 
     def get_details(self, url):
-        return ""
+        """상세 본문 텍스트 (요청 실패 시 None)"""
+        try:
+            response = self.http.get(url, cache=False)
+            if response.status_code != 200:
+                return None
+            soup = make_soup(response, "Incruit", only=self.BODY_STRAINER)
+            text = extract_main_text(soup, "Incruit:detail", self.DETAIL_SELECTORS)
+            soup.decompose()
+            return text
+        except Exception as e:
+            print(f"  Incruit detail failed ({url}): {e}")
+            return None
@@ -1,8 +1,10 @@
-import requests
-from bs4 import BeautifulSoup
-import time
-import random
 import re
+from src.logic.deadline_normalizer import DeadlineNormalizer
+from src.scraper.concurrency import iter_keywords
+from src.scraper.html_parser import extract_main_text, make_soup, strainer
+from src.scraper.strategy_cache import get_strategy_cache
+from src.scraper.stream import unique_jobs
+from src.scraper.transport import HttpClient
 
 class JasoseolScraper:
     """
@@ -11,6 +13,9 @@ class JasoseolScraper:
     """
     BASE_URL = "https://jasoseol.com"
     RECRUIT_URL = "https://jasoseol.com/recruit"
+    BODY_STRAINER = strainer("body")
+    LINK_STRAINER = strainer("a", href=True)
+    DETAIL_SELECTORS = [".recruit-detail", "[class*='detail']", "article", "main"]
     
     def __init__(self):
         self.headers = {
@@ -19,24 +24,37 @@ class JasoseolScraper:
             "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
             "Referer": "https://jasoseol.com/"
         }
-        self.session = requests.Session()
+        self.http = HttpClient(self.headers)
 
-    def search(self, keywords):
-        results = []
+    def search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        jobs = list(unique_jobs(self.iter_search(keywords, max_workers, known_ids, observer)))
+        print(f"  Jasoseol: Total {len(jobs)} jobs collected")
+        return jobs
+
+    def iter_search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        """메인 목록 → 키워드 검색 순서로 파싱되는 대로 공고를 하나씩 내보냄 (id 중복 제거는 소비하는 쪽에서)"""
+        for job in self._parse_main_page(keywords):
+            # 마감일을 수집 시점에 한 번만 정규화 (deadline_date / deadline_kind)
+            DeadlineNormalizer.apply(job)
+            yield job
         
+        # 키워드별 검색도 시도
+        for job in iter_keywords(self._search_keyword, keywords[:5], max_workers, observer):  # 처음 5개 키워드만
+            DeadlineNormalizer.apply(job)
+            yield job
+    
+    def _parse_main_page(self, keywords):
+        """메인 채용공고 페이지 한 장 파싱"""
         # 먼저 메인 채용공고 페이지에서 전체 목록 가져오기
         print(f"Searching Jasoseol: Fetching main recruit page...")
+        results = []
         
         try:
             # 메인 페이지 접근
-            response = self.session.get(
-                self.RECRUIT_URL, 
-                headers=self.headers, 
-                timeout=15
-            )
+            response = self.http.get(self.RECRUIT_URL)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = make_soup(response, "Jasoseol", only=self.BODY_STRAINER)
                 
                 # 다양한 셀렉터 시도
                 selectors = [
@@ -50,14 +68,12 @@ class JasoseolScraper:
                     ".item"
                 ]
                 
-                items = []
-                for selector in selectors:
-                    items = soup.select(selector)
-                    if len(items) > 3:  # 최소 3개 이상 찾아야 유효
-                        print(f"  Jasoseol: Found {len(items)} items with selector '{selector}'")
-                        break
-                
+                # 지난번 성공한 셀렉터부터 시도 (실패할 때만 나머지 셀렉터 순회)
+                selector, items = get_strategy_cache().first_success(
+                    "Jasoseol:list", selectors, lambda selector: self._select_items(soup, selector)
+                )
                 if items:
+                    print(f"  Jasoseol: Found {len(items)} items with selector '{selector}'")
                     for item in items:
                         try:
                             job_data = self._parse_item(item, keywords)
@@ -69,33 +85,37 @@ class JasoseolScraper:
                     # 폴백: 모든 링크에서 채용공고 찾기
                     print(f"  Jasoseol: Trying link-based parsing...")
                     results.extend(self._parse_links(soup, keywords))
+                soup.decompose()
                     
         except Exception as e:
             print(f"Error fetching Jasoseol main page: {e}")
-        
-        # 키워드별 검색도 시도
-        for keyword in keywords[:5]:  # 처음 5개 키워드만
-            try:
-                search_url = f"{self.RECRUIT_URL}?keyword={keyword}"
-                response = self.session.get(search_url, headers=self.headers, timeout=10)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    
-                    # 링크 기반 파싱
-                    for a_tag in soup.find_all('a', href=True):
-                        href = a_tag.get('href', '')
-                        if '/recruit/' in href and href != '/recruit/':
-                            job_data = self._extract_from_link(a_tag, keyword)
-                            if job_data and job_data['id'] not in [r['id'] for r in results]:
-                                results.append(job_data)
-                
-                time.sleep(random.uniform(0.5, 1))
-                
-            except Exception as e:
-                continue
-        
-        print(f"  Jasoseol: Total {len(results)} jobs collected")
+        return results
+    
+    @staticmethod
+    def _select_items(soup, selector):
+        items = soup.select(selector)
+        return items if len(items) > 3 else None  # 최소 3개 이상 찾아야 유효
+    
+    def _search_keyword(self, keyword):
+        """키워드 검색 페이지 링크 기반 파싱"""
+        results = []
+        try:
+            search_url = f"{self.RECRUIT_URL}?keyword={keyword}"
+            response = self.http.get(search_url)
+            
+            if response.status_code == 200:
+                # 링크 기반 파싱 - <a href> 태그만 파싱
+                soup = make_soup(response, "Jasoseol", only=self.LINK_STRAINER)
+                for a_tag in soup.find_all('a', href=True):
+                    href = a_tag.get('href', '')
+                    if '/recruit/' in href and href != '/recruit/':
+                        job_data = self._extract_from_link(a_tag, keyword)
+                        if job_data:
+                            results.append(job_data)
+                soup.decompose()
+            
+        except Exception as e:
+            pass
         return results
     
     def _parse_item(self, item, keywords):
@@ -246,4 +266,15 @@ class JasoseolScraper:
             return None
 
     def get_details(self, url):
-        return ""
+        """상세 본문 텍스트 (요청 실패 시 None)"""
+        try:
+            response = self.http.get(url, cache=False)
+            if response.status_code != 200:
+                return None
+            soup = make_soup(response, "Jasoseol", only=self.BODY_STRAINER)
+            text = extract_main_text(soup, "Jasoseol:detail", self.DETAIL_SELECTORS)
+            soup.decompose()
+            return text
+        except Exception as e:
+            print(f"  Jasoseol detail failed ({url}): {e}")
+            return None
@@ -1,14 +1,20 @@
-import requests
-from bs4 import BeautifulSoup
-import time
-import random
 import re
+from src.logic.deadline_normalizer import DeadlineNormalizer
+from src.scraper.concurrency import iter_keywords
+from src.scraper.html_parser import extract_main_text, make_soup, strainer
+from src.scraper.pagination import crawl_pages, page_budget
+from src.scraper.stream import unique_jobs
+from src.scraper.transport import HttpClient
 
 class JobKoreaScraper:
     """
     잡코리아 스크래퍼 (2025년 최신 구조 대응)
     """
     BASE_URL = "https://www.jobkorea.co.kr/Search/"
+    BODY_STRAINER = strainer("body")
+    # 공고 상세는 iframe 문서(GI_Read_Comt_Ifrm)에 있음
+    DETAIL_URL = "https://www.jobkorea.co.kr/Recruit/GI_Read_Comt_Ifrm"
+    DETAIL_SELECTORS = ["#detail-content", ".tbDetail", ".view-content", ".artReadDetail"]
 
     def __init__(self):
         self.headers = {
@@ -19,102 +25,107 @@ class JobKoreaScraper:
             "Connection": "keep-alive",
             "Referer": "https://www.jobkorea.co.kr/"
         }
-        self.session = requests.Session()
-
-    def search(self, keywords):
+        self.http = HttpClient(self.headers)
+
+    def search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        return list(unique_jobs(self.iter_search(keywords, max_workers, known_ids, observer)))
+
+    def iter_search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        """파싱되는 대로 공고를 하나씩 내보냄 (id 중복 제거는 소비하는 쪽의 스트리밍 단계에서)"""
+        for job in iter_keywords(lambda keyword: self._crawl_keyword(keyword, known_ids), keywords, max_workers, observer):
+            # 마감일을 수집 시점에 한 번만 정규화 (deadline_date / deadline_kind)
+            DeadlineNormalizer.apply(job)
+            yield job
+
+    def _crawl_keyword(self, keyword, known_ids):
+        """최신순 페이지를 이미 저장된 공고가 나올 때까지 순회 (페이지 예산 내)"""
+        jobs, pages = crawl_pages(
+            lambda page: self._search_keyword(keyword, page), known_ids, page_budget("JobKorea"), None
+        )
+        print(f"  JobKorea '{keyword}': {len(jobs)} jobs from {pages} page(s)")
+        return jobs
+
+    def _search_keyword(self, keyword, page=1):
         results = []
-        for keyword in keywords:
-            print(f"Searching JobKorea for: {keyword}")
-            try:
-                params = {
-                    "stext": keyword,
-                    "careerType": "1",  # 신입
-                    "tabType": "recruit",
-                    "Page_No": "1"
-                }
-
-                response = self.session.get(
-                    self.BASE_URL,
-                    params=params,
-                    headers=self.headers,
-                    timeout=15
-                )
-
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
-
-                    # 채용공고 링크 찾기 (제목이 있는 링크만)
-                    job_links = soup.find_all('a', href=lambda x: x and '/Recruit/GI_Read/' in x)
-
-                    seen_ids = set()
-                    for link in job_links:
-                        try:
-                            href = link.get('href', '')
-                            title = link.get_text(strip=True)
-
-                            # 제목이 너무 짧으면 (회사 로고 등) 스킵
-                            if len(title) < 10:
-                                continue
-
-                            # ID 추출
-                            id_match = re.search(r'GI_Read/(\d+)', href)
-                            if not id_match:
-                                continue
-                            job_id = id_match.group(1)
-
-                            if job_id in seen_ids:
-                                continue
-                            seen_ids.add(job_id)
-
-                            # 부모 컨테이너 찾기 (2-3레벨 위)
-                            container = link.parent
-                            for _ in range(3):
-                                if container.parent:
-                                    container = container.parent
-
-                            container_text = container.get_text(separator='|', strip=True)
-
-                            # 회사명 추출
-                            company = self._extract_company(container, container_text)
-
-                            # 마감일 추출
-                            deadline = self._extract_deadline(container_text)
-
-                            # 전체 URL
-                            full_link = href if href.startswith('http') else f"https://www.jobkorea.co.kr{href}"
-
-                            results.append({
-                                "id": f"jk_{job_id}",
-                                "site": "JobKorea",
-                                "title": title[:100],
-                                "company": company or "확인필요",
-                                "link": full_link,
-                                "deadline": deadline,
-                                "hidden_keyword": keyword
-                            })
-
-                        except Exception as e:
+        print(f"Searching JobKorea for: {keyword} (page {page})")
+        try:
+            params = {
+                "stext": keyword,
+                "careerType": "1",  # 신입
+                "tabType": "recruit",
+                "Ord": "RegDtDesc",  # 최신 등록순
+                "Page_No": str(page)
+            }
+
+            response = self.http.get(self.BASE_URL, params=params)
+
+            if response.status_code == 200:
+                # 공고 카드의 상위 컨테이너를 거슬러 올라가야 하므로 <body> 하위만 파싱 (<head> 스크립트/스타일 생략)
+                soup = make_soup(response, "JobKorea", only=self.BODY_STRAINER)
+
+                # 채용공고 링크 찾기 (제목이 있는 링크만)
+                job_links = soup.find_all('a', href=lambda x: x and '/Recruit/GI_Read/' in x)
+
+                seen_ids = set()
+                for link in job_links:
+                    try:
+                        href = link.get('href', '')
+                        title = link.get_text(strip=True)
+
+                        # 제목이 너무 짧으면 (회사 로고 등) 스킵
+                        if len(title) < 10:
+                            continue
+
+                        # ID 추출
+                        id_match = re.search(r'GI_Read/(\d+)', href)
+                        if not id_match:
                             continue
+                        job_id = id_match.group(1)
+
+                        if job_id in seen_ids:
+                            continue
+                        seen_ids.add(job_id)
+
+                        # 부모 컨테이너 찾기 (2-3레벨 위)
+                        container = link.parent
+                        for _ in range(3):
+                            if container.parent:
+                                container = container.parent
 
-                    print(f"  JobKorea: {len(seen_ids)} jobs collected")
+                        container_text = container.get_text(separator='|', strip=True)
 
-                else:
-                    print(f"  JobKorea: HTTP {response.status_code}")
+                        # 회사명 추출
+                        company = self._extract_company(container, container_text)
 
-                time.sleep(random.uniform(1.5, 3))
+                        # 마감일 추출
+                        deadline = self._extract_deadline(container_text)
 
-            except Exception as e:
-                print(f"Error scraping JobKorea for {keyword}: {e}")
+                        # 전체 URL
+                        full_link = href if href.startswith('http') else f"https://www.jobkorea.co.kr{href}"
 
-        # 중복 제거
-        seen = set()
-        unique_results = []
-        for job in results:
-            if job['id'] not in seen:
-                seen.add(job['id'])
-                unique_results.append(job)
+                        results.append({
+                            "id": f"jk_{job_id}",
+                            "site": "JobKorea",
+                            "title": title[:100],
+                            "company": company or "확인필요",
+                            "link": full_link,
+                            "deadline": deadline,
+                            "hidden_keyword": keyword
+                        })
 
-        return unique_results
+                    except Exception as e:
+                        continue
+
+                soup.decompose()
+                print(f"  JobKorea: {len(seen_ids)} jobs collected")
+
+            else:
+                print(f"  JobKorea: HTTP {response.status_code}")
+
+        except Exception as e:
+            print(f"Error scraping JobKorea for {keyword}: {e}")
+
+        return results
 
     def _extract_company(self, container, container_text):
         """회사명 추출"""
@@ -179,4 +190,19 @@ class JobKoreaScraper:
         return ""
 
     def get_details(self, url):
-        return ""
+        """상세 본문 텍스트 (요청 실패 시 None)"""
+        try:
+            match = re.search(r'GI_Read/(\d+)', url)
+            if match:
+                response = self.http.get(self.DETAIL_URL, params={"Gno": match.group(1)}, cache=False)
+            else:
+                response = self.http.get(url, cache=False)
+            if response.status_code != 200:
+                return None
+            soup = make_soup(response, "JobKorea", only=self.BODY_STRAINER)
+            text = extract_main_text(soup, "JobKorea:detail", self.DETAIL_SELECTORS)
+            soup.decompose()
+            return text
+        except Exception as e:
+            print(f"  JobKorea detail failed ({url}): {e}")
+            return None
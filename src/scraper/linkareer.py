@@ -1,19 +1,91 @@
-import requests
-import time
-import random
+import hashlib
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from src.logic.deadline_normalizer import DeadlineNormalizer
+from src.scraper.concurrency import iter_keywords
+from src.scraper.html_parser import extract_main_text, make_soup, strainer
+from src.scraper.pagination import crawl_pages, page_budget
+from src.scraper.strategy_cache import get_strategy_cache
+from src.scraper.stream import unique_jobs
+from src.scraper.transport import HttpClient
+
+KST = timezone(timedelta(hours=9))
+
+# 채용 공고 목록 GraphQL 문서
+# - 키워드 / 마감 전 공고 필터는 서버에서 적용, cursor(after) 기반 페이지 순회
+# - 화면에 필요한 필드만 요청 (마감일은 상태 문자열 대신 recruitCloseAt 날짜)
+ACTIVITIES_QUERY = """
+query RecruitActivities($filterBy: ActivityFilter, $first: Int, $after: String) {
+    activities(filterBy: $filterBy, first: $first, after: $after, orderBy: {field: CREATED_AT, direction: DESC}) {
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+        nodes {
+            id
+            title
+            organizationName
+            recruitCloseAt
+            deadlineStatus
+        }
+    }
+}
+"""
+
+
+# 기존(검증된) 질의 형태 - 페이지/서버 필터 없이 채용 타입 전체를 받고 키워드는 제목으로 매칭
+# 위 질의가 GraphQL 오류를 내면 (스키마 불일치 등) HTML 폴백 전에 이 형태로 재시도
+BASELINE_QUERY = """
+query GetRecruitActivities($filterBy: ActivityFilter) {
+    activities(filterBy: $filterBy) {
+        nodes {
+            id
+            title
+            organizationName
+            deadlineStatus
+        }
+    }
+}
+"""
+
+
+class GraphQLError(Exception):
+    """200 응답이지만 errors가 있거나 activities가 비어 있는 GraphQL 응답"""
+
+
+def _minify(document):
+    return " ".join(document.split())
+
 
 class LinkareerScraper:
     """
     링커리어 스크래퍼 (2025년 최신 API 구조 대응)
     대학생/취준생 대상 인턴, 신입 채용공고 수집
+    - GraphQL: 키워드별 서버 필터 + cursor 페이지 순회 (이미 저장된 공고만 나오는 페이지에서 중단)
+    - 질의 문서는 한 번만 압축/해시하고 persisted query(해시만 전송)를 지원하면 본문 없이 요청
     """
     BASE_URL = "https://linkareer.com/list/recruit"
     API_URL = "https://api.linkareer.com/graphql"
 
     # 채용 타입 ID (링커리어 내부 분류)
     RECRUIT_TYPE_ID = "5"
+    PAGE_SIZE = 50
+
+    QUERY = _minify(ACTIVITIES_QUERY)
+    BASELINE = _minify(BASELINE_QUERY)
+    QUERY_HASHES = {document: hashlib.sha256(document.encode("utf-8")).hexdigest() for document in (QUERY, BASELINE)}
+    # persisted query 지원 여부 (None: 미확인) - 프로세스 내 모든 요청이 공유
+    persisted_query_supported = None
+    # 페이지 질의(ACTIVITIES_QUERY) 사용 가능 여부 (False면 이후 키워드는 바로 기존 질의 사용)
+    paged_query_supported = None
+
+    DETAIL_STRAINER = strainer("body")
+    DETAIL_SELECTORS = ["#DETAIL", "[class*='ActivityDetail']", "[class*='detail']", "article", "main"]
+    FALLBACK_STRAINER = strainer(lambda name, attrs: name == "a" or attrs.get("id") == "__NEXT_DATA__")
 
     def __init__(self):
+        self._baseline_nodes = None
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "application/json",
@@ -21,167 +93,279 @@ class LinkareerScraper:
             "Origin": "https://linkareer.com",
             "Referer": "https://linkareer.com/list/recruit"
         }
-
-    def search(self, keywords):
+        self.http = HttpClient(self.headers)
+
+    def search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        return list(unique_jobs(self.iter_search(keywords, max_workers, known_ids, observer)))
+
+    def iter_search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        """파싱되는 대로 공고를 하나씩 내보냄 (id 중복 제거는 소비하는 쪽의 스트리밍 단계에서)"""
+        for job in iter_keywords(lambda keyword: self._crawl_keyword(keyword, known_ids), keywords, max_workers, observer):
+            # 마감일을 수집 시점에 한 번만 정규화 (deadline_date / deadline_kind)
+            DeadlineNormalizer.apply(job)
+            yield job
+
+    def _crawl_keyword(self, keyword, known_ids):
+        """cursor 기반 페이지를 이미 저장된 공고가 나올 때까지 순회 (페이지 예산 내)"""
+        if LinkareerScraper.paged_query_supported is False:
+            jobs = self._search_baseline(keyword)
+            print(f"  Linkareer '{keyword}': {len(jobs)} jobs (baseline query)")
+            return jobs
+
+        cursor = {"after": None, "has_next": True}
+
+        def fetch_page(page):
+            if not cursor["has_next"]:
+                return []
+            jobs, cursor["after"], cursor["has_next"] = self._search_keyword(keyword, cursor["after"], page)
+            return jobs
+
+        jobs, pages = crawl_pages(fetch_page, known_ids, page_budget("Linkareer"))
+        print(f"  Linkareer '{keyword}': {len(jobs)} jobs from {pages} page(s)")
+        return jobs
+
+    def _search_keyword(self, keyword, after=None, page=1):
+        """GraphQL 한 페이지 조회 → (공고 목록, 다음 cursor, 다음 페이지 여부)"""
         results = []
-
-        print(f"Searching Linkareer for all keywords...")
+        print(f"Searching Linkareer for: {keyword} (page {page})")
         try:
-            # 링커리어 GraphQL API - 채용 타입만 필터링
-            query = {
-                "query": """
-                query GetRecruitActivities($filterBy: ActivityFilter) {
-                    activities(filterBy: $filterBy) {
-                        nodes {
-                            id
-                            title
-                            organizationName
-                            deadlineStatus
-                        }
-                    }
-                }
-                """,
-                "variables": {
-                    "filterBy": {
-                        "activityTypeID": self.RECRUIT_TYPE_ID
-                    }
-                }
+            variables = {
+                "filterBy": {
+                    "activityTypeID": self.RECRUIT_TYPE_ID,
+                    "keyword": keyword,
+                    "status": "OPEN"  # 마감 전 공고만
+                },
+                "first": self.PAGE_SIZE,
+                "after": after
             }
-
-            response = requests.post(self.API_URL, json=query, headers=self.headers, timeout=15)
-
-            if response.status_code == 200:
-                data = response.json()
-                nodes = data.get('data', {}).get('activities', {}).get('nodes', [])
-
-                print(f"  Linkareer: Retrieved {len(nodes)} recruit postings")
-
-                for node in nodes:
-                    try:
-                        job_id = node.get('id', '')
-                        title = node.get('title', '')
-                        company = node.get('organizationName', '')
-                        deadline = node.get('deadlineStatus', '')
-
-                        if not title:
-                            continue
-
-                        # 키워드 매칭
-                        matched_keyword = ""
-                        title_lower = title.lower()
-                        for kw in keywords:
-                            if kw.lower() in title_lower:
-                                matched_keyword = kw
-                                break
-
-                        link = f"https://linkareer.com/activity/{job_id}"
-
-                        results.append({
-                            "id": f"linkareer_{job_id}",
-                            "site": "Linkareer",
-                            "title": title,
-                            "company": company,
-                            "link": link,
-                            "deadline": deadline if deadline else "",
-                            "hidden_keyword": matched_keyword or keywords[0] if keywords else ""
-                        })
-                    except Exception as e:
-                        continue
-            else:
-                print(f"  Linkareer: HTTP {response.status_code}, trying fallback...")
-                self._fallback_search(keywords, results)
-
-            time.sleep(random.uniform(1, 2))
+            activities = self._graphql(self.QUERY, variables)
+            LinkareerScraper.paged_query_supported = True
+            page_info = activities.get('pageInfo') or {}
+            results = self._nodes_to_jobs(activities.get('nodes') or [], keyword)
+            return results, page_info.get('endCursor'), bool(page_info.get('hasNextPage'))
 
         except Exception as e:
-            print(f"Error scraping Linkareer: {e}")
-            self._fallback_search(keywords, results)
-
-        # 중복 제거
-        seen = set()
-        unique_results = []
-        for job in results:
-            if job['id'] not in seen:
-                seen.add(job['id'])
-                unique_results.append(job)
+            print(f"Error scraping Linkareer for {keyword}: {e}")
+            if page > 1:
+                return results, None, False
+            if isinstance(e, GraphQLError) and LinkareerScraper.paged_query_supported is None:
+                # 스키마가 페이지 질의를 받지 않음 → 이번 실행은 기존 질의로 전환
+                LinkareerScraper.paged_query_supported = False
+                print(f"  Linkareer: paged query rejected, retrying with baseline query...")
+                return self._search_baseline(keyword), None, False
+            print(f"  Linkareer: trying fallback...")
+            self._fallback_search([keyword], results)
+            return results, None, False
+
+    def _search_baseline(self, keyword):
+        """기존 질의로 채용 공고 전체를 한 번 받아 (실행당 1회) 키워드가 제목에 있는 공고만 반환, 실패 시 HTML 폴백"""
+        results = []
+        try:
+            if self._baseline_nodes is None:
+                activities = self._graphql(self.BASELINE, {"filterBy": {"activityTypeID": self.RECRUIT_TYPE_ID}})
+                self._baseline_nodes = activities.get('nodes') or []
+                print(f"  Linkareer: Retrieved {len(self._baseline_nodes)} recruit postings")
+            nodes = [node for node in self._baseline_nodes if keyword.lower() in (node.get('title') or '').lower()]
+            return self._nodes_to_jobs(nodes, keyword)
+        except Exception as e:
+            print(f"Error scraping Linkareer (baseline query) for {keyword}: {e}")
+            print(f"  Linkareer: trying fallback...")
+            self._fallback_search([keyword], results)
+            return results
 
-        return unique_results
+    def _nodes_to_jobs(self, nodes, keyword):
+        results = []
+        for node in nodes:
+            try:
+                job_id = node.get('id', '')
+                title = node.get('title', '')
+                if not title:
+                    continue
+
+                results.append({
+                    "id": f"linkareer_{job_id}",
+                    "site": "Linkareer",
+                    "title": title,
+                    "company": node.get('organizationName', ''),
+                    "link": f"https://linkareer.com/activity/{job_id}",
+                    "deadline": self._format_deadline(node),
+                    "hidden_keyword": keyword
+                })
+            except Exception as e:
+                continue
+        return results
+
+    def _graphql(self, query, variables):
+        """
+        GraphQL 요청 → data.activities (errors가 있거나 activities가 null이면 GraphQLError)
+        persisted query를 지원하면 질의 본문 대신 해시만 전송
+        (해시 미등록이면 본문과 함께 한 번 더 보내 등록, 미지원 서버는 이후 본문만 전송)
+        오류 응답은 HTTP 캐시에 저장하지 않음 (_graphql_ok)
+        """
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": self.QUERY_HASHES[query]}}
+        if LinkareerScraper.persisted_query_supported is not False:
+            response = self.http.post(self.API_URL, json={"variables": variables, "extensions": extensions},
+                                      cache=True, cacheable=self._graphql_ok)
+            data = self._json_or_none(response)
+            errors = self._error_messages(data)
+            if response.status_code == 200 and data is not None and not errors:
+                LinkareerScraper.persisted_query_supported = True
+                return self._activities(data)
+            if "PersistedQueryNotFound" not in errors:
+                LinkareerScraper.persisted_query_supported = False
+
+        payload = {"query": query, "variables": variables}
+        if LinkareerScraper.persisted_query_supported is not False:
+            payload["extensions"] = extensions  # 해시 등록
+        response = self.http.post(self.API_URL, json=payload, cache=True, cacheable=self._graphql_ok)
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}")
+        data = self._json_or_none(response)
+        errors = self._error_messages(data)
+        if data is None or errors:
+            raise GraphQLError(errors or "invalid JSON response")
+        return self._activities(data)
+
+    @staticmethod
+    def _error_messages(data):
+        return " ".join(str(e.get('message', '')) for e in (data or {}).get('errors') or [])
+
+    @staticmethod
+    def _activities(data):
+        activities = (data.get('data') or {}).get('activities')
+        if not isinstance(activities, dict):
+            raise GraphQLError("data.activities is null")
+        return activities
+
+    @classmethod
+    def _graphql_ok(cls, response):
+        """HTTP 캐시 저장 조건 - 200이어도 errors가 있거나 data가 비어 있는 응답은 저장하지 않음"""
+        data = cls._json_or_none(response)
+        return isinstance(data, dict) and not data.get('errors') and bool(data.get('data'))
+
+    @staticmethod
+    def _json_or_none(response):
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _format_deadline(node):
+        """
+        recruitCloseAt(epoch ms 또는 ISO 문자열) → 한국 시간 기준 YYYY-MM-DD, 없으면 상태 문자열
+        시간대가 있는 ISO 문자열(예: ...T15:00:00Z = 다음날 00시 KST)은 KST로 변환 후 날짜를 취함
+        """
+        close_at = node.get('recruitCloseAt')
+        if isinstance(close_at, (int, float)):
+            return datetime.fromtimestamp(close_at / 1000, KST).strftime('%Y-%m-%d')
+        if isinstance(close_at, str) and close_at:
+            try:
+                parsed = datetime.fromisoformat(close_at.replace('Z', '+00:00'))
+            except ValueError:
+                return close_at[:10]
+            if parsed.tzinfo:
+                parsed = parsed.astimezone(KST)
+            return parsed.strftime('%Y-%m-%d')
+        return node.get('deadlineStatus') or ""
 
     def _fallback_search(self, keywords, results):
-        """HTML 파싱 폴백"""
+        """HTML 파싱 폴백 (__NEXT_DATA__ / 링크 중 지난번 성공한 방법부터 시도)"""
+        strategies = {
+            "next_data": self._parse_next_data,
+            "links": self._parse_activity_links
+        }
         try:
-            from bs4 import BeautifulSoup
-
-            for keyword in keywords[:3]:  # 처음 3개 키워드만
+            for keyword in keywords:
                 search_url = f"https://linkareer.com/list/recruit?filterBy_keyword={keyword}"
-                response = requests.get(search_url, headers=self.headers, timeout=10)
+                response = self.http.get(search_url)
 
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
-
-                    # __NEXT_DATA__에서 데이터 추출 시도
-                    script = soup.find("script", id="__NEXT_DATA__")
-                    if script:
-                        import json
-                        try:
-                            data = json.loads(script.string)
-                            # Next.js 데이터 구조 탐색
-                            props = data.get('props', {}).get('pageProps', {})
-                            activities = props.get('activities', [])
-
-                            for act in activities:
-                                job_id = act.get('id', str(hash(act.get('title', ''))))
-                                title = act.get('title', '')
-                                company = act.get('organizationName', '')
-
-                                if title:
-                                    results.append({
-                                        "id": f"linkareer_{job_id}",
-                                        "site": "Linkareer",
-                                        "title": title,
-                                        "company": company,
-                                        "link": f"https://linkareer.com/activity/{job_id}",
-                                        "deadline": "",
-                                        "hidden_keyword": keyword
-                                    })
-                        except:
-                            pass
-
-                    # 링크 기반 폴백
-                    links = soup.find_all('a', href=True)
-                    activity_links = [l for l in links if '/activity/' in l.get('href', '')]
-
-                    for link in activity_links[:10]:
-                        try:
-                            href = link.get('href', '')
-                            title = link.get_text(strip=True)
-
-                            if len(title) < 5:
-                                continue
-
-                            # ID 추출
-                            import re
-                            match = re.search(r'/activity/(\d+)', href)
-                            job_id = match.group(1) if match else str(hash(title))
-
-                            full_link = href if href.startswith('http') else f"https://linkareer.com{href}"
-
-                            results.append({
-                                "id": f"linkareer_{job_id}",
-                                "site": "Linkareer",
-                                "title": title[:100],
-                                "company": "",
-                                "link": full_link,
-                                "deadline": "",
-                                "hidden_keyword": keyword
-                            })
-                        except:
-                            continue
-
-                time.sleep(random.uniform(0.5, 1))
+                    # __NEXT_DATA__ 스크립트와 <a> 태그만 파싱
+                    soup = make_soup(response, "Linkareer", only=self.FALLBACK_STRAINER)
+                    _, jobs = get_strategy_cache().first_success(
+                        "Linkareer:fallback", strategies, lambda name: strategies[name](soup, keyword)
+                    )
+                    results.extend(jobs or [])
+                    soup.decompose()
 
         except Exception as e:
             print(f"Linkareer fallback failed: {e}")
 
+    def _parse_next_data(self, soup, keyword):
+        """__NEXT_DATA__(Next.js 페이지 데이터)에서 공고 추출"""
+        results = []
+        script = soup.find("script", id="__NEXT_DATA__")
+        if not script:
+            return results
+        try:
+            data = json.loads(script.string)
+            # Next.js 데이터 구조 탐색
+            props = data.get('props', {}).get('pageProps', {})
+            activities = props.get('activities', [])
+
+            for act in activities:
+                job_id = act.get('id', str(hash(act.get('title', ''))))
+                title = act.get('title', '')
+                company = act.get('organizationName', '')
+
+                if title:
+                    results.append({
+                        "id": f"linkareer_{job_id}",
+                        "site": "Linkareer",
+                        "title": title,
+                        "company": company,
+                        "link": f"https://linkareer.com/activity/{job_id}",
+                        "deadline": "",
+                        "hidden_keyword": keyword
+                    })
+        except:
+            pass
+        return results
+
+    def _parse_activity_links(self, soup, keyword):
+        """/activity/ 링크 기반 추출"""
+        results = []
+        links = soup.find_all('a', href=True)
+        activity_links = [l for l in links if '/activity/' in l.get('href', '')]
+
+        for link in activity_links[:10]:
+            try:
+                href = link.get('href', '')
+                title = link.get_text(strip=True)
+
+                if len(title) < 5:
+                    continue
+
+                # ID 추출
+                match = re.search(r'/activity/(\d+)', href)
+                job_id = match.group(1) if match else str(hash(title))
+
+                full_link = href if href.startswith('http') else f"https://linkareer.com{href}"
+
+                results.append({
+                    "id": f"linkareer_{job_id}",
+                    "site": "Linkareer",
+                    "title": title[:100],
+                    "company": "",
+                    "link": full_link,
+                    "deadline": "",
+                    "hidden_keyword": keyword
+                })
+            except:
+                continue
+        return results
+
     def get_details(self, url):
-        return ""
+        """상세 본문 텍스트 (요청 실패 시 None)"""
+        try:
+            response = self.http.get(url, cache=False)
+            if response.status_code != 200:
+                return None
+            soup = make_soup(response, "Linkareer", only=self.DETAIL_STRAINER)
+            text = extract_main_text(soup, "Linkareer:detail", self.DETAIL_SELECTORS)
+            soup.decompose()
+            return text
+        except Exception as e:
+            print(f"  Linkareer detail failed ({url}): {e}")
+            return None
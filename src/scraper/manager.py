@@ -1,12 +1,19 @@
+import itertools
+import time
 from src.config import Config
+from src.scraper.http_cache import get_cache
 from src.scraper.saramin import SaraminScraper
 from src.scraper.jobkorea import JobKoreaScraper
 from src.scraper.linkareer import LinkareerScraper
 from src.scraper.incruit import IncruitScraper
 from src.scraper.wanted import WantedScraper
+from src.scraper.query_planner import attribute_keywords
+from src.scraper.stream import merge_streams, unique_jobs
 
 class ScraperManager:
-    def __init__(self):
+    def __init__(self, query_planner=None):
+        self.query_planner = query_planner if Config.QUERY_PLANNER_ENABLED else None
+        self.collected = 0
         self.scrapers = [
             SaraminScraper(),      # 사람인
             JobKoreaScraper(),     # 잡코리아
@@ -15,29 +22,96 @@ class ScraperManager:
             WantedScraper()        # 원티드
         ]
 
-    def run_all(self):
-        all_jobs = []
+    def run_all(self, known_ids=None):
+        """전체 사이트 수집 결과를 목록으로 반환 (iter_all 참고)"""
+        return list(self.iter_all(known_ids))
 
-        # 모든 카테고리의 키워드 수집
-        targets = []
-        for category, keywords in Config.KEYWORDS.items():
-            targets.extend(keywords)
+    def iter_all(self, known_ids=None):
+        """
+        전체 사이트 수집 - 공고를 파싱되는 대로 하나씩 내보내는 generator
+        known_ids: 이전 실행에서 본 공고 id (저장된 공고 + 교차 중복으로 걸러진 공고, 이 id들만 나오는 페이지에서 순회 중단)
+        사이트 스트림을 하나로 이어 id 기준 전역 중복 제거 후 전달 → 소비 단계(신규 공고 판정)가 수집 완료 전에 시작
+        """
+        # 모든 카테고리의 키워드 수집 (중복 제거, 설정 순서 유지)
+        targets = list(dict.fromkeys(kw for keywords in Config.KEYWORDS.values() for kw in keywords))
 
-        # 중복 키워드 제거
-        targets = list(set(targets))
+        # 사이트별 질의 계획: 다른 키워드 결과에 포함되는 키워드는 요청 생략
+        plans = {}
+        for scraper in self.scrapers:
+            site = self._site_name(scraper)
+            if self.query_planner:
+                plans[site] = self.query_planner.plan(site, Config.KEYWORDS)
+            else:
+                plans[site] = (targets, {})
+        planned = sum(len(queries) for queries, _ in plans.values())
+        if self.query_planner and self.query_planner.full_run:
+            # 포함 관계 학습 실행: 키워드마다 페이지 예산을 모두 받도록 조기 중단 없이 수집
+            print("🧭 Query planner full run - crawling full page budgets to relearn keyword containment")
+            known_ids = None
 
-        print(f"🔍 Starting scrape for {len(targets)} keywords across {len(self.scrapers)} sites...")
+        print(f"🔍 Starting scrape for {len(targets)} keywords across {len(self.scrapers)} sites ({planned} planned queries)...")
         print(f"📍 Sites: 사람인, 잡코리아, 링커리어, 원티드")
-        
-        for scraper in self.scrapers:
-            scraper_name = scraper.__class__.__name__
-            try:
-                print(f"\n▶ Running {scraper_name}...")
-                jobs = scraper.search(targets)
-                print(f"  ✅ {scraper_name}: {len(jobs)}개 공고 수집")
-                all_jobs.extend(jobs)
-            except Exception as e:
-                print(f"  ❌ {scraper_name} failed: {e}")
-        
-        print(f"\n📊 Total collected: {len(all_jobs)} jobs")
-        return all_jobs
+
+        started = time.time()
+        self.collected = 0
+        observations = {self._site_name(scraper): [] for scraper in self.scrapers}
+        streams = [
+            self._iter_scraper(scraper, plans[self._site_name(scraper)], known_ids, observations[self._site_name(scraper)])
+            for scraper in self.scrapers
+        ]
+        if Config.SCRAPE_CONCURRENT:
+            # 사이트별로 스레드 하나씩 배정 → 전체 소요 시간이 가장 느린 사이트 수준으로 줄어듦
+            # 먼저 수집된 공고부터 크기 제한 큐로 전달 (사이트 순서는 보장하지 않음)
+            jobs = merge_streams(streams)
+        else:
+            jobs = itertools.chain.from_iterable(streams)
+
+        for job in unique_jobs(jobs):
+            self.collected += 1
+            yield job
+
+        # 질의 계획 학습 기록은 메인 스레드에서 (SQLite 연결은 스레드 간 공유 불가)
+        if self.query_planner:
+            for site, site_observations in observations.items():
+                self.query_planner.record(site, site_observations)
+            self.query_planner.finish()
+
+        print(f"\n📊 Total collected: {self.collected} jobs ({time.time() - started:.1f}s)")
+        response_cache = get_cache()
+        if response_cache:
+            print(f"🗄️ HTTP cache: {response_cache.stats()}")
+
+    @staticmethod
+    def _site_name(scraper):
+        return scraper.__class__.__name__.replace("Scraper", "")
+
+    def _iter_scraper(self, scraper, plan, known_ids, observations):
+        """사이트 하나를 실행하며 공고를 내보냄 (실패해도 다른 사이트에 영향 없도록 예외를 여기서 처리)"""
+        scraper_name = scraper.__class__.__name__
+        site = self._site_name(scraper)
+        targets, covers = plan
+        max_workers = Config.SITE_CONCURRENCY.get(site, 1) if Config.SCRAPE_CONCURRENT else 1
+        count = 0
+        try:
+            print(f"\n▶ Running {scraper_name}...")
+            if covers:
+                print(f"  🧭 {scraper_name}: " + ", ".join(f"{b} ⊇ {'/'.join(a)}" for b, a in covers.items()))
+            jobs = scraper.iter_search(
+                targets,
+                max_workers=max_workers,
+                known_ids=known_ids,
+                observer=lambda keyword, found: observations.append((keyword, found))
+            )
+            # 생략된 키워드는 같은 카테고리 키워드가 대신 담당 → hidden_keyword 기준 분류는 그대로
+            # 대신 받은 결과 중 제목에 생략된 키워드가 있는 공고는 그 키워드에도 연결
+            for job in jobs:
+                query_keywords = attribute_keywords(job, covers.get(job.get('hidden_keyword'), ()))
+                if query_keywords:
+                    job['query_keywords'] = query_keywords
+                count += 1
+                yield job
+            print(f"  ✅ {scraper_name}: {count}개 공고 수집")
+        except Exception as e:
+            # 이미 내보낸 공고는 그대로 사용, 불완전한 키워드별 결과는 질의 계획 학습에서 제외
+            print(f"  ❌ {scraper_name} failed after {count} jobs: {e}")
+            observations.clear()
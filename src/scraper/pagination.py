@@ -0,0 +1,30 @@
+from src.config import Config
+
+
+def page_budget(site):
+    """사이트별 키워드당 최대 요청 페이지 수"""
+    return Config.PAGE_BUDGET.get(site, Config.PAGE_BUDGET["default"])
+
+
+def crawl_pages(fetch_page, known_ids, max_pages, page_size=None):
+    """
+    최신순 목록을 1페이지부터 순회하며 공고 수집
+    fetch_page(page) → 해당 페이지 공고 목록
+    중단 조건:
+    - 페이지의 공고가 모두 known_ids(저장된 공고 + 교차 중복으로 걸러진 공고) → 이후 페이지는 이전 실행에서 본 공고
+    - 빈 페이지 / page_size보다 적은 마지막 페이지
+    - 페이지 예산(max_pages) 소진
+    반환: (공고 목록, 요청한 페이지 수)
+    """
+    known_ids = known_ids or set()
+    results = []
+    pages = 0
+    for page in range(1, max_pages + 1):
+        jobs = fetch_page(page)
+        pages += 1
+        results.extend(jobs)
+        if not jobs or all(job['id'] in known_ids for job in jobs):
+            break
+        if page_size and len(jobs) < page_size:
+            break
+    return results, pages
@@ -0,0 +1,106 @@
+import re
+from datetime import date, timedelta
+from src.config import Config
+
+
+def _compact(text):
+    return re.sub(r'\s+', '', (text or '').lower())
+
+
+def attribute_keywords(job, covered):
+    """
+    대신 요청한 키워드(job['hidden_keyword'])의 결과를 생략된 키워드에 다시 연결
+    제목에 생략된 키워드가 들어 있는 공고만 그 키워드의 결과로 간주 (공백/대소문자 무시)
+    반환값: [요청 키워드, 연결된 생략 키워드...] (연결된 키워드가 없으면 빈 목록)
+    """
+    title = _compact(job.get('title'))
+    matched = [keyword for keyword in covered if _compact(keyword) in title]
+    return [job.get('hidden_keyword', '')] + matched if matched else []
+
+
+class QueryPlanner:
+    """
+    사이트별 키워드 질의 계획
+    - 과거 실행에서 키워드 A의 결과가 같은 카테고리 키워드 B의 결과에 거의 포함되면 (A ⊆ B)
+      그 사이트에서는 A를 요청하지 않고 B의 결과로 대신함 (예: "AI AGENT" ⊆ "AI")
+    - 카테고리가 다른 키워드끼리는 합치지 않으므로 hidden_keyword → 카테고리 분류는 그대로 유지
+    - PLANNER_VERIFY_DAYS마다 전체 키워드를 요청해 포함 관계를 다시 학습 (사이트 검색 결과 변화 대응)
+      학습은 이 전체 실행의 결과로만 함: 전체 실행은 known_ids 조기 중단 없이 키워드마다 페이지 예산을 모두 받으므로
+      A, B 모두 "한 번에 받는 결과 전체"끼리 비교됨 (평소 실행은 새 공고가 나오는 페이지까지만 받아 결과 범위가 키워드마다 다름)
+      → B의 예산 안에 A의 결과가 들어올 때만 A를 생략 (B가 훨씬 넓어 A의 결과를 예산 안에 담지 못하면 생략하지 않음)
+    - 생략된 키워드의 공고는 attribute_keywords로 제목 기준 다시 연결 (job['query_keywords'], 검색 색인에 포함)
+    키워드를 늘려도 기존 키워드에 포함되는 검색어는 요청이 늘지 않음
+    """
+
+    def __init__(self, store, today=None):
+        self.store = store
+        self.today = today or date.today()
+        last_full = self.store.get_meta("planner_full_run")
+        self.full_run = (
+            not last_full
+            or (self.today - date.fromisoformat(last_full)).days >= Config.PLANNER_VERIFY_DAYS
+        )
+
+    def plan(self, site, keywords_by_category):
+        """
+        사이트에 요청할 키워드 목록과 대체 관계 반환
+        반환값: (요청 키워드 목록, {요청 키워드: [대신 처리되는 키워드]})
+        """
+        all_keywords = list(dict.fromkeys(kw for keywords in keywords_by_category.values() for kw in keywords))
+        if self.full_run:
+            return all_keywords, {}
+
+        history = self.store.query_history(site, self.today - timedelta(days=Config.PLANNER_WINDOW_DAYS))
+        if len(history) < Config.PLANNER_MIN_RUNS:
+            return all_keywords, {}  # 학습 기록이 부족하면 전체 요청
+        sizes = {}
+        for results in history.values():
+            for keyword, ids in results.items():
+                sizes[keyword] = sizes.get(keyword, 0) + len(ids)
+
+        covers = {}
+        queried = set()
+        for keywords in keywords_by_category.values():
+            # 결과가 많은 키워드부터 유지 → 작은 키워드가 큰 키워드에 포함되는지 확인
+            kept = []
+            for keyword in sorted(keywords, key=lambda kw: sizes.get(kw, 0), reverse=True):
+                cover = next((b for b in kept if self._containment(history, keyword, b) >= Config.PLANNER_MIN_CONTAINMENT), None)
+                if cover:
+                    covers.setdefault(cover, []).append(keyword)
+                else:
+                    kept.append(keyword)
+            queried.update(kept)
+
+        # 같은 키워드가 여러 카테고리에 있으면 한 카테고리에서라도 유지될 때 요청
+        queries = [kw for kw in all_keywords if kw in queried]
+        return queries, covers
+
+    def _containment(self, history, a, b):
+        """A 결과 중 B 결과에도 있는 비율 (A, B를 함께 요청한 실행만 집계)"""
+        runs = total = shared = 0
+        for results in history.values():
+            if a in results and b in results:
+                runs += 1
+                total += len(results[a])
+                shared += len(results[a] & results[b])
+        if runs < Config.PLANNER_MIN_RUNS or total < Config.PLANNER_MIN_RESULTS:
+            return 0.0
+        return shared / total
+
+    def record(self, site, observations):
+        """
+        이번 실행의 키워드별 결과 id 기록 (observations: [(keyword, jobs)])
+        조기 중단된 결과끼리는 포함 관계를 판단할 수 없으므로 전체 실행의 결과만 기록
+        """
+        if not self.full_run:
+            return
+        results = {}
+        for keyword, jobs in observations:
+            results.setdefault(keyword, set()).update(job['id'] for job in jobs)
+        if results:
+            self.store.record_query_results(site, self.today, results)
+
+    def finish(self):
+        if self.full_run:
+            self.store.set_meta("planner_full_run", self.today.isoformat())
+        self.store.prune_query_history(self.today - timedelta(days=Config.PLANNER_WINDOW_DAYS))
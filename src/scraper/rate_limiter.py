@@ -0,0 +1,73 @@
+import asyncio
+import random
+import threading
+import time
+from urllib.parse import urlparse
+from src.config import Config
+
+
+class TokenBucket:
+    """
+    토큰 버킷 기반 요청 속도 제한기
+    - rate: 초당 허용 요청 수, burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+    - cost: 요청 하나가 쓰는 토큰 수 (기본 1, AI 호출의 입력 토큰 수처럼 요청마다 다른 양도 가능)
+    - 예산 안이면 바로 통과하고, 초과했을 때만 필요한 만큼 (+jitter) 대기
+    - 스레드/비동기 태스크 간 공유 가능 (토큰 예약은 lock 안에서만 처리)
+    """
+
+    def __init__(self, rate, burst=1, jitter=0.0):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.jitter = float(jitter)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, cost=1):
+        """토큰 cost개를 예약하고, 실제로 사용 가능해질 때까지 기다려야 하는 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰을 음수까지 빌려 쓰게 해서 동시에 들어온 요청들이 순서대로 줄을 서도록 함
+            self._tokens -= cost
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate
+        return wait + random.uniform(0, self.jitter)
+
+    def acquire(self, cost=1):
+        wait = self._reserve(cost)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, cost=1):
+        wait = self._reserve(cost)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(host):
+    """호스트별 토큰 버킷 (Config.RATE_LIMITS 설정, 없으면 기본값 사용)"""
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            limits = Config.RATE_LIMITS.get(host, Config.RATE_LIMITS["default"])
+            bucket = TokenBucket(limits["rps"], limits.get("burst", 1), limits.get("jitter", 0.0))
+            _buckets[host] = bucket
+        return bucket
+
+
+def throttle(url):
+    """요청 직전에 호출 - 해당 호스트의 예산을 초과한 경우에만 대기"""
+    return get_bucket(urlparse(url).netloc).acquire()
+
+
+async def throttle_async(url):
+    return await get_bucket(urlparse(url).netloc).acquire_async()
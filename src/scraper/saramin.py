@@ -1,72 +1,97 @@
-import requests
-from bs4 import BeautifulSoup
-import time
-import random
 import re
 from datetime import datetime, timedelta
+from src.logic.deadline_normalizer import DeadlineNormalizer
+from src.scraper.concurrency import iter_keywords
+from src.scraper.html_parser import extract_main_text, make_soup, strainer
+from src.scraper.pagination import crawl_pages, page_budget
+from src.scraper.stream import unique_jobs
+from src.scraper.transport import HttpClient
 
 class SaraminScraper:
     BASE_URL = "https://www.saramin.co.kr/zf_user/search/recruit"
+    LIST_STRAINER = strainer(class_="item_recruit")
+    DETAIL_STRAINER = strainer("body")
+    # 공고 상세는 iframe 문서(view-detail)에 있음
+    DETAIL_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view-detail"
+    DETAIL_SELECTORS = [".user_content", ".wrap_jv_cont", ".jv_detail"]
+    PAGE_SIZE = 20
     
     def __init__(self):
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
+        self.http = HttpClient(self.headers)
 
-    def search(self, keywords):
+    def search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        return list(unique_jobs(self.iter_search(keywords, max_workers, known_ids, observer)))
+
+    def iter_search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        """파싱되는 대로 공고를 하나씩 내보냄 (id 중복 제거는 소비하는 쪽의 스트리밍 단계에서)"""
+        for job in iter_keywords(lambda keyword: self._crawl_keyword(keyword, known_ids), keywords, max_workers, observer):
+            # 마감일을 수집 시점에 한 번만 정규화 (deadline_date / deadline_kind)
+            DeadlineNormalizer.apply(job)
+            yield job
+
+    def _crawl_keyword(self, keyword, known_ids):
+        """최신순 페이지를 이미 저장된 공고가 나올 때까지 순회 (페이지 예산 내)"""
+        jobs, pages = crawl_pages(
+            lambda page: self._search_keyword(keyword, page), known_ids, page_budget("Saramin"), self.PAGE_SIZE
+        )
+        print(f"  Saramin '{keyword}': {len(jobs)} jobs from {pages} page(s)")
+        return jobs
+
+    def _search_keyword(self, keyword, page=1):
         results = []
-        for keyword in keywords:
-            print(f"Searching Saramin for: {keyword}")
-            try:
-                # Basic parameters for Saramin search
-                params = {
-                    "searchType": "search",
-                    "searchword": keyword,
-                    "recruitPage": 1,
-                    "recruitSort": "relation",
-                    "recruitPageCount": 20,  # Get top 20 relevant
-                    "exp_cd": 1,  # 신입 필터 (1=신입, 2=경력, 3=신입/경력)
-                    "exp_none": 1  # 경력무관도 포함
-                }
-                
-                response = requests.get(self.BASE_URL, params=params, headers=self.headers)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    items = soup.select(".item_recruit")
-                    
-                    for item in items:
-                        try:
-                            title_tag = item.select_one(".job_tit a")
-                            company_tag = item.select_one(".corp_name a")
-                            date_tag = item.select_one(".job_date .date")
-                            
-                            if not title_tag: continue
-                            
-                            job_id = title_tag['href'].split("rec_idx=")[1].split("&")[0]
-                            title = title_tag.text.strip()
-                            company = company_tag.text.strip()
-                            link = "https://www.saramin.co.kr" + title_tag['href']
-                            deadline = self._convert_deadline(date_tag.text.strip())
-                            
-                            results.append({
-                                "id": f"saramin_{job_id}",
-                                "site": "Saramin",
-                                "title": title,
-                                "company": company,
-                                "link": link,
-                                "deadline": deadline,
-                                "hidden_keyword": keyword
-                            })
-                        except Exception as e:
-                            print(f"Error parsing item: {e}")
-                            continue
-                
-                # Be nice to the server
-                time.sleep(random.uniform(1, 3))
-                
-            except Exception as e:
-                print(f"Error scraping Saramin for {keyword}: {e}")
+        print(f"Searching Saramin for: {keyword} (page {page})")
+        try:
+            # Basic parameters for Saramin search
+            params = {
+                "searchType": "search",
+                "searchword": keyword,
+                "recruitPage": page,
+                "recruitSort": "reg_dt",  # 최신 등록순 (이미 본 공고가 나오면 다음 페이지 생략)
+                "recruitPageCount": self.PAGE_SIZE,
+                "exp_cd": 1,  # 신입 필터 (1=신입, 2=경력, 3=신입/경력)
+                "exp_none": 1  # 경력무관도 포함
+            }
+            
+            response = self.http.get(self.BASE_URL, params=params)
+            if response.status_code == 200:
+                # 공고 목록(.item_recruit) 하위 트리만 파싱
+                soup = make_soup(response, "Saramin", only=self.LIST_STRAINER)
+                items = soup.select(".item_recruit")
                 
+                for item in items:
+                    try:
+                        title_tag = item.select_one(".job_tit a")
+                        company_tag = item.select_one(".corp_name a")
+                        date_tag = item.select_one(".job_date .date")
+                        
+                        if not title_tag: continue
+                        
+                        job_id = title_tag['href'].split("rec_idx=")[1].split("&")[0]
+                        title = title_tag.text.strip()
+                        company = company_tag.text.strip()
+                        link = "https://www.saramin.co.kr" + title_tag['href']
+                        deadline = self._convert_deadline(date_tag.text.strip())
+                        
+                        results.append({
+                            "id": f"saramin_{job_id}",
+                            "site": "Saramin",
+                            "title": title,
+                            "company": company,
+                            "link": link,
+                            "deadline": deadline,
+                            "hidden_keyword": keyword
+                        })
+                    except Exception as e:
+                        print(f"Error parsing item: {e}")
+                        continue
+                soup.decompose()
+            
+        except Exception as e:
+            print(f"Error scraping Saramin for {keyword}: {e}")
+            
         return results
 
     def _convert_deadline(self, text):
@@ -92,13 +117,19 @@ class SaraminScraper:
         return text
 
     def get_details(self, url):
-        # Implementation for getting full text will be needed for AI Summary
-        # For now, we return empty string to avoid blocking
+        """상세 본문 텍스트 (요청 실패 시 None)"""
         try:
-            response = requests.get(url, headers=self.headers)
-            soup = BeautifulSoup(response.text, "html.parser")
-            # This selector often changes, need to be generic
-            content = soup.select_one(".wrap_jv_cont")
-            return content.text.strip() if content else ""
-        except:
-            return ""
+            match = re.search(r'rec_idx=(\d+)', url)
+            if match:
+                response = self.http.get(self.DETAIL_URL, params={"rec_idx": match.group(1)}, cache=False)
+            else:
+                response = self.http.get(url, cache=False)
+            if response.status_code != 200:
+                return None
+            soup = make_soup(response, "Saramin", only=self.DETAIL_STRAINER)
+            text = extract_main_text(soup, "Saramin:detail", self.DETAIL_SELECTORS)
+            soup.decompose()
+            return text
+        except Exception as e:
+            print(f"  Saramin detail failed ({url}): {e}")
+            return None
@@ -0,0 +1,82 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+from src.config import Config
+
+
+class StrategyCache:
+    """
+    사이트별 마지막 성공 셀렉터/파싱 전략 기억 (폴백 위주 스크래퍼용)
+    - 기억된 전략을 먼저 시도하고, 실패할 때만 전체 후보를 순서대로 다시 시도
+    - 성공 전략이 바뀌거나 모든 후보가 실패하면 출력 (사이트 레이아웃 변경 신호)
+    - JSON 파일 하나(Config.STRATEGY_CACHE_FILE)에 저장 → Actions 캐시로 실행 간 보존
+    """
+
+    def __init__(self, path=None):
+        self.path = path or Config.STRATEGY_CACHE_FILE
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def first_success(self, key, candidates, attempt):
+        """
+        candidates를 (기억된 전략 우선) 순서대로 attempt(candidate)에 넘겨 처음으로 결과가 있는 것을 반환
+        반환: (성공 전략, 결과) - 모두 실패하면 (None, None)
+        """
+        with self._lock:
+            remembered = self.entries.get(key, {}).get("strategy")
+        order = list(candidates)
+        if remembered in order:
+            order.remove(remembered)
+            order.insert(0, remembered)
+
+        for candidate in order:
+            result = attempt(candidate)
+            if result:
+                if candidate != remembered:
+                    self._remember(key, remembered, candidate)
+                return candidate, result
+
+        print(f"  [Strategy] {key}: no candidate matched (last success: {remembered or '-'}) - layout changed?")
+        return None, None
+
+    def _remember(self, key, previous, strategy):
+        if previous is not None:
+            print(f"  [Strategy] {key}: '{previous}' failed, now using '{strategy}' - layout changed?")
+        with self._lock:
+            entry = self.entries.setdefault(key, {"changes": 0})
+            entry["strategy"] = strategy
+            entry["updated_at"] = datetime.now().isoformat()
+            if previous is not None:
+                entry["changes"] += 1
+            self._save()
+
+    def _save(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_strategy_cache():
+    """프로세스 공용 전략 캐시"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = StrategyCache()
+        return _cache
@@ -0,0 +1,61 @@
+import queue
+import threading
+
+from src.config import Config
+
+_DONE = object()
+
+
+def unique_jobs(jobs, seen=None):
+    """id 기준 스트리밍 중복 제거 - 처음 나온 공고만 바로 내보냄 (전체 목록을 모으지 않음)"""
+    seen = set() if seen is None else seen
+    for job in jobs:
+        if job['id'] not in seen:
+            seen.add(job['id'])
+            yield job
+
+
+def merge_streams(streams, max_buffered=None):
+    """
+    여러 공고 스트림(사이트별 generator)을 스레드 하나씩으로 동시에 실행하고 먼저 수집된 공고부터 내보냄
+    - 모든 스트림이 크기 제한(max_buffered, 기본 Config.STREAM_QUEUE_SIZE) 큐 하나를 공유
+      → 소비가 느리면 수집 스레드가 대기 (최대 메모리는 스트림 수/수집량과 무관하게 일정)
+    - 사이트 간 순서는 보장하지 않음 (같은 공고가 여러 사이트에 있으면 먼저 수집된 쪽이 남음)
+    - 스트림 안에서 난 예외는 소비자 쪽으로 다시 발생, 소비자가 중간에 멈추면 수집 스레드도 종료
+    """
+    out = queue.Queue(maxsize=max_buffered or Config.STREAM_QUEUE_SIZE)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(stream):
+        try:
+            for job in stream:
+                if not put(job):
+                    return
+        except BaseException as e:
+            put(e)
+        put(_DONE)
+
+    for stream in streams:
+        threading.Thread(target=drain, args=(stream,), daemon=True).start()
+
+    remaining = len(streams)
+    try:
+        while remaining:
+            item = out.get()
+            if item is _DONE:
+                remaining -= 1
+                continue
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
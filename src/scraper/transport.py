@@ -0,0 +1,155 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.config import Config
+from src.scraper.fixtures import get_fixture_store
+from src.scraper.http_cache import cache_key, get_cache
+from src.scraper.rate_limiter import throttle
+
+# 재시도 대상 상태 코드 (요청 과다 / 일시적 서버 오류)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(host):
+    """
+    호스트별 keep-alive 세션 (커넥션 풀)
+    같은 호스트로 가는 모든 키워드 요청이 연결을 재사용하도록 스크래퍼 간에 공유
+    """
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=Config.HTTP_POOL_SIZE,
+                max_retries=0  # 재시도는 HttpClient에서 직접 처리 (Retry-After 반영)
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+        return session
+
+
+def _retry_after_seconds(response):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except Exception:
+        return None
+
+
+class HttpClient:
+    """
+    모든 스크래퍼가 공유하는 HTTP 전송 계층
+    - 호스트별 커넥션 풀 재사용
+    - 기본 연결/읽기 타임아웃 (소켓 하나가 워크플로 전체를 멈추지 않도록)
+    - 429/5xx 및 연결 오류 시 지수 백오프 재시도 (Retry-After 우선)
+    - 요청마다 호스트별 속도 제한 적용
+    - 디스크 응답 캐시 (TTL 내 재사용, 이후 조건부 요청)
+    """
+
+    def __init__(self, headers=None, timeout=None, max_retries=None):
+        self.headers = headers or {}
+        self.timeout = timeout or (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT)
+        self.max_retries = Config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method, url, headers=None, cache=None, cacheable=None, **kwargs):
+        """
+        cache: 디스크 응답 캐시 사용 여부 (기본값: GET만 사용)
+        목록 조회용 POST(GraphQL 등)는 cache=True로 명시해서 캐시 가능
+        cacheable(response): 200 응답 중 저장할지 판정 (예: GraphQL은 200이어도 errors가 있으면 저장하지 않음)
+        """
+        host = urlparse(url).netloc
+        fixtures = get_fixture_store()
+        if fixtures and Config.HTTP_MODE == "replay":
+            # 재생 모드: 기록된 응답을 그대로 반환 (오프라인 벤치마크/회귀 확인용)
+            return fixtures.load(method, url, kwargs.get("params"), kwargs.get("json"), kwargs.get("data"))
+
+        session = get_session(host)
+        merged_headers = {**self.headers, **(headers or {})}
+        kwargs.setdefault("timeout", self.timeout)
+
+        # 기록 모드에서는 캐시를 거치지 않고 실제 응답을 저장
+        use_cache = (cache if cache is not None else method == "GET") and not fixtures
+        response_cache = get_cache() if use_cache else None
+        key = entry = None
+        if response_cache:
+            key = cache_key(method, url, kwargs.get("params"), kwargs.get("json"))
+            entry = response_cache.get(key)
+            if entry and entry.is_fresh(response_cache.ttl_for(host)):
+                response_cache.hits += 1
+                return entry.to_response()
+            if entry:
+                # TTL이 지난 항목은 ETag/Last-Modified로 조건부 요청
+                merged_headers.update(entry.validators())
+
+        response = self._send(session, method, url, merged_headers, **kwargs)
+        if fixtures:
+            fixtures.save(method, url, kwargs.get("params"), kwargs.get("json"), response, kwargs.get("data"))
+
+        if response_cache:
+            if response.status_code == 304 and entry:
+                response_cache.revalidated += 1
+                response_cache.touch(key, entry)
+                return entry.to_response()
+            response_cache.misses += 1
+            if response.status_code == 200 and (cacheable is None or cacheable(response)):
+                response_cache.put(key, response)
+        return response
+
+    def _send(self, session, method, url, headers, **kwargs):
+        attempt = 0
+        while True:
+            throttle(url)
+            try:
+                response = session.request(method, url, headers=headers, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                print(f"  ⚠️ {urlparse(url).netloc} 연결 오류, {delay:.1f}s 후 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+            else:
+                if response.status_code not in RETRY_STATUS or attempt >= self.max_retries:
+                    return response
+                delay = _retry_after_seconds(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                delay = min(delay, Config.HTTP_MAX_BACKOFF)
+                print(f"  ⚠️ {urlparse(url).netloc} HTTP {response.status_code}, {delay:.1f}s 후 재시도 ({attempt + 1}/{self.max_retries})")
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _backoff(self, attempt):
+        delay = Config.HTTP_BACKOFF_BASE * (2 ** attempt)
+        return min(delay + random.uniform(0, Config.HTTP_BACKOFF_BASE), Config.HTTP_MAX_BACKOFF)
+
+    async def aget(self, url, **kwargs):
+        """비동기 컨텍스트용 GET (블로킹 요청을 스레드에서 실행)"""
+        return await asyncio.to_thread(self.request, "GET", url, **kwargs)
+
+    async def apost(self, url, **kwargs):
+        return await asyncio.to_thread(self.request, "POST", url, **kwargs)
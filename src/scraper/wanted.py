@@ -1,6 +1,8 @@
-import requests
-import time
-import random
+from src.logic.deadline_normalizer import DeadlineNormalizer
+from src.scraper.concurrency import iter_keywords
+from src.scraper.pagination import crawl_pages, page_budget
+from src.scraper.stream import unique_jobs
+from src.scraper.transport import HttpClient
 
 class WantedScraper:
     """
@@ -9,6 +11,15 @@ class WantedScraper:
     """
     # 원티드 내부 API 엔드포인트
     API_URL = "https://www.wanted.co.kr/api/v4/jobs"
+    # 상세 API(job.detail)의 항목 → 본문 소제목
+    DETAIL_SECTIONS = [
+        ("intro", "회사 소개"),
+        ("main_tasks", "주요업무"),
+        ("requirements", "자격요건"),
+        ("preferred_points", "우대사항"),
+        ("benefits", "혜택 및 복지")
+    ]
+    PAGE_SIZE = 20
 
     def __init__(self):
         self.headers = {
@@ -19,91 +30,94 @@ class WantedScraper:
             "wanted-user-country": "KR",
             "wanted-user-language": "ko"
         }
-        self.session = requests.Session()
-
-    def search(self, keywords):
+        self.http = HttpClient(self.headers)
+
+    def search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        return list(unique_jobs(self.iter_search(keywords, max_workers, known_ids, observer)))
+
+    def iter_search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        """파싱되는 대로 공고를 하나씩 내보냄 (id 중복 제거는 소비하는 쪽의 스트리밍 단계에서)"""
+        for job in iter_keywords(lambda keyword: self._crawl_keyword(keyword, known_ids), keywords, max_workers, observer):
+            # 마감일을 수집 시점에 한 번만 정규화 (deadline_date / deadline_kind)
+            DeadlineNormalizer.apply(job)
+            yield job
+
+    def _crawl_keyword(self, keyword, known_ids):
+        """최신순 페이지를 이미 저장된 공고가 나올 때까지 순회 (페이지 예산 내)"""
+        jobs, pages = crawl_pages(
+            lambda page: self._search_keyword(keyword, page), known_ids, page_budget("Wanted"), self.PAGE_SIZE
+        )
+        print(f"  Wanted '{keyword}': {len(jobs)} jobs from {pages} page(s)")
+        return jobs
+
+    def _search_keyword(self, keyword, page=1):
         results = []
+        print(f"Searching Wanted for: {keyword} (page {page})")
+        try:
+            # 원티드 API 파라미터
+            params = {
+                "country": "kr",
+                "job_sort": "job.latest_order",  # 최신순 (이미 본 공고가 나오면 다음 페이지 생략)
+                "years": "0",  # 신입 (0년차)
+                "locations": "all",
+                "limit": self.PAGE_SIZE,
+                "offset": (page - 1) * self.PAGE_SIZE,
+                "keyword": keyword
+            }
 
-        for keyword in keywords:
-            print(f"Searching Wanted for: {keyword}")
-            try:
-                # 원티드 API 파라미터
-                params = {
-                    "country": "kr",
-                    "job_sort": "job.latest_order",
-                    "years": "0",  # 신입 (0년차)
-                    "locations": "all",
-                    "limit": 20,
-                    "offset": 0,
-                    "keyword": keyword
-                }
-
-                response = self.session.get(
-                    self.API_URL,
-                    params=params,
-                    headers=self.headers,
-                    timeout=15
-                )
-
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        jobs = data.get('data', [])
-
-                        for job in jobs:
-                            try:
-                                job_id = job.get('id', '')
-                                title = job.get('position', '')
-                                company = job.get('company', {}).get('name', '')
-
-                                if not title:
-                                    continue
-
-                                link = f"https://www.wanted.co.kr/wd/{job_id}"
-
-                                # 마감일 처리
-                                due_time = job.get('due_time', '')
-                                deadline = ""
-                                if due_time:
-                                    deadline = due_time[:10] if len(due_time) >= 10 else due_time
-
-                                results.append({
-                                    "id": f"wanted_{job_id}",
-                                    "site": "Wanted",
-                                    "title": title,
-                                    "company": company,
-                                    "link": link,
-                                    "deadline": deadline,
-                                    "hidden_keyword": keyword
-                                })
-                            except Exception as e:
-                                continue
+            response = self.http.get(self.API_URL, params=params)
+
+            if response.status_code == 200:
+                try:
+                    data = response.json()
+                    jobs = data.get('data', [])
 
-                    except Exception as e:
-                        print(f"  Wanted: JSON parsing failed, trying alternative...")
-                        self._fallback_search(keyword, results)
-                else:
-                    print(f"  Wanted: HTTP {response.status_code}, trying alternative...")
-                    self._fallback_search(keyword, results)
+                    for job in jobs:
+                        try:
+                            job_id = job.get('id', '')
+                            title = job.get('position', '')
+                            company = job.get('company', {}).get('name', '')
 
-                time.sleep(random.uniform(1, 2))
+                            if not title:
+                                continue
 
-            except Exception as e:
-                print(f"Error scraping Wanted for {keyword}: {e}")
-                self._fallback_search(keyword, results)
+                            link = f"https://www.wanted.co.kr/wd/{job_id}"
+
+                            # 마감일 처리
+                            due_time = job.get('due_time', '')
+                            deadline = ""
+                            if due_time:
+                                deadline = due_time[:10] if len(due_time) >= 10 else due_time
+
+                            results.append({
+                                "id": f"wanted_{job_id}",
+                                "site": "Wanted",
+                                "title": title,
+                                "company": company,
+                                "link": link,
+                                "deadline": deadline,
+                                "hidden_keyword": keyword
+                            })
+                        except Exception as e:
+                            continue
 
-        # 중복 제거
-        seen = set()
-        unique_results = []
-        for job in results:
-            if job['id'] not in seen:
-                seen.add(job['id'])
-                unique_results.append(job)
+                except Exception as e:
+                    print(f"  Wanted: JSON parsing failed, trying alternative...")
+                    self._fallback_search(keyword, results, page)
+            else:
+                print(f"  Wanted: HTTP {response.status_code}, trying alternative...")
+                self._fallback_search(keyword, results, page)
 
-        return unique_results
+        except Exception as e:
+            print(f"Error scraping Wanted for {keyword}: {e}")
+            self._fallback_search(keyword, results, page)
 
-    def _fallback_search(self, keyword, results):
-        """대체 API 엔드포인트 시도"""
+        return results
+
+    def _fallback_search(self, keyword, results, page=1):
+        """대체 API 엔드포인트 시도 (페이지 구분이 없으므로 첫 페이지에서만)"""
+        if page > 1:
+            return
         try:
             # v3 API 시도
             alt_url = "https://www.wanted.co.kr/api/v3/search"
@@ -113,7 +127,7 @@ class WantedScraper:
                 "country": "kr"
             }
 
-            response = self.session.get(alt_url, params=params, headers=self.headers, timeout=10)
+            response = self.http.get(alt_url, params=params)
 
             if response.status_code == 200:
                 data = response.json()
@@ -143,4 +157,18 @@ class WantedScraper:
             print(f"  Wanted fallback also failed: {e}")
 
     def get_details(self, url):
-        return ""
+        """상세 본문 텍스트 - 공고 상세 API의 항목별 내용을 제목과 함께 이어붙임 (요청 실패 시 None)"""
+        try:
+            job_id = url.rstrip('/').rsplit('/', 1)[-1]
+            response = self.http.get(f"{self.API_URL}/{job_id}", cache=False)
+            if response.status_code != 200:
+                return None
+            detail = (response.json().get('job') or {}).get('detail') or {}
+            sections = []
+            for key, heading in self.DETAIL_SECTIONS:
+                if detail.get(key):
+                    sections.append(f"[{heading}]\n{detail[key].strip()}")
+            return "\n\n".join(sections)
+        except Exception as e:
+            print(f"  Wanted detail failed ({url}): {e}")
+            return None
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# src 패키지를 저장소 루트 기준으로 import (main.py와 같은 방식)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import time
+
+from src.config import Config
+from src.logic.ai_agent import FAILURE_SUMMARY, AIAgent
+from src.logic.ai_providers import StubProvider
+from src.logic.condense import condense
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# 응답이 30초 걸리는 제공자로 제한 시간 1초 분석 → 프로세스 종료까지 걸린 시간 측정
+STALLED_RUN = """
+import time
+from src.config import Config
+from src.logic.ai_agent import AIAgent
+from src.logic.ai_providers import StubProvider
+from src.logic.condense import condense
+Config.AI_BACKOFF_BASE = 0.01
+agent = AIAgent(StubProvider(latency=30, seed=1))
+started = time.monotonic()
+results = agent.analyze_many([("데이터 분석가", "[주요업무] 데이터 분석 " * 20)] * 3, max_in_flight=2, timeout=1)
+print("RETURNED", round(time.monotonic() - started, 2), results[0]["summary"])
+"""
+
+
+def test_stalled_provider_returns_and_exits_within_timeout():
+    started = time.monotonic()
+    completed = subprocess.run([sys.executable, "-c", STALLED_RUN], cwd=ROOT, capture_output=True,
+                               text=True, timeout=60)
+    elapsed = time.monotonic() - started
+
+    assert completed.returncode == 0, completed.stderr
+    returned = next(line for line in completed.stdout.splitlines() if line.startswith("RETURNED"))
+    _, seconds, summary = returned.split(maxsplit=2)
+    assert float(seconds) < 3
+    assert summary == FAILURE_SUMMARY
+    # 버려진 호출이 종료를 붙잡지 않음 (제공자 응답 30초를 기다리지 않음)
+    assert elapsed < 10
+
+
+def test_batches_are_analyzed_by_stub(monkeypatch):
+    monkeypatch.setattr(Config, "AI_BATCH_ENABLED", True)
+    provider = StubProvider(latency=0, seed=1)
+    agent = AIAgent(provider)
+
+    results = agent.analyze_many([(f"데이터 분석가 {n}", "[주요업무] 데이터 분석") for n in range(5)], timeout=5)
+
+    assert [result["summary"] for result in results] == ["stub 분석 결과"] * 5
+    assert provider.calls == 1
+
+
+class RecordingProvider(StubProvider):
+    def __init__(self):
+        super().__init__(latency=0, seed=1)
+        self.prompts = []
+
+    def generate(self, prompt, timeout=None):
+        self.prompts.append(prompt)
+        return super().generate(prompt, timeout)
+
+
+def test_agent_sends_pipeline_text_unchanged():
+    # main에서 이미 압축한 본문을 에이전트가 다시 압축하지 않음
+    text = "[복리후생]\n" + "\n".join(f"- 복지 항목 {n} " + "내용 " * 30 for n in range(200))
+    assert condense(text) != text
+    provider = RecordingProvider()
+
+    AIAgent(provider).analyze_many([("데이터 분석가", text)], timeout=5)
+
+    assert text in provider.prompts[0]
@@ -0,0 +1,18 @@
+from src.logic.dedup import DedupIndex, canonical_company, is_similar_title, normalize_title
+
+
+def test_company_aliases_share_a_key():
+    assert canonical_company("㈜카카오") == canonical_company("Kakao Corp.") == "카카오"
+
+
+def test_similar_titles_in_same_company_are_duplicates():
+    index = DedupIndex()
+    index.add("카카오", normalize_title("[판교] 데이터 분석가 신입 채용"))
+
+    assert index.is_duplicate("카카오", normalize_title("데이터 분석가 신입 모집"))
+    assert not index.is_duplicate("네이버", normalize_title("데이터 분석가 신입 모집"))
+    assert not index.is_duplicate("카카오", normalize_title("세무 회계 경력 채용"))
+
+
+def test_short_titles_are_not_compared_by_ratio():
+    assert not is_similar_title("회계", "회계팀")
@@ -0,0 +1,46 @@
+import pytest
+
+from src.scraper.fixtures import FixtureNotFound, FixtureStore, _keyword_of
+
+API_URL = "https://api.linkareer.com/graphql"
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.url = API_URL
+        self.status_code = 200
+        self.headers = {"Content-Type": "application/json"}
+        self.encoding = "utf-8"
+        self.content = content
+
+
+def _graphql_body(keyword):
+    return {"variables": {"filterBy": {"keyword": keyword}, "pageSize": 20}}
+
+
+def test_keyword_from_graphql_variables():
+    assert _keyword_of(API_URL, None, _graphql_body("데이터 분석")) == "데이터 분석"
+    assert _keyword_of("https://example.com/search?stext=회계", None) == "회계"
+    assert _keyword_of("https://example.com/search", None, "page=1&keyword=%EC%84%B8%EB%AC%B4") == "세무"
+    assert _keyword_of("https://example.com/search", None, None) == "_"
+
+
+def test_post_keywords_are_recorded_separately(tmp_path):
+    store = FixtureStore(fixture_dir=str(tmp_path))
+    store.save("POST", API_URL, None, _graphql_body("회계"), FakeResponse(b'{"keyword": "accounting"}'))
+    store.save("POST", API_URL, None, _graphql_body("인사"), FakeResponse(b'{"keyword": "hr"}'))
+
+    host_dir = tmp_path / "api.linkareer.com"
+    assert sorted(path.name for path in host_dir.iterdir()) == ["인사", "회계"]
+    assert store.load("POST", API_URL, None, _graphql_body("회계")).content == b'{"keyword": "accounting"}'
+    assert store.load("POST", API_URL, None, _graphql_body("인사")).content == b'{"keyword": "hr"}'
+
+
+def test_form_bodies_get_distinct_keys(tmp_path):
+    store = FixtureStore(fixture_dir=str(tmp_path))
+    store.save("POST", "https://example.com/search", None, None, FakeResponse(b"a"), data={"keyword": "회계"})
+    store.save("POST", "https://example.com/search", None, None, FakeResponse(b"b"), data={"keyword": "세무"})
+
+    assert store.load("POST", "https://example.com/search", None, None, data={"keyword": "회계"}).content == b"a"
+    with pytest.raises(FixtureNotFound):
+        store.load("POST", "https://example.com/search", None, None, data={"keyword": "재무"})
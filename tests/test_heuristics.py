@@ -0,0 +1,33 @@
+import pytest
+
+from src.logic.heuristics import HEURISTIC_SOURCE, analyze_title
+
+
+def _role(title):
+    return analyze_title(title)["summary"].splitlines()[0]
+
+
+@pytest.mark.parametrize("title, role", [
+    ("인사 담당자 채용", "직무: 인사"),
+    ("ETL 개발자 (경력)", "직무: 데이터 엔지니어 (경력)"),
+    ("DBA 신입 채용", "직무: 데이터 엔지니어 (신입)"),
+    ("내부 감사팀 신입", "직무: 회계 (신입)"),
+    ("채용 담당자 인턴", "직무: 채용 (인턴)"),
+])
+def test_titles_are_classified(title, role):
+    assert _role(title) == role
+
+
+@pytest.mark.parametrize("title", [
+    "데이터 인사이트 매니저",       # 인사이트 ≠ 인사
+    "지원해주셔서 감사합니다",       # 감사합니다 ≠ 감사(audit)
+    "고객 Feedback 운영 매니저",    # feedback 안의 dba
+    "MetLife 영업 관리",            # metlife 안의 etl
+    "마케팅 매니저 채용",            # 제목 끝의 일반적인 "채용"
+])
+def test_substrings_do_not_pick_a_role(title):
+    assert _role(title) == "직무: 분류 불가"
+
+
+def test_heuristic_results_are_marked():
+    assert analyze_title("회계 담당자")["source"] == HEURISTIC_SOURCE
@@ -0,0 +1,32 @@
+import os
+
+from src.scraper.http_cache import ResponseCache
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.url = "https://example.com/list"
+        self.status_code = 200
+        self.headers = {"Content-Type": "text/html", "ETag": '"v1"'}
+        self.encoding = "utf-8"
+        self.content = content
+
+
+def test_put_then_get_roundtrip(tmp_path):
+    cache = ResponseCache(cache_dir=str(tmp_path), max_bytes=10 ** 6)
+    cache.put("key", FakeResponse(b"<html>body</html>"))
+
+    entry = cache.get("key")
+    assert entry is not None
+    assert entry.body == b"<html>body</html>"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_truncated_body_is_a_miss(tmp_path):
+    cache = ResponseCache(cache_dir=str(tmp_path), max_bytes=10 ** 6)
+    cache.put("key", FakeResponse(b"<html>body</html>"))
+    _, body_path = cache._paths("key")
+    with open(body_path, "wb") as f:
+        f.write(b"<html>bo")
+
+    assert cache.get("key") is None
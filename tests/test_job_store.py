@@ -0,0 +1,28 @@
+from datetime import date
+
+from src.logic.job_store import JobStore
+
+
+def _job(job_id, deadline_date, scraped_at="2026-10-01T00:00:00"):
+    return {"id": job_id, "title": job_id, "deadline_date": deadline_date, "scraped_at": scraped_at}
+
+
+def test_jobs_due_within_groups_by_days_left(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    store.upsert([
+        _job("expired", "2026-10-17"),
+        _job("today", "2026-10-18"),
+        _job("tomorrow-old", "2026-10-19", "2026-10-01T00:00:00"),
+        _job("tomorrow-new", "2026-10-19", "2026-10-02T00:00:00"),
+        _job("d3", "2026-10-21"),
+        _job("far", "2026-12-01"),
+        _job("rolling", None),
+    ])
+
+    buckets = store.jobs_due_within(date(2026, 10, 18), 7)
+
+    assert {days: [job["id"] for job in jobs] for days, jobs in buckets.items()} == {
+        0: ["today"],
+        1: ["tomorrow-new", "tomorrow-old"],
+        3: ["d3"],
+    }
@@ -0,0 +1,14 @@
+from src.scraper.linkareer import LinkareerScraper
+
+
+def test_utc_close_time_uses_korean_date():
+    # 2026-10-20 15:00 UTC = 2026-10-21 00:00 KST
+    assert LinkareerScraper._format_deadline({"recruitCloseAt": "2026-10-20T15:00:00.000Z"}) == "2026-10-21"
+    assert LinkareerScraper._format_deadline({"recruitCloseAt": "2026-10-20T14:59:59Z"}) == "2026-10-20"
+    assert LinkareerScraper._format_deadline({"recruitCloseAt": "2026-10-20T23:59:00+09:00"}) == "2026-10-20"
+
+
+def test_other_close_formats():
+    assert LinkareerScraper._format_deadline({"recruitCloseAt": 1792854000000}) == "2026-10-25"
+    assert LinkareerScraper._format_deadline({"recruitCloseAt": "2026-10-20"}) == "2026-10-20"
+    assert LinkareerScraper._format_deadline({"recruitCloseAt": None, "deadlineStatus": "상시"}) == "상시"
@@ -0,0 +1,68 @@
+from datetime import date, timedelta
+
+from src.config import Config
+from src.logic.job_store import JobStore
+from src.logic.search_index import build_search_index, tokenize
+from src.scraper.manager import ScraperManager
+from src.scraper.query_planner import QueryPlanner
+
+AI_RESULTS = [{"id": f"ai-{n}", "title": f"AI 엔지니어 {n}"} for n in range(8)]
+AGENT_RESULTS = [{"id": f"ai-{n}", "title": f"AI Agent 개발자 {n}"} for n in range(6)]
+
+
+class FakeScraper:
+    """키워드별 고정 결과를 돌려주는 스크래퍼 (요청한 키워드/known_ids 기록)"""
+
+    def __init__(self, results):
+        self.results = results
+        self.requests = []
+
+    def iter_search(self, keywords, max_workers=1, known_ids=None, observer=None):
+        self.requests.append((list(keywords), known_ids))
+        for keyword in keywords:
+            jobs = [dict(job, hidden_keyword=keyword) for job in self.results.get(keyword, [])]
+            if observer:
+                observer(keyword, jobs)
+            yield from jobs
+
+
+def _run(store, day, results, monkeypatch):
+    monkeypatch.setattr(Config, "KEYWORDS", {"Data": ["AI", "AI AGENT"]})
+    monkeypatch.setattr(Config, "QUERY_PLANNER_ENABLED", True)
+    manager = ScraperManager(QueryPlanner(store, today=day))
+    scraper = FakeScraper(results)
+    manager.scrapers = [scraper]
+    return list(manager.iter_all(known_ids={"ai-0"})), scraper
+
+
+def test_collapsed_keyword_keeps_attribution(tmp_path, monkeypatch):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    # "AI AGENT" 결과의 제목이 모두 "AI" 결과에 포함된 상황
+    ai_results = [{"id": job["id"], "title": job["title"]} for job in AGENT_RESULTS] + AI_RESULTS[6:]
+    results = {"AI": ai_results, "AI AGENT": AGENT_RESULTS}
+    start = date(2026, 10, 1)
+
+    # 전체 실행 두 번으로 포함 관계 학습 (전체 실행은 조기 중단 없이 수집)
+    for day in (start, start + timedelta(days=Config.PLANNER_VERIFY_DAYS)):
+        _, scraper = _run(store, day, results, monkeypatch)
+        assert scraper.requests == [(["AI", "AI AGENT"], None)]
+
+    jobs, scraper = _run(store, start + timedelta(days=Config.PLANNER_VERIFY_DAYS + 1), results, monkeypatch)
+
+    assert scraper.requests == [(["AI"], {"ai-0"})]
+    agent_jobs = [job for job in jobs if "AI AGENT" in job.get("query_keywords", [])]
+    assert len(agent_jobs) == len(AGENT_RESULTS)
+    assert all(job["query_keywords"] == ["AI", "AI AGENT"] for job in agent_jobs)
+    assert not any("query_keywords" in job for job in jobs if job not in agent_jobs)
+
+    index = build_search_index(jobs)
+    assert all(index["tokens"].get(token) for token in tokenize("AI AGENT"))
+
+
+def test_partial_runs_are_not_learned(tmp_path, monkeypatch):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    start = date(2026, 10, 1)
+    _run(store, start, {"AI": AI_RESULTS, "AI AGENT": AGENT_RESULTS}, monkeypatch)
+    _run(store, start + timedelta(days=1), {"AI": AI_RESULTS, "AI AGENT": AGENT_RESULTS}, monkeypatch)
+
+    assert list(store.query_history("Fake", start)) == [start.isoformat()]